@@ -4,14 +4,75 @@ Cleanup functions for UMTK - removes outdated trailers and placeholders
 
 import os
 import re
-import shutil
+from functools import lru_cache
 import requests
 from pathlib import Path, PureWindowsPath
 from datetime import datetime, timedelta, timezone
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
 from .utils import sanitize_filename, get_user_info, get_file_owner, convert_utc_to_local
-from .sonarr import get_sonarr_episodes
+from .sonarr import get_sonarr_episodes_bulk
+
+# "Title (YYYY)..." folder names -> title, year
+_TITLE_YEAR_RE = re.compile(r'^(.+?)\s*\((\d{4})\)')
+
+# Edition tags are always the last component of UMTK movie folder names
+_TRENDING_SUFFIX = " {edition-Trending}"
+_COMING_SOON_SUFFIX = " {edition-Coming Soon}"
+
+_YEAR_SUFFIX_RE = re.compile(r'\s*\(\d{4}\)\s*')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+
+@lru_cache(maxsize=1024)
+def _normalize_title(title):
+    """Strip "(YYYY)", drop punctuation, lowercase and collapse whitespace"""
+    normalized = _YEAR_SUFFIX_RE.sub('', title)
+    normalized = _PUNCTUATION_RE.sub('', normalized)
+    return ' '.join(normalized.lower().split())
+
+
+def _remove_and_measure(path, freed=None):
+    """Delete a directory tree and return the number of bytes freed.
+
+    Sizes are collected from the same scandir pass that unlinks the files,
+    so the tree is only walked once instead of rglob + rmtree. freed is a
+    one-item list the byte count accumulates in; pass the same list to a
+    retry so files removed before a failure are still counted.
+    """
+    if freed is None:
+        freed = [0]
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_and_measure(entry.path, freed)
+            else:
+                size = entry.stat(follow_symlinks=False).st_size
+                os.unlink(entry.path)
+                freed[0] += size
+    os.rmdir(path)
+    return freed[0]
+
+
+def _scan_season_00(season_00_path):
+    """Return (is_trending, trailer_files) for a Season 00 folder, or None if it is missing.
+
+    A single scandir pass replaces the separate exists(), .trending marker
+    and trailer/placeholder glob lookups.
+    """
+    is_trending = False
+    trailer_files = []
+    try:
+        with os.scandir(season_00_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == '.trending':
+                    is_trending = True
+                elif '.S00E00.Trailer.' in name or '.S00E00.Coming.Soon.' in name:
+                    trailer_files.append(season_00_path / name)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return is_trending, trailer_files
 
 
 def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
@@ -31,6 +92,7 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
         return
 
     instance_names = [inst['name'] for inst in sonarr_instances]
+    exclude_tags_by_instance = {inst['name']: frozenset(inst.get('exclude_tag_ids') or ()) for inst in sonarr_instances}
     umtk_root_tv = sonarr_instances[0].get('umtk_root_tv')
 
     if debug:
@@ -41,7 +103,8 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
     removed_count = 0
     checked_count = 0
 
-    current_upcoming_titles = set()
+    # Sonarr series ids are only unique within one instance
+    current_upcoming_ids = set()
     for inst in sonarr_instances:
         try:
             current_future_shows, current_aired_shows = find_upcoming_shows(
@@ -51,7 +114,11 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
         except requests.exceptions.RequestException:
             print(f"{RED}Error during TV cleanup - Sonarr connection failed for instance '{inst['name']}'. Skipping cleanup for this group.{RESET}")
             return
-        current_upcoming_titles.update(show['title'] for show in current_future_shows + current_aired_shows)
+        current_upcoming_ids.update(
+            (inst['name'], show['id'])
+            for show in current_future_shows + current_aired_shows
+            if show.get('id') is not None
+        )
     
     current_trending_shows = []
     if trending_monitored:
@@ -61,16 +128,10 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
     
     current_trending_titles = {show['title'] for show in current_trending_shows}
     
-    def normalize_title(title):
-        normalized = re.sub(r'\s*\(\d{4}\)\s*', '', title)
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = ' '.join(normalized.lower().split())
-        return normalized
-    
-    current_trending_normalized = {normalize_title(show['title']): show['title'] for show in current_trending_shows}
+    current_trending_normalized = {_normalize_title(show['title']): show['title'] for show in current_trending_shows}
     
     if debug:
-        print(f"{BLUE}[DEBUG] Current upcoming shows: {len(current_upcoming_titles)}{RESET}")
+        print(f"{BLUE}[DEBUG] Current upcoming shows: {len(current_upcoming_ids)}{RESET}")
         print(f"{BLUE}[DEBUG] Current trending shows: {len(current_trending_titles)}{RESET}")
         if current_trending_titles:
             print(f"{BLUE}[DEBUG] Trending titles: {current_trending_titles}{RESET}")
@@ -126,17 +187,22 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
         if debug:
             print(f"{BLUE}[DEBUG] Scanning {len(dirs_to_scan)} show directories from Sonarr{RESET}")
     
+    # Reference times are constant for the whole scan
+    now_local = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
+    cutoff_date = now_local + timedelta(days=future_days_upcoming_shows)
+    
+    folders_to_check = []
     for show_dir in dirs_to_scan:
         season_00_path = show_dir / "Season 00"
         
-        if not season_00_path.exists():
+        scan = _scan_season_00(season_00_path)
+        if scan is None:
             continue
-        
-        is_trending = (season_00_path / ".trending").exists()
+        is_trending, trailer_files = scan
         
         show_folder_name = show_dir.name
         
-        title_match = re.match(r'^(.+?)\s*\((\d{4})\)', show_folder_name)
+        title_match = _TITLE_YEAR_RE.match(show_folder_name)
         if title_match:
             show_title_from_folder = title_match.group(1).strip()
         else:
@@ -161,8 +227,26 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
         if debug:
             print(f"{BLUE}[DEBUG] Checking show folder: {show_folder_name} (trending: {is_trending}, in Sonarr: {series is not None}){RESET}")
         
-        trailer_files = list(season_00_path.glob("*.S00E00.Trailer.*")) + list(season_00_path.glob("*.S00E00.Coming.Soon.*"))
-        
+        if trailer_files:
+            folders_to_check.append((show_dir, season_00_path, is_trending, show_folder_name,
+                                     show_title_from_folder, series, owning_inst, trailer_files))
+    
+    # Regular (non-trending) folders whose show left the upcoming list need an
+    # episode lookup. Fetch them all up front with bounded concurrency so the
+    # removal loop below makes no HTTP calls.
+    episode_jobs = [
+        (owning_inst['url'], owning_inst['api_key'], series['id'])
+        for _, _, is_trending, _, _, series, owning_inst, _ in folders_to_check
+        if not is_trending and series and (owning_inst['name'], series['id']) not in current_upcoming_ids
+    ]
+    try:
+        episodes_by_job = get_sonarr_episodes_bulk(episode_jobs, season_number=1)
+    except requests.exceptions.RequestException:
+        print(f"{RED}Error fetching episodes during cleanup - Sonarr connection failed. Skipping cleanup for this group.{RESET}")
+        return
+    
+    for (show_dir, season_00_path, is_trending, show_folder_name,
+         show_title_from_folder, series, owning_inst, trailer_files) in folders_to_check:
         for trailer_file in trailer_files:
             checked_count += 1
             if debug:
@@ -185,10 +269,10 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
                     if debug:
                         print(f"{BLUE}[DEBUG] Exact match found: '{check_title}'{RESET}")
                 else:
-                    normalized_check = normalize_title(check_title)
+                    normalized_check = _normalize_title(check_title)
                     
                     for trending_show in current_trending_shows:
-                        normalized_trending = normalize_title(trending_show['title'])
+                        normalized_trending = _normalize_title(trending_show['title'])
                         
                         if normalized_check == normalized_trending:
                             found_in_trending = True
@@ -213,12 +297,8 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
                         print(f"{BLUE}[DEBUG] Folder name: {show_folder_name}{RESET}")
                         print(f"{BLUE}[DEBUG] Available folder mappings: {list(series_by_folder_name.keys())}{RESET}")
                 else:
-                    if series['title'] not in current_upcoming_titles:
-                        try:
-                            episodes = get_sonarr_episodes(owning_inst['url'], owning_inst['api_key'], series['id'])
-                        except requests.exceptions.RequestException:
-                            print(f"{RED}Error fetching episodes during cleanup - Sonarr connection failed for instance '{owning_inst['name']}'. Skipping remaining cleanup.{RESET}")
-                            return
+                    if (owning_inst['name'], series['id']) not in current_upcoming_ids:
+                        episodes = episodes_by_job[(owning_inst['url'], owning_inst['api_key'], series['id'])]
 
                         s01e01 = None
                         for ep in episodes:
@@ -226,7 +306,7 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
                                 s01e01 = ep
                                 break
 
-                        owning_exclude_tags = owning_inst.get('exclude_tag_ids')
+                        owning_exclude_tags = exclude_tags_by_instance[owning_inst['name']]
 
                         if s01e01 and s01e01.get('hasFile', False):
                             should_remove = True
@@ -237,14 +317,12 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
                         elif s01e01 and not s01e01.get('monitored', False):
                             should_remove = True
                             removal_reason = "S01E01 is no longer monitored"
-                        elif owning_exclude_tags and any(tag in series.get('tags', []) for tag in owning_exclude_tags):
+                        elif owning_exclude_tags and not owning_exclude_tags.isdisjoint(series.get('tags') or ()):
                             should_remove = True
                             removal_reason = "show has excluded tags"
                         else:
                             if s01e01 and s01e01.get('airDateUtc'):
                                 air_date = convert_utc_to_local(s01e01.get('airDateUtc'), utc_offset)
-                                cutoff_date = datetime.now(timezone.utc) + timedelta(hours=utc_offset) + timedelta(days=future_days_upcoming_shows)
-                                now_local = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
                                 
                                 if air_date > cutoff_date:
                                     should_remove = True
@@ -276,19 +354,17 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
                         continue
                     
                     try:
+                        freed = [0]
                         try:
+                            total_size = _remove_and_measure(show_dir, freed)
+                        except PermissionError:
+                            # Only loosen permissions when removal actually fails, then retry once
                             os.chmod(show_dir, 0o775)
                             if debug:
-                                print(f"{BLUE}[DEBUG] Set permissions 775 on {show_dir}{RESET}")
-                        except Exception as perm_err:
-                            if debug:
-                                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_err}{RESET}")
-                        
-                        total_size = sum(f.stat().st_size for f in show_dir.rglob('*') if f.is_file())
+                                print(f"{BLUE}[DEBUG] Set permissions 775 on {show_dir}, retrying removal{RESET}")
+                            total_size = _remove_and_measure(show_dir, freed)
                         size_mb = total_size / (1024 * 1024)
                         
-                        shutil.rmtree(show_dir)
-                        
                         removed_count += 1
                         content_type = "trending content" if is_trending else "content"
                         print(f"{GREEN}Removed show folder for {display_title} - {removal_reason} ({size_mb:.1f} MB freed){RESET}")
@@ -326,16 +402,14 @@ def cleanup_tv_content(sonarr_instances, tv_method, debug=False,
                         continue
                     
                     try:
+                        file_size_mb = trailer_file.stat().st_size / (1024 * 1024)
                         try:
+                            trailer_file.unlink()
+                        except PermissionError:
                             os.chmod(season_00_path, 0o775)
                             if debug:
-                                print(f"{BLUE}[DEBUG] Set permissions 775 on {season_00_path}{RESET}")
-                        except Exception as perm_err:
-                            if debug:
-                                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_err}{RESET}")
-                        
-                        file_size_mb = trailer_file.stat().st_size / (1024 * 1024)
-                        trailer_file.unlink()
+                                print(f"{BLUE}[DEBUG] Set permissions 775 on {season_00_path}, retrying removal{RESET}")
+                            trailer_file.unlink()
                         
                         marker_file = season_00_path / ".trending"
                         if marker_file.exists():
@@ -385,6 +459,7 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
         return
 
     instance_names = [inst['name'] for inst in radarr_instances]
+    exclude_tags_by_instance = {inst['name']: frozenset(inst.get('exclude_tag_ids') or ()) for inst in radarr_instances}
     umtk_root_movies = radarr_instances[0].get('umtk_root_movies')
 
     if debug:
@@ -404,16 +479,10 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
     current_trending_movies = trending_monitored + trending_request_needed
     current_trending_titles = {movie['title'] for movie in current_trending_movies}
     
-    def normalize_title(title):
-        normalized = re.sub(r'\s*\(\d{4}\)\s*', '', title)
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = ' '.join(normalized.lower().split())
-        return normalized
-    
-    current_trending_normalized = {normalize_title(movie['title']): movie['title'] for movie in current_trending_movies}
+    current_trending_normalized = {_normalize_title(movie['title']): movie['title'] for movie in current_trending_movies}
     
     current_trending_monitored_titles = {movie['title'] for movie in trending_monitored}
-    current_trending_monitored_normalized = {normalize_title(movie['title']): movie['title'] for movie in trending_monitored}
+    current_trending_monitored_normalized = {_normalize_title(movie['title']): movie['title'] for movie in trending_monitored}
     
     if debug:
         print(f"{BLUE}[DEBUG] Current upcoming movies: {len(current_upcoming_titles)}{RESET}")
@@ -427,34 +496,23 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
     radarr_movie_lookup_coming_soon = {}
     radarr_movie_lookup_trending = {}
 
+    # Both edition folders share the sanitized "Title (Year)" stem; the
+    # edition suffixes contain nothing sanitize_filename would change
+    shared_root = Path(umtk_root_movies) if umtk_root_movies else None
     for inst in radarr_instances:
         for movie in inst['all_movies']:
             movie_path = movie.get('path')
             if not movie_path:
                 continue
 
-            movie_title = movie.get('title', 'Unknown')
-            movie_year = movie.get('year', '')
+            stem = sanitize_filename(f"{movie.get('title', 'Unknown')} ({movie.get('year', '')})")
+            parent_dir = shared_root if shared_root is not None else Path(movie_path).parent
 
-            folder_name_coming = sanitize_filename(f"{movie_title} ({movie_year}) {{edition-Coming Soon}}")
-            if umtk_root_movies:
-                folder_path_coming = Path(umtk_root_movies) / folder_name_coming
-            else:
-                base_path = Path(movie_path)
-                parent_dir = base_path.parent
-                folder_path_coming = parent_dir / folder_name_coming
-            key_coming = str(folder_path_coming)
+            key_coming = str(parent_dir / f"{stem}{_COMING_SOON_SUFFIX}")
             if key_coming not in radarr_movie_lookup_coming_soon:
                 radarr_movie_lookup_coming_soon[key_coming] = (movie, inst)
 
-            folder_name_trending = sanitize_filename(f"{movie_title} ({movie_year}) {{edition-Trending}}")
-            if umtk_root_movies:
-                folder_path_trending = Path(umtk_root_movies) / folder_name_trending
-            else:
-                base_path = Path(movie_path)
-                parent_dir = base_path.parent
-                folder_path_trending = parent_dir / folder_name_trending
-            key_trending = str(folder_path_trending)
+            key_trending = str(parent_dir / f"{stem}{_TRENDING_SUFFIX}")
             if key_trending not in radarr_movie_lookup_trending:
                 radarr_movie_lookup_trending[key_trending] = (movie, inst)
 
@@ -486,8 +544,9 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
                 if not folder.is_dir():
                     continue
                 
-                is_trending = "{edition-Trending}" in folder.name
-                is_coming_soon = "{edition-Coming Soon}" in folder.name
+                folder_name = folder.name
+                is_trending = folder_name.endswith(_TRENDING_SUFFIX)
+                is_coming_soon = not is_trending and folder_name.endswith(_COMING_SOON_SUFFIX)
                 
                 if not (is_trending or is_coming_soon):
                     continue
@@ -503,26 +562,28 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
                 reason = ""
                 movie_title = "Unknown Movie"
                 
-                try:
-                    if is_trending:
-                        movie_title = folder.name.replace(" {edition-Trending}", "")
-                    else:
-                        movie_title = folder.name.replace(" {edition-Coming Soon}", "")
-                    
-                    title_match = re.match(r'^(.+?)\s*\((\d{4})\)', movie_title)
-                    if title_match:
-                        title_without_year = title_match.group(1).strip()
-                        year = title_match.group(2)
-                    else:
-                        title_without_year = movie_title
-                        year = None
-                    
-                    if debug:
-                        print(f"{BLUE}[DEBUG] Extracted title: '{title_without_year}', year: {year}{RESET}")
-                except Exception as e:
-                    if debug:
-                        print(f"{ORANGE}[DEBUG] Error extracting title from folder name: {e}{RESET}")
-                    title_without_year = folder.name
+                if not is_trending:
+                    # Coming Soon folders are resolved purely by path lookup; a folder
+                    # with no owning Radarr movie is stale and needs no title matching
+                    movie_title = folder_name[:-len(_COMING_SOON_SUFFIX)]
+                else:
+                    try:
+                        movie_title = folder_name[:-len(_TRENDING_SUFFIX)]
+
+                        title_match = _TITLE_YEAR_RE.match(movie_title)
+                        if title_match:
+                            title_without_year = title_match.group(1).strip()
+                            year = title_match.group(2)
+                        else:
+                            title_without_year = movie_title
+                            year = None
+
+                        if debug:
+                            print(f"{BLUE}[DEBUG] Extracted title: '{title_without_year}', year: {year}{RESET}")
+                    except Exception as e:
+                        if debug:
+                            print(f"{ORANGE}[DEBUG] Error extracting title from folder name: {e}{RESET}")
+                        title_without_year = folder.name
                 
                 if is_trending:
                     lookup_dict = radarr_movie_lookup_trending
@@ -538,8 +599,8 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
                                 print(f"{BLUE}[DEBUG] Exact match found: '{title_without_year}' == '{trending_title}'{RESET}")
                             break
                         
-                        normalized_folder = normalize_title(title_without_year)
-                        normalized_trending = normalize_title(trending_title)
+                        normalized_folder = _normalize_title(title_without_year)
+                        normalized_trending = _normalize_title(trending_title)
                         
                         if normalized_folder == normalized_trending:
                             found_in_trending = True
@@ -573,16 +634,16 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
                         if movie_title in current_trending_monitored_titles:
                             in_trending_monitored = True
                         else:
-                            normalized_movie = normalize_title(movie_title)
+                            normalized_movie = _normalize_title(movie_title)
                             for trending_monitored_movie in trending_monitored:
-                                if normalized_movie == normalize_title(trending_monitored_movie['title']):
+                                if normalized_movie == _normalize_title(trending_monitored_movie['title']):
                                     in_trending_monitored = True
                                     break
 
                         if debug:
                             print(f"{BLUE}[DEBUG] Movie '{movie_title}' (instance: {owning_inst['name']}) - in_upcoming: {in_upcoming}, in_trending_monitored: {in_trending_monitored}{RESET}")
 
-                        owning_exclude_tags = owning_inst.get('exclude_tag_ids')
+                        owning_exclude_tags = exclude_tags_by_instance[owning_inst['name']]
 
                         if not in_upcoming and not in_trending_monitored:
                             if movie.get('hasFile', False):
@@ -591,7 +652,7 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
                             elif not movie.get('monitored', False):
                                 should_remove = True
                                 reason = "movie is no longer monitored"
-                            elif owning_exclude_tags and any(tag in movie.get('tags', []) for tag in owning_exclude_tags):
+                            elif owning_exclude_tags and not owning_exclude_tags.isdisjoint(movie.get('tags') or ()):
                                 should_remove = True
                                 reason = "movie has excluded tags"
                             else:
@@ -619,19 +680,17 @@ def cleanup_movie_content(radarr_instances, future_by_instance,
                         continue
                     
                     try:
+                        freed = [0]
                         try:
+                            total_size = _remove_and_measure(folder, freed)
+                        except PermissionError:
+                            # Only loosen permissions when removal actually fails, then retry once
                             os.chmod(folder, 0o775)
                             os.chmod(parent_dir, 0o775)
                             if debug:
-                                print(f"{BLUE}[DEBUG] Set permissions 775 on {folder} and {parent_dir}{RESET}")
-                        except Exception as perm_err:
-                            if debug:
-                                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_err}{RESET}")
-                        
-                        total_size = sum(f.stat().st_size for f in folder.rglob('*') if f.is_file())
+                                print(f"{BLUE}[DEBUG] Set permissions 775 on {folder} and {parent_dir}, retrying removal{RESET}")
+                            total_size = _remove_and_measure(folder, freed)
                         size_mb = total_size / (1024 * 1024)
-                        
-                        shutil.rmtree(folder)
                         removed_count += 1
                         content_type = "trending content" if is_trending else "content"
                         print(f"{GREEN}Removed {content_type} for {movie_title} - {reason} ({size_mb:.1f} MB freed){RESET}")
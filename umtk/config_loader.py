@@ -8,12 +8,47 @@ import shutil
 import yaml
 from pathlib import Path
 from copy import deepcopy
+from collections.abc import Mapping
 
 from .constants import (
     GREEN, ORANGE, RED, RESET,
     DEFAULT_LOCALIZATION
 )
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# The environment does not change during a run, so resolve paths once
+_IN_DOCKER = os.environ.get('DOCKER') == 'true'
+_APP_ROOT = Path('/app') if _IN_DOCKER else Path(__file__).parent.parent
+_CONFIG_PATH = _APP_ROOT / 'config' / 'config.yml'
+_LOCALIZATION_PATH = _APP_ROOT / 'config' / 'localization.yml'
+_KOMETA_FOLDER = _APP_ROOT / 'kometa'
+_VIDEO_FOLDER = Path('/video') if _IN_DOCKER else _APP_ROOT / 'video'
+_COOKIES_FILE = (Path('/cookies') if _IN_DOCKER else _APP_ROOT / 'cookies') / 'cookies.txt'
+
+# Parsed YAML keyed by path -> (mtime, size, data)
+_YAML_CACHE = {}
+
+
+def _load_yaml_cached(file_path):
+    """Parse a YAML file, reusing the previous result while its mtime and size are unchanged.
+
+    Callers get a deep copy so they can mutate it freely. Raises the same
+    FileNotFoundError / yaml.YAMLError as parsing the file directly.
+    """
+    key = str(file_path)
+    st = os.stat(key)
+    hit = _YAML_CACHE.get(key)
+    if hit and hit[0] == st.st_mtime and hit[1] == st.st_size:
+        return deepcopy(hit[2])
+    # Hand the loader a binary stream: it reads incrementally and decodes
+    # UTF-8 itself, skipping the text-mode decoding layer
+    with open(key, 'rb') as file:
+        data = yaml.load(file, Loader=_YAML_LOADER)
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, data)
+    return deepcopy(data)
+
 
 def normalize_instances(config):
     """Convert legacy flat radarr_*/sonarr_* keys into radarr_instances/sonarr_instances lists.
@@ -75,16 +110,11 @@ def normalize_instances(config):
 def load_config(file_path=None):
     """Load configuration from YAML file"""
     if file_path is None:
-        # Check if running in Docker
-        if os.environ.get('DOCKER') == 'true':
-            file_path = Path('/app/config/config.yml')
-        else:
-            file_path = Path(__file__).parent.parent / 'config' / 'config.yml'
+        file_path = _CONFIG_PATH
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
-            return normalize_instances(config)
+        config = _load_yaml_cached(file_path)
+        return normalize_instances(config)
     except FileNotFoundError:
         # Try to auto-copy from sample file
         sample_path = Path(str(file_path)).parent / 'config.sample.yml'
@@ -93,8 +123,7 @@ def load_config(file_path=None):
             shutil.copy2(str(sample_path), str(file_path))
             print(f"{GREEN}Created '{file_path}' from sample. Please edit it with your settings.{RESET}")
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return normalize_instances(yaml.safe_load(f))
+                return normalize_instances(_load_yaml_cached(file_path))
             except Exception as e:
                 print(f"Error reading copied config file: {e}")
                 sys.exit(1)
@@ -109,27 +138,30 @@ def load_config(file_path=None):
 def load_localization(file_path=None):
     """Load localization settings with English defaults"""
     if file_path is None:
-        # Check if running in Docker
-        if os.environ.get('DOCKER') == 'true':
-            file_path = Path('/app/config/localization.yml')
-        else:
-            file_path = Path(__file__).parent.parent / 'config' / 'localization.yml'
-    
-    # Start with a deep copy of defaults
-    localization = deepcopy(DEFAULT_LOCALIZATION)
+        file_path = _LOCALIZATION_PATH
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            user_localization = yaml.safe_load(file)
-            
-            if user_localization:
-                # Deep merge user localization with defaults
-                for key in localization:
-                    if key in user_localization:
-                        if isinstance(localization[key], dict):
-                            localization[key].update(user_localization[key])
-                        else:
-                            localization[key] = user_localization[key]
+        user_localization = _load_yaml_cached(file_path)
+        
+        if not user_localization:
+            return DEFAULT_LOCALIZATION
+        
+        # Materialize a mutable copy only when there are overrides to merge;
+        # the nested default maps are flat, so a shallow dict() of each is enough
+        localization = {
+            key: (dict(value) if isinstance(value, Mapping) else value)
+            for key, value in DEFAULT_LOCALIZATION.items()
+        }
+        
+        # Deep merge user localization with defaults
+        for key in localization:
+            if key in user_localization:
+                if isinstance(localization[key], dict):
+                    localization[key].update(user_localization[key])
+                else:
+                    localization[key] = user_localization[key]
+        
+        return localization
                             
     except FileNotFoundError:
         # Silently use defaults if file doesn't exist
@@ -139,35 +171,22 @@ def load_localization(file_path=None):
     except Exception as e:
         print(f"{ORANGE}Warning: Could not load localization file, using English defaults: {e}{RESET}")
     
-    return localization
+    return DEFAULT_LOCALIZATION
 
 
 def get_cookies_path():
     """Get the path to cookies.txt if it exists"""
-    if os.environ.get('DOCKER') == 'true':
-        cookies_folder = Path('/cookies')
-    else:
-        cookies_folder = Path(__file__).parent.parent / 'cookies'
-    
-    cookies_file = cookies_folder / 'cookies.txt'
-    
-    if cookies_file.exists() and cookies_file.is_file():
-        return str(cookies_file)
+    if _COOKIES_FILE.is_file():
+        return str(_COOKIES_FILE)
     
     return None
 
 
 def get_kometa_folder():
     """Get the path to the kometa output folder"""
-    if os.environ.get('DOCKER') == 'true':
-        return Path('/app') / "kometa"
-    else:
-        return Path(__file__).parent.parent / "kometa"
+    return _KOMETA_FOLDER
 
 
 def get_video_folder():
     """Get the path to the video folder"""
-    if os.environ.get('DOCKER') == 'true':
-        return Path('/video')
-    else:
-        return Path(__file__).parent.parent / 'video'
\ No newline at end of file
+    return _VIDEO_FOLDER
\ No newline at end of file
@@ -2,6 +2,8 @@
 Constants and configuration values for UMTK
 """
 
+from types import MappingProxyType
+
 VERSION = "2026.06.08"
 
 # ANSI color codes
@@ -12,52 +14,29 @@ RED = '\033[31m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
-# Default localization (English)
-DEFAULT_LOCALIZATION = {
-    'simplify_next_week': {
+# Default localization (English), read-only so it can be shared without copying
+DEFAULT_LOCALIZATION = MappingProxyType({
+    'simplify_next_week': MappingProxyType({
         'use_abbreviated': False,
         'today': 'today',
         'tomorrow': 'tomorrow'
-    },
-    'months_full': {
+    }),
+    'months_full': MappingProxyType({
         1: 'January', 2: 'February', 3: 'March', 4: 'April',
         5: 'May', 6: 'June', 7: 'July', 8: 'August',
         9: 'September', 10: 'October', 11: 'November', 12: 'December'
-    },
-    'months_abbr': {
+    }),
+    'months_abbr': MappingProxyType({
         1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr',
         5: 'May', 6: 'Jun', 7: 'Jul', 8: 'Aug',
         9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-    },
-    'weekdays_full': {
+    }),
+    'weekdays_full': MappingProxyType({
         0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday',
         4: 'Friday', 5: 'Saturday', 6: 'Sunday'
-    },
-    'weekdays_abbr': {
+    }),
+    'weekdays_abbr': MappingProxyType({
         0: 'Mon', 1: 'Tue', 2: 'Wed', 3: 'Thu',
         4: 'Fri', 5: 'Sat', 6: 'Sun'
-    }
-}
-
-# English defaults for translation replacement
-ENGLISH_MONTHS_FULL = {
-    1: 'January', 2: 'February', 3: 'March', 4: 'April',
-    5: 'May', 6: 'June', 7: 'July', 8: 'August',
-    9: 'September', 10: 'October', 11: 'November', 12: 'December'
-}
-
-ENGLISH_MONTHS_ABBR = {
-    1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr',
-    5: 'May', 6: 'Jun', 7: 'Jul', 8: 'Aug',
-    9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-}
-
-ENGLISH_WEEKDAYS_FULL = {
-    0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday',
-    4: 'Friday', 5: 'Saturday', 6: 'Sunday'
-}
-
-ENGLISH_WEEKDAYS_ABBR = {
-    0: 'Mon', 1: 'Tue', 2: 'Wed', 3: 'Thu',
-    4: 'Fri', 5: 'Sat', 6: 'Sun'
-}
\ No newline at end of file
+    })
+})
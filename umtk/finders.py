@@ -2,12 +2,12 @@
 Content finder functions for UMTK - identifies shows and movies to process
 """
 
-import requests
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
 from .utils import convert_utc_to_local
-from .sonarr import get_sonarr_episodes
+from .sonarr import get_sonarr_episodes_bulk, iter_sonarr_episodes
 
 
 def find_upcoming_shows(all_series, sonarr_url, api_key, future_days_upcoming_shows, 
@@ -16,39 +16,51 @@ def find_upcoming_shows(all_series, sonarr_url, api_key, future_days_upcoming_sh
     future_shows = []
     aired_shows = []
     
-    cutoff_date = datetime.now(timezone.utc) + timedelta(days=future_days_upcoming_shows)
-    now_local = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
+    exclude_tags = frozenset(exclude_tags) if exclude_tags else None
+    
+    now_utc = datetime.now(timezone.utc)
+    cutoff_date = now_utc + timedelta(days=future_days_upcoming_shows)
+    now_local = now_utc + timedelta(hours=utc_offset)
     
     if debug:
         print(f"{BLUE}[DEBUG] Cutoff date: {cutoff_date}, Now local: {now_local}{RESET}")
         print(f"{BLUE}[DEBUG] Future only TV: {future_only_tv}{RESET}")
         print(f"{BLUE}[DEBUG] Found {len(all_series)} total series in Sonarr{RESET}")
    
+    # Filter first so only eligible series cost an /episode request
+    candidates = []
     for series in all_series:
+        title = series['title']
+        monitored = series.get('monitored', True)
         if debug:
-            print(f"{BLUE}[DEBUG] Processing show: {series['title']} (status: {series.get('status')}, monitored: {series.get('monitored', True)}){RESET}")
+            print(f"{BLUE}[DEBUG] Processing show: {title} (status: {series.get('status')}, monitored: {monitored}){RESET}")
         
         # Always skip unmonitored shows
-        if not series.get('monitored', True):
+        if not monitored:
             if debug:
-                print(f"{ORANGE}[DEBUG] Skipping unmonitored show: {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] Skipping unmonitored show: {title}{RESET}")
             continue
         
         # Check for excluded tags
-        if exclude_tags:
-            series_tags = series.get('tags', [])
-            if any(tag in series_tags for tag in exclude_tags):
-                if debug:
-                    print(f"{ORANGE}[DEBUG] Skipping show with excluded tags: {series['title']}{RESET}")
-                continue
+        if exclude_tags and not exclude_tags.isdisjoint(series.get('tags') or ()):
+            if debug:
+                print(f"{ORANGE}[DEBUG] Skipping show with excluded tags: {title}{RESET}")
+            continue
         
-        try:
-            episodes = get_sonarr_episodes(sonarr_url, api_key, series['id'])
-        except requests.exceptions.RequestException:
-            raise
+        candidates.append(series)
+    
+    # Only S01E01 matters here, so skip downloading the later seasons.
+    # Episodes stream in order while the next requests are still in flight.
+    episode_lists = iter_sonarr_episodes(
+        ((sonarr_url, api_key, series['id']) for series in candidates),
+        season_number=1
+    )
+    
+    for series, episodes in zip(candidates, episode_lists):
+        title = series['title']
         
         if debug:
-            print(f"{BLUE}[DEBUG] Found {len(episodes)} episodes for {series['title']}{RESET}")
+            print(f"{BLUE}[DEBUG] Found {len(episodes)} season 1 episodes for {title}{RESET}")
         
         # Find S01E01 specifically
         first_episode = None
@@ -60,31 +72,31 @@ def find_upcoming_shows(all_series, sonarr_url, api_key, future_days_upcoming_sh
         
         if not first_episode:
             if debug:
-                print(f"{ORANGE}[DEBUG] No Season 1 Episode 1 found for {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] No Season 1 Episode 1 found for {title}{RESET}")
             continue
         
         # Skip if S01E01 is not monitored
         if not first_episode.get('monitored', False):
             if debug:
-                print(f"{ORANGE}[DEBUG] S01E01 not monitored for {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] S01E01 not monitored for {title}{RESET}")
             continue
         
         # Skip if S01E01 is already downloaded
         if first_episode.get('hasFile', False):
             if debug:
-                print(f"{ORANGE}[DEBUG] S01E01 already downloaded for {series['title']} - skipping{RESET}")
+                print(f"{ORANGE}[DEBUG] S01E01 already downloaded for {title} - skipping{RESET}")
             continue
         
         air_date_str = first_episode.get('airDateUtc')
         if not air_date_str:
             if debug:
-                print(f"{ORANGE}[DEBUG] No air date found for {series['title']} S01E01{RESET}")
+                print(f"{ORANGE}[DEBUG] No air date found for {title} S01E01{RESET}")
             continue
         
         air_date = convert_utc_to_local(air_date_str, utc_offset)
         
         if debug:
-            print(f"{BLUE}[DEBUG] {series['title']} air date: {air_date}, within range: {air_date <= cutoff_date}{RESET}")
+            print(f"{BLUE}[DEBUG] {title} air date: {air_date}, within range: {air_date <= cutoff_date}{RESET}")
         
         # Check if air date is within our range
         if air_date <= cutoff_date:
@@ -92,7 +104,8 @@ def find_upcoming_shows(all_series, sonarr_url, api_key, future_days_upcoming_sh
             air_date_str_yyyy_mm_dd = air_date.date().isoformat()
             
             show_dict = {
-                'title': series['title'],
+                'id': series.get('id'),
+                'title': title,
                 'tvdbId': tvdb_id,
                 'path': series.get('path', ''),
                 'imdbId': series.get('imdbId', ''),
@@ -104,21 +117,24 @@ def find_upcoming_shows(all_series, sonarr_url, api_key, future_days_upcoming_sh
             if air_date >= now_local:
                 future_shows.append(show_dict)
                 if debug:
-                    print(f"{GREEN}[DEBUG] Added to future shows: {series['title']}{RESET}")
+                    print(f"{GREEN}[DEBUG] Added to future shows: {title}{RESET}")
             elif not future_only_tv:  # Only add aired shows if future_only_tv is false
                 aired_shows.append(show_dict)
                 if debug:
-                    print(f"{GREEN}[DEBUG] Added to aired shows: {series['title']}{RESET}")
+                    print(f"{GREEN}[DEBUG] Added to aired shows: {title}{RESET}")
             elif debug:
-                print(f"{ORANGE}[DEBUG] Skipping aired show due to future_only_tv=True: {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] Skipping aired show due to future_only_tv=True: {title}{RESET}")
     
     return future_shows, aired_shows
 
 
-def find_new_shows(all_series, sonarr_url, api_key, recent_days_new_show, utc_offset=0, debug=False):
+def find_new_shows(all_series, sonarr_url, api_key, recent_days_new_show, utc_offset=0, debug=False,
+                   exclude_tags=None):
     """Find shows where S01E01 has been downloaded and aired within specified past days"""
     new_shows = []
     
+    exclude_tags = frozenset(exclude_tags) if exclude_tags else None
+    
     now_local = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
     cutoff_date = now_local - timedelta(days=recent_days_new_show)
     
@@ -126,20 +142,36 @@ def find_new_shows(all_series, sonarr_url, api_key, recent_days_new_show, utc_of
         print(f"{BLUE}[DEBUG] Looking for shows with S01E01 aired between {cutoff_date} and {now_local}{RESET}")
         print(f"{BLUE}[DEBUG] Found {len(all_series)} total series in Sonarr{RESET}")
     
+    candidates = []
     for series in all_series:
+        title = series['title']
+        monitored = series.get('monitored', True)
         if debug:
-            print(f"{BLUE}[DEBUG] Checking series: {series['title']} (monitored: {series.get('monitored', True)}){RESET}")
+            print(f"{BLUE}[DEBUG] Checking series: {title} (monitored: {monitored}){RESET}")
         
         # Always skip unmonitored shows
-        if not series.get('monitored', True):
+        if not monitored:
             if debug:
-                print(f"{ORANGE}[DEBUG] Skipping unmonitored show: {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] Skipping unmonitored show: {title}{RESET}")
             continue
         
-        try:
-            episodes = get_sonarr_episodes(sonarr_url, api_key, series['id'])
-        except requests.exceptions.RequestException:
-            raise
+        # Check for excluded tags
+        if exclude_tags and not exclude_tags.isdisjoint(series.get('tags') or ()):
+            if debug:
+                print(f"{ORANGE}[DEBUG] Skipping show with excluded tags: {title}{RESET}")
+            continue
+        
+        candidates.append(series)
+    
+    # Only S01E01 matters here, so skip downloading the later seasons.
+    # Episodes stream in order while the next requests are still in flight.
+    episode_lists = iter_sonarr_episodes(
+        ((sonarr_url, api_key, series['id']) for series in candidates),
+        season_number=1
+    )
+    
+    for series, episodes in zip(candidates, episode_lists):
+        title = series['title']
         
         s01e01 = None
         for ep in episodes:
@@ -149,31 +181,31 @@ def find_new_shows(all_series, sonarr_url, api_key, recent_days_new_show, utc_of
         
         if not s01e01:
             if debug:
-                print(f"{ORANGE}[DEBUG] No S01E01 found for {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] No S01E01 found for {title}{RESET}")
             continue
         
         if not s01e01.get('hasFile', False):
             if debug:
-                print(f"{ORANGE}[DEBUG] S01E01 not downloaded for {series['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] S01E01 not downloaded for {title}{RESET}")
             continue
         
         air_date_str = s01e01.get('airDateUtc')
         if not air_date_str:
             if debug:
-                print(f"{ORANGE}[DEBUG] No air date for {series['title']} S01E01{RESET}")
+                print(f"{ORANGE}[DEBUG] No air date for {title} S01E01{RESET}")
             continue
         
         air_date = convert_utc_to_local(air_date_str, utc_offset)
         
         if debug:
-            print(f"{BLUE}[DEBUG] {series['title']} S01E01 aired: {air_date}, within range: {cutoff_date <= air_date <= now_local}{RESET}")
+            print(f"{BLUE}[DEBUG] {title} S01E01 aired: {air_date}, within range: {cutoff_date <= air_date <= now_local}{RESET}")
         
         if cutoff_date <= air_date <= now_local:
             tvdb_id = series.get('tvdbId')
             air_date_str_yyyy_mm_dd = air_date.date().isoformat()
             
             show_dict = {
-                'title': series['title'],
+                'title': title,
                 'tvdbId': tvdb_id,
                 'path': series.get('path', ''),
                 'imdbId': series.get('imdbId', ''),
@@ -184,7 +216,7 @@ def find_new_shows(all_series, sonarr_url, api_key, recent_days_new_show, utc_of
             new_shows.append(show_dict)
             
             if debug:
-                print(f"{GREEN}[DEBUG] Added to new shows: {series['title']}{RESET}")
+                print(f"{GREEN}[DEBUG] Added to new shows: {title}{RESET}")
     
     return new_shows
 
@@ -196,8 +228,11 @@ def find_upcoming_movies(all_movies, radarr_url, api_key, future_days_upcoming_m
     future_movies = []
     released_movies = []
     
-    cutoff_date = datetime.now(timezone.utc) + timedelta(days=future_days_upcoming_movies)
-    now_local = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
+    exclude_tags = frozenset(exclude_tags) if exclude_tags else None
+    
+    now_utc = datetime.now(timezone.utc)
+    cutoff_date = now_utc + timedelta(days=future_days_upcoming_movies)
+    now_local = now_utc + timedelta(hours=utc_offset)
     
     # Calculate past cutoff date if past_days_upcoming_movies is set
     past_cutoff_date = None
@@ -213,87 +248,115 @@ def find_upcoming_movies(all_movies, radarr_url, api_key, future_days_upcoming_m
         print(f"{BLUE}[DEBUG] Found {len(all_movies)} total movies in Radarr{RESET}")
     
     for movie in all_movies:
+        title = movie['title']
         if not movie.get('monitored', False):
             if debug:
-                print(f"{ORANGE}[DEBUG] Skipping unmonitored movie: {movie['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] Skipping unmonitored movie: {title}{RESET}")
             continue
         
         if movie.get('hasFile', False):
             if debug:
-                print(f"{ORANGE}[DEBUG] Skipping downloaded movie: {movie['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] Skipping downloaded movie: {title}{RESET}")
             continue
         
         # Check for excluded tags
-        if exclude_tags:
-            movie_tags = movie.get('tags', [])
-            if any(tag in movie_tags for tag in exclude_tags):
-                if debug:
-                    print(f"{ORANGE}[DEBUG] Skipping movie with excluded tags: {movie['title']}{RESET}")
-                continue
+        if exclude_tags and not exclude_tags.isdisjoint(movie.get('tags') or ()):
+            if debug:
+                print(f"{ORANGE}[DEBUG] Skipping movie with excluded tags: {title}{RESET}")
+            continue
         
         release_date_str = None
         release_type = None
         
+        digital_release = movie.get('digitalRelease')
+        physical_release = movie.get('physicalRelease')
+        
         if include_inCinemas:
             dates_to_check = [
-                (movie.get('digitalRelease'), 'Digital'),
-                (movie.get('physicalRelease'), 'Physical'),
+                (digital_release, 'Digital'),
+                (physical_release, 'Physical'),
                 (movie.get('inCinemas'), 'Cinema')
             ]
             
             valid_dates = [(date_str, rel_type) for date_str, rel_type in dates_to_check if date_str]
             
             if valid_dates:
-                valid_dates.sort(key=lambda x: x[0])
-                release_date_str, release_type = valid_dates[0]
+                # Earliest date wins; ties keep the Digital > Physical > Cinema order
+                release_date_str, release_type = min(valid_dates, key=itemgetter(0))
         else:
-            if movie.get('digitalRelease'):
-                release_date_str = movie['digitalRelease']
+            if digital_release:
+                release_date_str = digital_release
                 release_type = 'Digital'
-            elif movie.get('physicalRelease'):
-                release_date_str = movie['physicalRelease']
+            elif physical_release:
+                release_date_str = physical_release
                 release_type = 'Physical'
         
         if not release_date_str:
             if debug:
-                print(f"{ORANGE}[DEBUG] No suitable release date found for {movie['title']}{RESET}")
+                print(f"{ORANGE}[DEBUG] No suitable release date found for {title}{RESET}")
             continue
         
         release_date = convert_utc_to_local(release_date_str, utc_offset)
-        release_date_str_yyyy_mm_dd = release_date.date().isoformat()
         
         if debug:
-            print(f"{BLUE}[DEBUG] {movie['title']} release date: {release_date} ({release_type}){RESET}")
+            print(f"{BLUE}[DEBUG] {title} release date: {release_date} ({release_type}){RESET}")
         
         # Check if release date is too far in the past
         if past_cutoff_date and release_date < past_cutoff_date:
             if debug:
-                print(f"{ORANGE}[DEBUG] Skipping {movie['title']} - release date {release_date} is before past cutoff {past_cutoff_date}{RESET}")
+                print(f"{ORANGE}[DEBUG] Skipping {title} - release date {release_date} is before past cutoff {past_cutoff_date}{RESET}")
+            continue
+        
+        if release_date >= now_local and release_date <= cutoff_date:
+            target = future_movies
+            if debug:
+                print(f"{GREEN}[DEBUG] Added to future movies: {title}{RESET}")
+        elif release_date < now_local and not future_only:
+            target = released_movies
+            if debug:
+                print(f"{GREEN}[DEBUG] Added to released movies: {title}{RESET}")
+        else:
             continue
         
-        movie_dict = {
-            'title': movie['title'],
+        # Only movies that made it into a list pay for the dict/date formatting
+        target.append({
+            'title': title,
             'tmdbId': movie.get('tmdbId'),
             'imdbId': movie.get('imdbId'),
             'path': movie.get('path', ''),
             'folderName': movie.get('folderName', ''),
             'year': movie.get('year', None),
-            'releaseDate': release_date_str_yyyy_mm_dd,
+            'releaseDate': release_date.date().isoformat(),
             'releaseType': release_type
-        }
-        
-        if release_date >= now_local and release_date <= cutoff_date:
-            future_movies.append(movie_dict)
-            if debug:
-                print(f"{GREEN}[DEBUG] Added to future movies: {movie['title']}{RESET}")
-        elif release_date < now_local and not future_only:
-            released_movies.append(movie_dict)
-            if debug:
-                print(f"{GREEN}[DEBUG] Added to released movies: {movie['title']}{RESET}")
+        })
     
     return future_movies, released_movies
 
 
+def _maybe_int(value):
+    """Return value as an int, or None if it is empty or not numeric"""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _trending_show_dict(series, rank):
+    """Build the trending show entry for a series found in Sonarr"""
+    return {
+        'title': series['title'],
+        'tvdbId': series.get('tvdbId'),
+        'tmdbId': series.get('tmdbId'),
+        'path': series.get('path', ''),
+        'imdbId': series.get('imdbId', ''),
+        'year': series.get('year', None),
+        'airDate': None,
+        'rank': rank
+    }
+
+
 def process_trending_tv(mdblist_items, sonarr_instances_data, debug=False):
     """
     Process trending TV shows from MDBList against ALL Sonarr instances combined.
@@ -315,21 +378,17 @@ def process_trending_tv(mdblist_items, sonarr_instances_data, debug=False):
     # Per-instance lookup tables
     per_instance_lookups = []
     for inst in sonarr_instances_data:
-        by_tvdb, by_imdb, by_tmdb = {}, {}, {}
-        for series in inst.get('all_series', []):
-            if series.get('tvdbId'):
-                by_tvdb[str(series['tvdbId'])] = series
-            if series.get('imdbId'):
-                by_imdb[series['imdbId']] = series
-            if series.get('tmdbId'):
-                by_tmdb[str(series['tmdbId'])] = series
+        all_series = inst.get('all_series', [])
         per_instance_lookups.append({
             'instance': inst,
-            'by_tvdb': by_tvdb,
-            'by_imdb': by_imdb,
-            'by_tmdb': by_tmdb,
+            'by_tvdb': {str(s['tvdbId']): s for s in all_series if s.get('tvdbId')},
+            'by_imdb': {s['imdbId']: s for s in all_series if s.get('imdbId')},
+            'by_tmdb': {str(s['tmdbId']): s for s in all_series if s.get('tmdbId')},
         })
 
+    # Resolve every trending item to its matching series first so all
+    # /episode requests can be issued together
+    resolved = []
     for item in mdblist_items:
         tvdb_id = str(item.get('tvdb_id', '')) if item.get('tvdb_id') else None
         tmdb_id = str(item.get('tmdb_id', '')) if item.get('tmdb_id') else None
@@ -354,13 +413,22 @@ def process_trending_tv(mdblist_items, sonarr_instances_data, debug=False):
             if series:
                 matches.append((lookup, series))
 
+        resolved.append((tvdb_id, tmdb_id, imdb_id, title, year, rank, matches))
+
+    episodes_by_job = get_sonarr_episodes_bulk(
+        (lookup['instance']['url'], lookup['instance']['api_key'], series['id'])
+        for *_, matches in resolved
+        for lookup, series in matches
+    )
+
+    for tvdb_id, tmdb_id, imdb_id, title, year, rank, matches in resolved:
         if not matches:
             if debug:
                 print(f"{BLUE}[DEBUG] Not found in any Sonarr instance - adding to not_found_or_unmonitored{RESET}")
             not_found_or_unmonitored.append({
                 'title': title,
-                'tvdbId': int(tvdb_id) if tvdb_id and tvdb_id.isdigit() else None,
-                'tmdbId': int(tmdb_id) if tmdb_id and tmdb_id.isdigit() else None,
+                'tvdbId': _maybe_int(tvdb_id),
+                'tmdbId': _maybe_int(tmdb_id),
                 'path': None,
                 'imdbId': imdb_id,
                 'year': year,
@@ -376,21 +444,26 @@ def process_trending_tv(mdblist_items, sonarr_instances_data, debug=False):
 
         for lookup, series in matches:
             inst = lookup['instance']
-            try:
-                episodes = get_sonarr_episodes(inst['url'], inst['api_key'], series['id'])
-            except requests.exceptions.RequestException:
-                raise
-
-            if any(ep.get('hasFile', False) for ep in episodes):
+            episodes = episodes_by_job[(inst['url'], inst['api_key'], series['id'])]
+
+            # One pass for both flags; a downloaded episode settles it outright
+            has_file = has_monitored = False
+            for ep in episodes:
+                if ep.get('hasFile', False):
+                    has_file = True
+                    break
+                if ep.get('monitored', False):
+                    has_monitored = True
+
+            if has_file:
                 if debug:
                     print(f"{BLUE}[DEBUG] Downloaded episodes in instance '{inst.get('name')}', skipping completely{RESET}")
                 downloaded_anywhere = True
                 break
 
-            if owner_lookup is None and series.get('monitored', False):
-                if any(ep.get('monitored', False) for ep in episodes):
-                    owner_lookup = lookup
-                    owner_series = series
+            if owner_lookup is None and series.get('monitored', False) and has_monitored:
+                owner_lookup = lookup
+                owner_series = series
 
         if downloaded_anywhere:
             continue
@@ -399,37 +472,20 @@ def process_trending_tv(mdblist_items, sonarr_instances_data, debug=False):
             inst = owner_lookup['instance']
             if debug:
                 print(f"{BLUE}[DEBUG] Monitored in instance '{inst.get('name')}' - adding to monitored_not_available{RESET}")
-            monitored_not_available.append({
-                'title': owner_series['title'],
-                'tvdbId': owner_series.get('tvdbId'),
-                'tmdbId': owner_series.get('tmdbId'),
-                'path': owner_series.get('path', ''),
-                'imdbId': owner_series.get('imdbId', ''),
-                'year': owner_series.get('year', None),
-                'airDate': None,
-                'rank': rank,
-                'owner': {
-                    'name': inst.get('name'),
-                    'url': inst.get('url'),
-                    'api_key': inst.get('api_key'),
-                    'timeout': inst.get('timeout'),
-                },
-            })
+            show_dict = _trending_show_dict(owner_series, rank)
+            show_dict['owner'] = {
+                'name': inst.get('name'),
+                'url': inst.get('url'),
+                'api_key': inst.get('api_key'),
+                'timeout': inst.get('timeout'),
+            }
+            monitored_not_available.append(show_dict)
         else:
             # Found in at least one instance, but unmonitored everywhere
             ref_series = matches[0][1]
             if debug:
                 print(f"{BLUE}[DEBUG] Found but unmonitored everywhere - adding to not_found_or_unmonitored{RESET}")
-            not_found_or_unmonitored.append({
-                'title': ref_series['title'],
-                'tvdbId': ref_series.get('tvdbId'),
-                'tmdbId': ref_series.get('tmdbId'),
-                'path': ref_series.get('path', ''),
-                'imdbId': ref_series.get('imdbId', ''),
-                'year': ref_series.get('year', None),
-                'airDate': None,
-                'rank': rank
-            })
+            not_found_or_unmonitored.append(_trending_show_dict(ref_series, rank))
 
     return monitored_not_available, not_found_or_unmonitored
 
@@ -455,16 +511,11 @@ def process_trending_movies(mdblist_items, radarr_instances_data, debug=False):
     # Per-instance lookup tables
     per_instance_lookups = []
     for inst in radarr_instances_data:
-        by_tmdb, by_imdb = {}, {}
-        for movie in inst.get('all_movies', []):
-            if movie.get('tmdbId'):
-                by_tmdb[str(movie['tmdbId'])] = movie
-            if movie.get('imdbId'):
-                by_imdb[movie['imdbId']] = movie
+        all_movies = inst.get('all_movies', [])
         per_instance_lookups.append({
             'instance': inst,
-            'by_tmdb': by_tmdb,
-            'by_imdb': by_imdb,
+            'by_tmdb': {str(m['tmdbId']): m for m in all_movies if m.get('tmdbId')},
+            'by_imdb': {m['imdbId']: m for m in all_movies if m.get('imdbId')},
         })
 
     for item in mdblist_items:
@@ -493,7 +544,7 @@ def process_trending_movies(mdblist_items, radarr_instances_data, debug=False):
                 print(f"{BLUE}[DEBUG] Not found in any Radarr instance - adding to not_found_or_unmonitored{RESET}")
             not_found_or_unmonitored.append({
                 'title': title,
-                'tmdbId': int(tmdb_id) if tmdb_id and tmdb_id.isdigit() else None,
+                'tmdbId': _maybe_int(tmdb_id),
                 'imdbId': imdb_id,
                 'path': None,
                 'folderName': None,
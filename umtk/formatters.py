@@ -2,54 +2,121 @@
 Date formatting and localization functions for UMTK
 """
 
-from datetime import datetime, timedelta, timezone
+import re
+import time
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 
-from .constants import (
-    RED, RESET,
-    ENGLISH_MONTHS_FULL, ENGLISH_MONTHS_ABBR,
-    ENGLISH_WEEKDAYS_FULL, ENGLISH_WEEKDAYS_ABBR,
-    DEFAULT_LOCALIZATION
-)
+from .constants import RED, RESET, DEFAULT_LOCALIZATION
 
 
-def translate_date_string(date_str, dt_obj, localization):
-    """
-    Replace English month and weekday names with localized versions.
-    Replaces full names before abbreviated ones to avoid partial replacements.
+# Tokens whose text depends on the date and the localization are compiled to
+# placeholders and filled in per date before strftime runs. Names are taken
+# straight from the localization tables, so no English output has to be
+# translated afterwards; the 1-digit day avoids the non-portable '%-d'.
+_DATE_FIELDS = {
+    '\x00': 'day',
+    '\x01': 'months_full',
+    '\x02': 'months_abbr',
+    '\x03': 'weekdays_full',
+    '\x04': 'weekdays_abbr',
+}
+
+# Date format tokens -> strftime directives or placeholders
+_FORMAT_MAPPING = {
+    'mmm': '\x02',  # Abbreviated month name
+    'mmmm': '\x01', # Full month name
+    'mm': '%m',     # 2-digit month
+    'm': '%-m',     # 1-digit month
+    'dddd': '\x03', # Full weekday name
+    'ddd': '\x04',  # Abbreviated weekday name
+    'dd': '%d',     # 2-digit day
+    'd': '\x00',    # 1-digit day
+    'yyyy': '%Y',   # 4-digit year
+    'yyy': '%Y',    # 3+ digit year
+    'yy': '%y',     # 2-digit year
+    'y': '%y'       # Year without century
+}
+
+# Longest patterns first so 'mmmm' is not consumed as 'mm' + 'mm'
+_FORMAT_TOKENS_LONGEST_FIRST = ('mmmm', 'dddd', 'yyyy', 'mmm', 'ddd', 'yyy', 'mm', 'dd', 'yy', 'm', 'd', 'y')
+_FORMAT_TOKEN_RE = re.compile('|'.join(_FORMAT_TOKENS_LONGEST_FIRST))
+
+# Numeric-only tokens -> str.format fields, for formats that can skip strftime
+_NUMERIC_FORMAT_MAPPING = {
+    'mm': '{month:02d}',
+    'm': '{month}',
+    'dd': '{day:02d}',
+    'd': '{day}',
+    'yyyy': '{year}',
+    'yyy': '{year}',
+    'yy': '{yy:02d}',
+    'y': '{yy:02d}',
+}
+
+# date_format -> (strftime format, placeholders used, numeric template or None);
+# configs only use a handful of formats
+_FORMAT_CACHE = {}
+
+
+def _compile_format(date_format):
+    """Translate a user date format (e.g. 'mmm dd, yyyy') into a strftime format.
+
+    Returns (strftime_format, placeholders, numeric_template), where
+    placeholders lists the _DATE_FIELDS markers that must be filled in for
+    each date. Formats made only of numeric tokens (e.g. 'yyyy-mm-dd') also
+    get a str.format template so they can bypass strftime; it is None
+    otherwise, or when the format contains a literal '%'.
     """
-    result = date_str
-    
-    # Get the month and weekday indices
-    month_num = dt_obj.month
-    weekday_num = dt_obj.weekday()  # 0=Monday, 6=Sunday
-    
-    # Replace full month name first (before abbreviated)
-    if ENGLISH_MONTHS_FULL[month_num] in result:
-        result = result.replace(
-            ENGLISH_MONTHS_FULL[month_num],
-            localization['months_full'][month_num]
-        )
-    # Then replace abbreviated month name
-    elif ENGLISH_MONTHS_ABBR[month_num] in result:
-        result = result.replace(
-            ENGLISH_MONTHS_ABBR[month_num],
-            localization['months_abbr'][month_num]
-        )
-    
-    # Replace full weekday name first (before abbreviated)
-    if ENGLISH_WEEKDAYS_FULL[weekday_num] in result:
-        result = result.replace(
-            ENGLISH_WEEKDAYS_FULL[weekday_num],
-            localization['weekdays_full'][weekday_num]
-        )
-    # Then replace abbreviated weekday name
-    elif ENGLISH_WEEKDAYS_ABBR[weekday_num] in result:
-        result = result.replace(
-            ENGLISH_WEEKDAYS_ABBR[weekday_num],
-            localization['weekdays_abbr'][weekday_num]
-        )
-    
-    return result
+    strftime_format = _FORMAT_TOKEN_RE.sub(lambda m: _FORMAT_MAPPING[m.group()], date_format)
+    placeholders = tuple(marker for marker in _DATE_FIELDS if marker in strftime_format)
+
+    numeric_template = None
+    tokens = _FORMAT_TOKEN_RE.findall(date_format)
+    if '%' not in date_format and all(token in _NUMERIC_FORMAT_MAPPING for token in tokens):
+        escaped = date_format.replace('{', '{{').replace('}', '}}')
+        numeric_template = _FORMAT_TOKEN_RE.sub(lambda m: _NUMERIC_FORMAT_MAPPING[m.group()], escaped)
+    return strftime_format, placeholders, numeric_template
+
+
+def _fill_date_fields(strftime_format, placeholders, dt_obj, localization):
+    """Substitute the day number and localized month/weekday names for one date"""
+    for marker in placeholders:
+        field = _DATE_FIELDS[marker]
+        if field == 'day':
+            value = str(dt_obj.day)
+        else:
+            index = dt_obj.month if field[0] == 'm' else dt_obj.weekday()  # weekday: 0=Monday
+            # Escape '%' so a localized name is never read as a directive
+            value = localization[field][index].replace('%', '%%')
+        strftime_format = strftime_format.replace(marker, value)
+    return strftime_format
+
+
+# date_format values strftime rejected and that were already reported
+_INVALID_FORMATS = set()
+
+# (date, format, capitalize, today, localization id) -> (localization, result)
+_RESULT_CACHE = {}
+_RESULT_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=32)
+def _local_today(utc_offset, _minute):
+    """Local date for utc_offset; _minute only exists to expire the cache entry"""
+    return (datetime.now(timezone.utc) + timedelta(hours=utc_offset)).date()
+
+
+def _today_for_offset(utc_offset):
+    """Today's local date, recomputed at most once a minute per offset"""
+    return _local_today(utc_offset, int(time.time()) // 60)
+
+
+def _parse_yyyy_mm_dd(date_str):
+    """Parse a YYYY-MM-DD string into a date without strptime's format machinery"""
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        raise ValueError(f"time data {date_str!r} does not match format '%Y-%m-%d'")
+    return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
 
 
 def format_date(yyyy_mm_dd, date_format, capitalize=False, simplify_next_week=False, 
@@ -68,14 +135,29 @@ def format_date(yyyy_mm_dd, date_format, capitalize=False, simplify_next_week=Fa
     if localization is None:
         localization = DEFAULT_LOCALIZATION
     
-    dt_obj = datetime.strptime(yyyy_mm_dd, "%Y-%m-%d")
+    # Only the simplified names depend on the current day, so 'today' is part
+    # of the key just when they are enabled (None otherwise)
+    today = _today_for_offset(utc_offset) if simplify_next_week else None
+    key = (yyyy_mm_dd, date_format, capitalize, today, id(localization))
+    hit = _RESULT_CACHE.get(key)
+    if hit is not None:
+        return hit[1]
+    
+    result = _format_date_uncached(yyyy_mm_dd, date_format, capitalize, today, localization)
+    if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+        _RESULT_CACHE.clear()
+    # Keep a reference to localization so its id() cannot be reused while cached
+    _RESULT_CACHE[key] = (localization, result)
+    return result
+
+
+def _format_date_uncached(yyyy_mm_dd, date_format, capitalize, today, localization):
+    """format_date without the result cache; today is None unless simplify_next_week is on"""
+    dt_obj = _parse_yyyy_mm_dd(yyyy_mm_dd)
     
     # If simplify_next_week is enabled, check if date is within next 7 days
-    if simplify_next_week:
-        now_local = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
-        today = now_local.date()
-        date_obj = dt_obj.date()
-        days_diff = (date_obj - today).days
+    if today is not None:
+        days_diff = (dt_obj - today).days
         
         # Check if date is within the next 7 days (0-6 days from today)
         if 0 <= days_diff <= 6:
@@ -98,47 +180,31 @@ def format_date(yyyy_mm_dd, date_format, capitalize=False, simplify_next_week=Fa
             return result
     
     # Original date formatting logic
-    format_mapping = {
-        'mmm': '%b',    # Abbreviated month name
-        'mmmm': '%B',   # Full month name
-        'mm': '%m',     # 2-digit month
-        'm': '%-m',     # 1-digit month
-        'dddd': '%A',   # Full weekday name
-        'ddd': '%a',    # Abbreviated weekday name
-        'dd': '%d',     # 2-digit day
-        'd': str(dt_obj.day),  # 1-digit day - direct integer conversion
-        'yyyy': '%Y',   # 4-digit year
-        'yyy': '%Y',    # 3+ digit year
-        'yy': '%y',     # 2-digit year
-        'y': '%y'       # Year without century
-    }
+    compiled = _FORMAT_CACHE.get(date_format)
+    if compiled is None:
+        compiled = _FORMAT_CACHE[date_format] = _compile_format(date_format)
+    strftime_format, placeholders, numeric_template = compiled
     
-    # Sort format patterns by length (longest first) to avoid partial matches
-    patterns = sorted(format_mapping.keys(), key=len, reverse=True)
-    
-    # First, replace format patterns with temporary markers
-    temp_format = date_format
-    replacements = {}
-    for i, pattern in enumerate(patterns):
-        marker = f"@@{i}@@"
-        if pattern in temp_format:
-            replacements[marker] = format_mapping[pattern]
-            temp_format = temp_format.replace(pattern, marker)
+    if numeric_template is not None:
+        result = numeric_template.format(
+            year=dt_obj.year, yy=dt_obj.year % 100, month=dt_obj.month, day=dt_obj.day
+        )
+        if capitalize:
+            result = result.upper()
+        return result
     
-    # Now replace the markers with strftime formats
-    strftime_format = temp_format
-    for marker, replacement in replacements.items():
-        strftime_format = strftime_format.replace(marker, replacement)
+    if placeholders:
+        strftime_format = _fill_date_fields(strftime_format, placeholders, dt_obj, localization)
     
     try:
         result = dt_obj.strftime(strftime_format)
         
-        # Translate English month and weekday names to localized versions
-        result = translate_date_string(result, dt_obj, localization)
-        
         if capitalize:
             result = result.upper()
         return result
-    except ValueError as e:
-        print(f"{RED}Error: Invalid date format '{date_format}'. Using default format.{RESET}")
+    except ValueError:
+        # Report each bad format once rather than for every date it is used with
+        if date_format not in _INVALID_FORMATS:
+            _INVALID_FORMATS.add(date_format)
+            print(f"{RED}Error: Invalid date format '{date_format}'. Using default format.{RESET}")
         return yyyy_mm_dd  # Return original format as fallback
\ No newline at end of file
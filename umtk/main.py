@@ -4,17 +4,19 @@ Main execution logic for UMTK
 
 import os
 import sys
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path, PureWindowsPath
+from pathlib import Path
 
 from .constants import VERSION, GREEN, ORANGE, RED, BLUE, RESET
 from .config_loader import load_config, load_localization, get_cookies_path, get_kometa_folder, get_video_folder
 from .updater import check_for_updates
 from .utils import (
     check_yt_dlp_installed, check_video_file,
-    get_tag_ids_from_names, sanitize_filename,
-    dedupe_by_key, sanitize_instance_name
+    get_tag_ids_from_names, sanitize_filename, clean_title_for_filename,
+    dedupe_by_key, sanitize_instance_name, split_csv_list, log, capture_log
 )
 from .sonarr import process_sonarr_url, get_sonarr_series
 from .radarr import process_radarr_url, get_radarr_movies
@@ -23,10 +25,6 @@ from .finders import (
     find_upcoming_shows, find_new_shows, find_upcoming_movies,
     process_trending_tv, process_trending_movies
 )
-from .media_handlers import (
-    search_trailer_on_youtube, download_trailer_tv, download_trailer_movie,
-    create_placeholder_tv, create_placeholder_movie
-)
 from .cleanup import cleanup_tv_content, cleanup_movie_content
 from .yaml_generators import (
     create_overlay_yaml_tv, create_collection_yaml_tv,
@@ -37,6 +35,444 @@ from .yaml_generators import (
 )
 from .plex_integration import update_plex_tv_metadata, update_plex_movie_metadata, trigger_plex_library_scan
 
+# Trailer searches/downloads are I/O-bound; this many shows/movies are processed at once
+TRAILER_CONCURRENCY = 4
+
+# Existing-content checks run on their own pool; they are mostly waiting on
+# directory listings, which matters on network shares
+EXISTENCE_CHECK_WORKERS = 16
+
+# Kometa YAML files are written in the background while the Plex updates run
+YAML_WRITE_WORKERS = 4
+
+
+def _folder_name(show_path):
+    """Last component of a Sonarr path, accepting both '/' and '\\' separators"""
+    return show_path.rstrip('/\\').rsplit('\\', 1)[-1].rsplit('/', 1)[-1]
+
+
+def _tv_season_00_path(show, root_tv):
+    """
+    Season 00 folder where a show's trailer/placeholder lives, or None if unknown.
+
+    Returned as a plain string: it is only listed once per show, so there is
+    no need to build pathlib objects for it.
+    """
+    show_path = show.get('path')
+    if show_path:
+        if root_tv:
+            # Sonarr may report Windows paths, so split on either separator
+            return os.path.join(root_tv, _folder_name(show_path), "Season 00")
+        return os.path.join(show_path, "Season 00")
+    if root_tv:
+        show_title = show.get('title', 'Unknown')
+        show_year = show.get('year', '')
+        if show_year:
+            show_folder = sanitize_filename(f"{show_title} ({show_year})")
+        else:
+            show_folder = sanitize_filename(show_title)
+        return os.path.join(root_tv, show_folder, "Season 00")
+    return None
+
+
+def _find_existing_tv_content(season_00_path, clean_title):
+    """
+    Name of an existing '<title>.S00E00.Trailer.*' or '<title>.S00E00.Coming.Soon.*'
+    file in season_00_path (trailers win), or None.
+
+    Lists the folder once; a missing folder simply means nothing exists yet.
+    """
+    trailer_prefix = f"{clean_title}.S00E00.Trailer."
+    coming_soon_prefix = f"{clean_title}.S00E00.Coming.Soon."
+    coming_soon_name = None
+    try:
+        with os.scandir(season_00_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(trailer_prefix):
+                    return name
+                if coming_soon_name is None and name.startswith(coming_soon_prefix):
+                    coming_soon_name = name
+    except OSError:
+        return None
+    return coming_soon_name
+
+
+def _mark_existing_tv_content(show, root_tv):
+    """
+    If the show already has a trailer or placeholder, record which one and
+    report it. Returns True when nothing has to be created.
+    """
+    season_00_path = _tv_season_00_path(show, root_tv)
+    if not season_00_path:
+        return False
+    existing_name = _find_existing_tv_content(season_00_path, clean_title_for_filename(show['title']))
+    if not existing_name:
+        return False
+    # Determine if it's a trailer or placeholder
+    show['used_trailer'] = '.Trailer.' in existing_name
+    log(f"{GREEN}Content already exists for {show['title']}: {existing_name} - skipping{RESET}")
+    return True
+
+
+def _process_tv_show(show, method, root_tv, method_fallback, debug, skip_channels, preferred_language):
+    """
+    Create a trailer or placeholder for a show that has neither yet.
+
+    Runs on a worker thread: it only touches the show's own dict and files.
+    Returns 'created', 'fallback' or 'failed'.
+    """
+    log(f"\nProcessing: {show['title']}")
+
+    # Imported on first use: media_handlers loads yt-dlp, which is slow to import
+    from .media_handlers import search_trailer_on_youtube, download_trailer_tv, create_placeholder_tv
+
+    # Process based on method
+    if method == 1:  # Trailer
+        trailer_info = search_trailer_on_youtube(
+            show['title'],
+            show.get('year'),
+            show.get('imdbId'),
+            debug,
+            skip_channels,
+            preferred_language=preferred_language,
+        )
+
+        if trailer_info:
+            log(f"Found trailer: {trailer_info['video_title']} ({trailer_info['duration']}) by {trailer_info['uploader']}")
+            if download_trailer_tv(show, trailer_info, debug, root_tv):
+                return 'created'
+        else:
+            log(f"{ORANGE}No suitable trailer found for {show['title']}{RESET}")
+
+        # If trailer method failed and fallback is enabled, try placeholder
+        if method_fallback:
+            log(f"{ORANGE}Trailer method failed, attempting fallback to placeholder method...{RESET}")
+            if create_placeholder_tv(show, debug, root_tv):
+                log(f"{GREEN}Fallback to placeholder successful for {show['title']}{RESET}")
+                return 'fallback'
+
+    elif method == 2:  # Placeholder
+        if create_placeholder_tv(show, debug, root_tv):
+            return 'created'
+
+    return 'failed'
+
+
+# Serializes the per-item blocks that content workers print
+_OUTPUT_LOCK = threading.Lock()
+
+
+def _write_output(text):
+    """Print one item's collected log lines as a single block"""
+    if text:
+        with _OUTPUT_LOCK:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+def _run_content_jobs(jobs, has_content, create_content, max_workers):
+    """
+    Make sure each job's item has a trailer or placeholder.
+
+    has_content(job) reports existing content and returns True to skip the
+    job (it runs on worker threads too); the rest go through
+    create_content(job) on a bounded thread pool. Both log through
+    utils.log(), which is captured per thread, so each item's lines are
+    printed together. An exception in either marks just that job 'failed'.
+    Returns one status per job, in job order ('existing' for jobs that were
+    skipped).
+    """
+    def _check(job):
+        with capture_log() as lines:
+            try:
+                found = has_content(job)
+            except Exception as e:
+                log(f"{RED}Error checking existing content for {job[0].get('title', 'Unknown')}: {e}{RESET}")
+                found = None
+        return found, ''.join(lines)
+
+    def _run(job):
+        with capture_log() as lines:
+            try:
+                status = create_content(job)
+            except Exception as e:
+                log(f"{RED}Error processing {job[0].get('title', 'Unknown')}: {e}{RESET}")
+                status = 'failed'
+        _write_output(''.join(lines))
+        return status
+
+    # Existence checks are cheap locally but can be slow on network shares,
+    # so they run concurrently as well; their messages are printed in job
+    # order. Only items that need a search/download go to the second pool.
+    with ThreadPoolExecutor(max_workers=max(1, min(EXISTENCE_CHECK_WORKERS, len(jobs)))) as executor:
+        checks = list(executor.map(_check, jobs))
+    _write_output(''.join(text for _, text in checks))
+
+    # found is None when the check itself raised
+    statuses = ['failed' if found is None else 'existing' for found, _ in checks]
+    pending = [index for index, (found, _) in enumerate(checks) if found is not None and not found]
+    if not pending:
+        return statuses
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+        for index, status in zip(pending, executor.map(_run, [jobs[index] for index in pending])):
+            statuses[index] = status
+    return statuses
+
+
+def _process_content_batch(jobs, has_content, create_content, max_workers, summary_title):
+    """
+    Run _run_content_jobs and print a summary under summary_title.
+
+    The first element of each job is the show/movie. Returns
+    (items_with_content, files_written).
+    """
+    successful = 0
+    failed = 0
+    skipped_existing = 0
+    fallback_used = 0
+    items_with_content = []
+
+    statuses = _run_content_jobs(jobs, has_content, create_content, max_workers)
+    for job, status in zip(jobs, statuses):
+        if status == 'failed':
+            failed += 1
+            continue
+        successful += 1
+        items_with_content.append(job[0])
+        if status == 'existing':
+            skipped_existing += 1
+        elif status == 'fallback':
+            fallback_used += 1
+
+    print(f"\n{GREEN}{summary_title}:{RESET}")
+    print(f"Successful: {successful}")
+    print(f"Skipped (already exist): {skipped_existing}")
+    if fallback_used > 0:
+        print(f"Fallback used: {fallback_used}")
+    print(f"Failed: {failed}")
+
+    return items_with_content, successful - skipped_existing
+
+
+def _process_tv_batch(jobs, method, method_fallback, debug, skip_channels, preferred_language,
+                      max_workers, summary_title):
+    """
+    Create trailers/placeholders for (show, root_tv) jobs and print a summary.
+
+    Returns (shows_with_content, files_written).
+    """
+    return _process_content_batch(
+        jobs,
+        lambda job: _mark_existing_tv_content(job[0], job[1]),
+        lambda job: _process_tv_show(
+            job[0], method, job[1], method_fallback, debug, skip_channels, preferred_language
+        ),
+        max_workers, summary_title
+    )
+
+
+def _movie_edition_location(movie, root_movies, edition):
+    """
+    (parent_dir, folder_name) for a movie's '{edition-...}' copy, or None
+    without a root or Radarr path.
+    """
+    check_folder = sanitize_filename(
+        f"{movie.get('title', 'Unknown')} ({movie.get('year', '')}) {{edition-{edition}}}"
+    )
+    if root_movies:
+        return str(root_movies), check_folder
+    movie_path = movie.get('path')
+    if movie_path:
+        return str(Path(movie_path).parent), check_folder
+    return None
+
+
+def _dir_entry_names(dir_path):
+    """Names in a directory as a set; empty if it is missing or unreadable"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _first_edition_file(folder, edition):
+    """
+    Name of the first '*{edition-<edition>}.*' entry in folder, or None.
+
+    Stops at the first match instead of globbing the whole folder.
+    """
+    marker = f"{{edition-{edition}}}."
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if marker in entry.name:
+                    return entry.name
+    except OSError:
+        pass
+    return None
+
+
+def _mark_existing_movie_content(movie, root_movies, dir_index):
+    """
+    Report an existing Coming Soon or Trending copy of the movie.
+    Returns True when nothing has to be created.
+
+    dir_index maps a parent directory to the names in it, so each movie root
+    (or Radarr library folder) is listed about once per batch instead of
+    stat-ing every candidate folder. It is shared by the check threads; at
+    worst two of them list the same directory.
+    """
+    for check_edition in ("Coming Soon", "Trending"):
+        location = _movie_edition_location(movie, root_movies, check_edition)
+        if not location:
+            continue
+        parent_dir, check_folder = location
+        names = dir_index.get(parent_dir)
+        if names is None:
+            names = dir_index[parent_dir] = _dir_entry_names(parent_dir)
+        if check_folder not in names:
+            continue
+        existing_name = _first_edition_file(os.path.join(parent_dir, check_folder), check_edition)
+        if existing_name:
+            log(f"{GREEN}Content already exists for {movie['title']}: {existing_name} - skipping{RESET}")
+            return True
+    return False
+
+
+def _process_movie(movie, method, root_movies, is_trending, method_fallback, debug, skip_channels,
+                   preferred_language):
+    """
+    Create a trailer or placeholder for a movie that has neither yet.
+
+    Runs on a worker thread: it only touches the movie's own dict and files.
+    Returns 'created', 'fallback' or 'failed'.
+    """
+    log(f"\nProcessing: {movie['title']}")
+
+    # Imported on first use: media_handlers loads yt-dlp, which is slow to import
+    from .media_handlers import search_trailer_on_youtube, download_trailer_movie, create_placeholder_movie
+
+    if method == 1:  # Trailer
+        trailer_info = search_trailer_on_youtube(
+            movie['title'],
+            movie.get('year'),
+            movie.get('imdbId'),
+            debug,
+            skip_channels,
+            preferred_language=preferred_language,
+        )
+
+        if trailer_info:
+            log(f"Found trailer: {trailer_info['video_title']} ({trailer_info['duration']}) by {trailer_info['uploader']}")
+            if download_trailer_movie(movie, trailer_info, debug, root_movies, is_trending=is_trending):
+                return 'created'
+        else:
+            log(f"{ORANGE}No suitable trailer found for {movie['title']}{RESET}")
+
+        if method_fallback:
+            log(f"{ORANGE}Trailer method failed, attempting fallback to placeholder method...{RESET}")
+            if create_placeholder_movie(movie, debug, root_movies, is_trending=is_trending):
+                log(f"{GREEN}Fallback to placeholder successful for {movie['title']}{RESET}")
+                return 'fallback'
+
+    elif method == 2:  # Placeholder
+        if create_placeholder_movie(movie, debug, root_movies, is_trending=is_trending):
+            return 'created'
+
+    return 'failed'
+
+
+def _process_movie_batch(jobs, method, method_fallback, debug, skip_channels, preferred_language,
+                         max_workers, summary_title):
+    """
+    Create trailers/placeholders for (movie, root_movies, is_trending) jobs and
+    print a summary. Returns (movies_with_content, files_written).
+    """
+    dir_index = {}
+    return _process_content_batch(
+        jobs,
+        lambda job: _mark_existing_movie_content(job[0], job[1], dir_index),
+        lambda job: _process_movie(
+            job[0], method, job[1], job[2], method_fallback, debug, skip_channels, preferred_language
+        ),
+        max_workers, summary_title
+    )
+
+
+def _fetch_mdblist_captured(mdblist_url, api_key, limit, debug):
+    """fetch_mdblist_items() for a worker thread; returns (items, log text)"""
+    with capture_log() as lines:
+        items = fetch_mdblist_items(mdblist_url, api_key, limit, debug)
+    return items, ''.join(lines)
+
+
+def _start_mdblist_fetches(config, fetch_tv, fetch_movies, debug):
+    """
+    Start the trending TV and movie MDBList fetches in the background.
+
+    Returns (tv_future, movies_future); a future is None when that list is not
+    needed or not configured. Both lists are independent of Sonarr/Radarr, so
+    they download while the libraries are being processed. Each future
+    resolves to (items, log text); the text is held back so the fetch's
+    messages are printed where the list is used, not mid-way through the
+    library output.
+    """
+    mdblist_api_key = config.get('mdblist_api_key')
+    mdblist_tv_url = config.get('mdblist_tv')
+    mdblist_movies_url = config.get('mdblist_movies')
+    fetch_tv = fetch_tv and mdblist_api_key and mdblist_tv_url
+    fetch_movies = fetch_movies and mdblist_api_key and mdblist_movies_url
+    if not (fetch_tv or fetch_movies):
+        return None, None
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    tv_future = movies_future = None
+    if fetch_tv:
+        tv_future = executor.submit(
+            _fetch_mdblist_captured, mdblist_tv_url, mdblist_api_key, config.get('mdblist_tv_limit', 10), debug
+        )
+    if fetch_movies:
+        movies_future = executor.submit(
+            _fetch_mdblist_captured, mdblist_movies_url, mdblist_api_key, config.get('mdblist_movies_limit', 10), debug
+        )
+    # Submitted fetches still run to completion; this just releases the pool
+    executor.shutdown(wait=False)
+    return tv_future, movies_future
+
+
+class _YamlWriter:
+    """
+    Writes Kometa YAML files on a background pool.
+
+    submit() queues a create_*_yaml call and done() queues a message; wait()
+    then goes through both in submission order, re-raising the first failed
+    write and printing each message once everything queued before it is on disk.
+    """
+
+    def __init__(self, max_workers=YAML_WRITE_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = []
+
+    def submit(self, create_yaml, *args, **kwargs):
+        self._pending.append((self._executor.submit(create_yaml, *args, **kwargs), None))
+
+    def done(self, message):
+        self._pending.append((None, message))
+
+    def wait(self):
+        try:
+            for future, message in self._pending:
+                if future is not None:
+                    future.result()
+                else:
+                    print(message)
+        finally:
+            self._pending = []
+            self._executor.shutdown(wait=True)
+
 
 def main(config=None, localization=None):
     start_time = datetime.now()
@@ -89,6 +525,7 @@ def main(config=None, localization=None):
     trending_tv_method = config.get('trending_tv', 0)
     trending_movies_method = config.get('trending_movies', 0)
     method_fallback = str(config.get("method_fallback", "false")).lower() == "true"
+    trailer_concurrency = int(config.get('trailer_concurrency', TRAILER_CONCURRENCY))
     preferred_language = str(config.get('preferred_language', 'original')).lower()
     add_rank_to_sort_title = str(config.get("add_rank_to_sort_title", "false")).lower() == "true"
     append_dates_to_sort_titles = str(config.get("append_dates_to_sort_titles", "true")).lower() == "true"
@@ -99,6 +536,7 @@ def main(config=None, localization=None):
     print(f"Trending TV method: {trending_tv_method} ({'Disabled' if trending_tv_method == 0 else 'Trailer' if trending_tv_method == 1 else 'Placeholder'})")
     print(f"Trending Movies method: {trending_movies_method} ({'Disabled' if trending_movies_method == 0 else 'Trailer' if trending_movies_method == 1 else 'Placeholder'})")
     print(f"Method fallback: {method_fallback}")
+    print(f"Trailer concurrency: {trailer_concurrency}")
     print(f"Preferred trailer language: {preferred_language}")
     print(f"Append dates to sort titles: {append_dates_to_sort_titles}")
     print(f"Add rank to sort title: {add_rank_to_sort_title}")
@@ -108,13 +546,16 @@ def main(config=None, localization=None):
     # Check requirements based on methods
     video_folder = get_video_folder()
     
-    if tv_method == 1 or movie_method == 1 or trending_tv_method == 1 or trending_movies_method == 1:
+    methods = {tv_method, movie_method, trending_tv_method, trending_movies_method}
+    uses_trailers = 1 in methods
+    uses_placeholders = 2 in methods or (method_fallback and uses_trailers)
+
+    if uses_trailers:
         if not check_yt_dlp_installed():
             print(f"{RED}yt-dlp is required for trailer downloading but not installed.{RESET}")
             sys.exit(1)
     
-    if tv_method == 2 or movie_method == 2 or trending_tv_method == 2 or trending_movies_method == 2 or \
-       (method_fallback and (tv_method == 1 or movie_method == 1 or trending_tv_method == 1 or trending_movies_method == 1)):
+    if uses_placeholders:
         if not check_video_file(video_folder):
             print(f"{RED}UMTK video file is required for placeholder method but not found.{RESET}")
             sys.exit(1)
@@ -123,15 +564,17 @@ def main(config=None, localization=None):
     cookies_path = get_cookies_path()
     if cookies_path:
         print(f"{GREEN}Found cookies file: {cookies_path}{RESET}")
+        # yt-dlp saves the cookie jar back to the file when it closes, so
+        # concurrent downloads would overwrite each other's cookies.txt
+        if trailer_concurrency > 1:
+            trailer_concurrency = 1
+            print(f"{ORANGE}Trailer concurrency set to 1 because a cookies file is used{RESET}")
     
     # Get common configuration values
     utc_offset = float(config.get('utc_offset', 0))
     debug = str(config.get("debug", "false")).lower() == "true"
     cleanup = str(config.get("cleanup", "true")).lower() == "true"
-    skip_channels = config.get("skip_channels", [])
-    
-    if isinstance(skip_channels, str):
-        skip_channels = [ch.strip() for ch in skip_channels.split(',') if ch.strip()]
+    skip_channels = split_csv_list(config.get("skip_channels", []))
     
     print(f"UTC offset: {utc_offset} hours")
     print(f"cleanup: {cleanup}")
@@ -141,7 +584,6 @@ def main(config=None, localization=None):
     print()
     
     kometa_folder = get_kometa_folder()
-    kometa_folder.mkdir(exist_ok=True)
     
     try:
         # Initialize variables
@@ -169,1039 +611,767 @@ def main(config=None, localization=None):
         radarr_instances = config.get('radarr_instances', [])
         output_mode = config.get('instance_output_mode', 'combined')
 
-        # Process TV Shows
-        if process_tv:
-            print(f"{BLUE}{'=' * 50}{RESET}")
-            print(f"{BLUE}Processing TV Shows...{RESET}")
-            print(f"{BLUE}{'=' * 50}{RESET}\n")
-
-            if not sonarr_instances:
-                print(f"{ORANGE}No Sonarr instances configured. Skipping TV processing.{RESET}")
-                tv_processing_failed = True
-            else:
-                # Per-instance result accumulators
-                tv_instance_results = []
-                # Snapshot of each successfully-connected Sonarr instance's data for the
-                # global trending pass and cleanup that runs after the per-instance loop.
-                sonarr_instances_data = []
-
-                future_days_upcoming_shows = config.get('future_days_upcoming_shows', 30)
-                recent_days_new_show = config.get('recent_days_new_show', 7)
-                future_only_tv = str(config.get("future_only_tv", "false")).lower() == "true"
-
-                print(f"future_days_upcoming_shows: {future_days_upcoming_shows}")
-                print(f"recent_days_new_show: {recent_days_new_show}")
-                print(f"future_only_tv: {future_only_tv}")
-                print()
-
-                # Fetch MDBList items once (not per-instance)
-                mdblist_tv_limit = config.get('mdblist_tv_limit', 10)
-                if trending_tv_method > 0:
-                    mdblist_api_key = config.get('mdblist_api_key')
-                    mdblist_tv_url = config.get('mdblist_tv')
-                    if mdblist_api_key and mdblist_tv_url:
-                        print(f"{BLUE}Fetching trending TV shows from MDBList...{RESET}")
-                        mdblist_tv_items = fetch_mdblist_items(mdblist_tv_url, mdblist_api_key, mdblist_tv_limit, debug)
-                        if mdblist_tv_items:
-                            print(f"{GREEN}Fetched {len(mdblist_tv_items)} trending TV shows from MDBList{RESET}\n")
-                        else:
-                            print(f"{ORANGE}No trending TV shows fetched from MDBList{RESET}\n")
-                    else:
-                        if not mdblist_api_key:
-                            print(f"{RED}Error: mdblist_api_key not configured{RESET}")
-                        if not mdblist_tv_url:
-                            print(f"{RED}Error: mdblist_tv not configured{RESET}")
-
-                for instance in sonarr_instances:
-                    instance_name = instance.get('name', 'Sonarr')
-                    sonarr_timeout = int(instance.get('timeout', 90))
-                    umtk_root_tv = _normalize_root(instance.get('umtk_root'))
-
-                    if len(sonarr_instances) > 1:
-                        print(f"{BLUE}--- Sonarr Instance: {instance_name} ---{RESET}")
-                    if umtk_root_tv:
-                        print(f"{GREEN}Using custom TV root: {umtk_root_tv}{RESET}")
-
-                    try:
-                        sonarr_url = process_sonarr_url(instance['url'], instance['api_key'], sonarr_timeout)
-                        sonarr_api_key = instance['api_key']
-
-                        all_series = get_sonarr_series(sonarr_url, sonarr_api_key, sonarr_timeout)
-
-                        exclude_sonarr_tag_names = instance.get('exclude_tags', [])
-                        if isinstance(exclude_sonarr_tag_names, str):
-                            exclude_sonarr_tag_names = [tag.strip() for tag in exclude_sonarr_tag_names.split(',') if tag.strip()]
-
-                        exclude_sonarr_tag_ids = get_tag_ids_from_names(sonarr_url, sonarr_api_key, exclude_sonarr_tag_names, sonarr_timeout, debug)
-
-                        if exclude_sonarr_tag_names:
-                            print(f"exclude_sonarr_tags: {', '.join(exclude_sonarr_tag_names)}")
-
-                        # Register this instance for the global trending pass + cleanup pass.
-                        sonarr_instances_data.append({
-                            'name': instance_name,
-                            'url': sonarr_url,
-                            'api_key': sonarr_api_key,
-                            'timeout': sonarr_timeout,
-                            'all_series': all_series,
-                            'exclude_tag_ids': exclude_sonarr_tag_ids,
-                            'umtk_root_tv': umtk_root_tv,
-                        })
-
-                        future_shows = []
-                        aired_shows = []
-                        new_shows = []
-                        inst_shows_with_content = []
-
-                        if tv_method > 0:
-                            future_shows, aired_shows = find_upcoming_shows(
-                                all_series, sonarr_url, sonarr_api_key, future_days_upcoming_shows,
-                                utc_offset, debug, exclude_sonarr_tag_ids, future_only_tv
-                            )
+        # Determine if we need to process Movies at all (either regular or trending)
+        process_movies = (movie_method > 0 or trending_movies_method > 0)
 
-                            if future_shows:
-                                print(f"{GREEN}Found {len(future_shows)} future shows with first episodes within {future_days_upcoming_shows} days:{RESET}")
-                                for show in future_shows:
-                                    print(f"- {show['title']}" + (f" ({show['year']})" if show['year'] else "") + f" - First episode: {show['airDate']}")
-                            else:
-                                print(f"{ORANGE}No future shows found with first episodes within {future_days_upcoming_shows} days.{RESET}")
-
-                            if aired_shows:
-                                print(f"\n{GREEN}Found {len(aired_shows)} aired shows not yet available:{RESET}")
-                                for show in aired_shows:
-                                    print(f"- {show['title']}" + (f" ({show['year']})" if show['year'] else "") + f" - First episode aired: {show['airDate']}")
-                            elif not future_only_tv:
-                                print(f"{ORANGE}No aired shows found that are not yet available.{RESET}")
-                            else:
-                                print(f"{ORANGE}Aired shows excluded due to future_only_tv=True.{RESET}")
+        # YAML files are only written when TV or movie processing is enabled
+        if process_tv or process_movies:
+            kometa_folder.mkdir(exist_ok=True)
+        yaml_writer = _YamlWriter()
+        try:
+            mdblist_tv_future, mdblist_movies_future = _start_mdblist_fetches(
+                config,
+                trending_tv_method > 0 and bool(sonarr_instances),
+                trending_movies_method > 0 and bool(radarr_instances),
+                debug
+            )
 
-                            # Find new shows
-                            print(f"\n{BLUE}Finding new shows with S01E01 downloaded...{RESET}")
-                            new_shows = find_new_shows(
-                                all_series, sonarr_url, sonarr_api_key, recent_days_new_show, utc_offset, debug
-                            )
+            # Process TV Shows
+            if process_tv:
+                print(f"{BLUE}{'=' * 50}{RESET}")
+                print(f"{BLUE}Processing TV Shows...{RESET}")
+                print(f"{BLUE}{'=' * 50}{RESET}\n")
 
-                            if new_shows:
-                                print(f"{GREEN}Found {len(new_shows)} new shows with S01E01 aired within the past {recent_days_new_show} days:{RESET}")
-                                for show in new_shows:
-                                    print(f"- {show['title']}" + (f" ({show['year']})" if show['year'] else "") + f" - S01E01 aired: {show['airDate']}")
+                if not sonarr_instances:
+                    print(f"{ORANGE}No Sonarr instances configured. Skipping TV processing.{RESET}")
+                    tv_processing_failed = True
+                else:
+                    # Per-instance result accumulators
+                    tv_instance_results = []
+                    # Snapshot of each successfully-connected Sonarr instance's data for the
+                    # global trending pass and cleanup that runs after the per-instance loop.
+                    sonarr_instances_data = []
+
+                    future_days_upcoming_shows = config.get('future_days_upcoming_shows', 30)
+                    recent_days_new_show = config.get('recent_days_new_show', 7)
+                    future_only_tv = str(config.get("future_only_tv", "false")).lower() == "true"
+
+                    print(f"future_days_upcoming_shows: {future_days_upcoming_shows}")
+                    print(f"recent_days_new_show: {recent_days_new_show}")
+                    print(f"future_only_tv: {future_only_tv}")
+                    print()
+
+                    # Fetch MDBList items once (not per-instance)
+                    mdblist_tv_limit = config.get('mdblist_tv_limit', 10)
+                    if trending_tv_method > 0:
+                        mdblist_api_key = config.get('mdblist_api_key')
+                        mdblist_tv_url = config.get('mdblist_tv')
+                        if mdblist_api_key and mdblist_tv_url:
+                            print(f"{BLUE}Fetching trending TV shows from MDBList...{RESET}")
+                            mdblist_tv_items, fetch_log = mdblist_tv_future.result()
+                            print(fetch_log, end='')
+                            if mdblist_tv_items:
+                                print(f"{GREEN}Fetched {len(mdblist_tv_items)} trending TV shows from MDBList{RESET}\n")
                             else:
-                                print(f"{ORANGE}No new shows found with S01E01 aired within the past {recent_days_new_show} days.{RESET}")
-
-                            # Process TV content based on method
-                            all_shows = future_shows + aired_shows
-                            if all_shows:
-                                print(f"\n{BLUE}Processing content for upcoming shows...{RESET}")
-                                successful = 0
-                                failed = 0
-                                skipped_existing = 0
-                                fallback_used = 0
-
-                                for show in all_shows:
-                                    print(f"\nProcessing: {show['title']}")
-
-                                    # Check if content already exists
-                                    show_path = show.get('path')
-                                    if show_path:
-                                        if umtk_root_tv:
-                                            # Use PureWindowsPath to handle Windows paths from Sonarr
-                                            show_name = PureWindowsPath(show_path).name
-                                            season_00_path = Path(umtk_root_tv) / show_name / "Season 00"
-                                        else:
-                                            season_00_path = Path(show_path) / "Season 00"
-
-                                        clean_title = "".join(c for c in show['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-
-                                        # Check for both trailer and coming soon files
-                                        trailer_pattern = f"{clean_title}.S00E00.Trailer.*"
-                                        coming_soon_pattern = f"{clean_title}.S00E00.Coming.Soon.*"
-                                        existing_trailers = []
-                                        if season_00_path.exists():
-                                            existing_trailers = list(season_00_path.glob(trailer_pattern)) + list(season_00_path.glob(coming_soon_pattern))
-
-                                        if existing_trailers:
-                                            existing_file = existing_trailers[0]
-                                            # Determine if it's a trailer or placeholder
-                                            show['used_trailer'] = '.Trailer.' in existing_file.name
-                                            print(f"{GREEN}Content already exists for {show['title']}: {existing_file.name} - skipping{RESET}")
-                                            skipped_existing += 1
-                                            successful += 1
-                                            inst_shows_with_content.append(show)
-                                            continue
-
-                                    # Process based on method
-                                    success = False
-
-                                    if tv_method == 1:  # Trailer
-                                        trailer_info = search_trailer_on_youtube(
-                                            show['title'],
-                                            show.get('year'),
-                                            show.get('imdbId'),
-                                            debug,
-                                            skip_channels,
-                                            preferred_language=preferred_language,
-                                        )
-
-                                        if trailer_info:
-                                            print(f"Found trailer: {trailer_info['video_title']} ({trailer_info['duration']}) by {trailer_info['uploader']}")
-                                            success = download_trailer_tv(show, trailer_info, debug, umtk_root_tv)
-                                        else:
-                                            print(f"{ORANGE}No suitable trailer found for {show['title']}{RESET}")
-
-                                        # If trailer method failed and fallback is enabled, try placeholder
-                                        if not success and method_fallback:
-                                            print(f"{ORANGE}Trailer method failed, attempting fallback to placeholder method...{RESET}")
-                                            success = create_placeholder_tv(show, debug, umtk_root_tv)
-                                            if success:
-                                                fallback_used += 1
-                                                print(f"{GREEN}Fallback to placeholder successful for {show['title']}{RESET}")
-
-                                    elif tv_method == 2:  # Placeholder
-                                        success = create_placeholder_tv(show, debug, umtk_root_tv)
-
-                                    if success:
-                                        successful += 1
-                                        new_tv_files_written += 1
-                                        inst_shows_with_content.append(show)
-                                    else:
-                                        failed += 1
-
-                                print(f"\n{GREEN}TV content processing summary:{RESET}")
-                                print(f"Successful: {successful}")
-                                print(f"Skipped (already exist): {skipped_existing}")
-                                if fallback_used > 0:
-                                    print(f"Fallback used: {fallback_used}")
-                                print(f"Failed: {failed}")
-
-                        # NOTE: Trending processing and cleanup moved out of this loop —
-                        # they run once globally after every instance has been visited so
-                        # that trending decisions consider all instances' libraries combined.
-
-                        tv_instance_results.append({
-                            'name': instance_name,
-                            'future_shows': future_shows,
-                            'aired_shows': aired_shows,
-                            'new_shows': new_shows,
-                            # Trending fields are populated after the per-instance loop by the
-                            # global trending pass.
-                            'trending_tv_monitored': [],
-                            'trending_tv_request_needed': [],
-                            'all_shows_with_content': inst_shows_with_content,
-                        })
-
-                    except (ConnectionError, requests.exceptions.RequestException) as e:
-                        print(f"{RED}Error with Sonarr instance '{instance_name}': {str(e)}{RESET}")
-                        instance_warnings.append(f"Sonarr instance '{instance_name}': {str(e)}")
-                        if len(sonarr_instances) > 1:
-                            print(f"{ORANGE}Continuing with next instance...{RESET}")
+                                print(f"{ORANGE}No trending TV shows fetched from MDBList{RESET}\n")
                         else:
-                            print(f"{ORANGE}Skipping TV processing and continuing with movies...{RESET}")
-                            tv_processing_failed = True
+                            if not mdblist_api_key:
+                                print(f"{RED}Error: mdblist_api_key not configured{RESET}")
+                            if not mdblist_tv_url:
+                                print(f"{RED}Error: mdblist_tv not configured{RESET}")
 
-                if not tv_instance_results:
-                    tv_processing_failed = True
+                    for instance in sonarr_instances:
+                        instance_name = instance.get('name', 'Sonarr')
+                        sonarr_timeout = int(instance.get('timeout', 90))
+                        umtk_root_tv = _normalize_root(instance.get('umtk_root'))
 
-                # ====================================================================
-                # GLOBAL TRENDING PASS — runs once across all Sonarr instances combined
-                # ====================================================================
-                trending_shows_with_content = []
-                if (trending_tv_method > 0 and mdblist_tv_items
-                        and sonarr_instances_data):
-                    print(f"\n{BLUE}{'=' * 50}{RESET}")
-                    print(f"{BLUE}Processing Trending TV Shows (across all Sonarr instances)...{RESET}")
-                    print(f"{BLUE}{'=' * 50}{RESET}")
-
-                    trending_tv_monitored, trending_tv_request_needed = process_trending_tv(
-                        mdblist_tv_items, sonarr_instances_data, debug
-                    )
-
-                    if trending_tv_monitored:
-                        print(f"\n{GREEN}Found {len(trending_tv_monitored)} trending shows that are monitored but not available:{RESET}")
-                        for show in trending_tv_monitored:
-                            owner_name = show.get('owner', {}).get('name', '?')
-                            print(f"- {show['title']}" + (f" ({show['year']})" if show.get('year') else "") + f"  [owner: {owner_name}]")
-                    else:
-                        print(f"{ORANGE}No trending shows found that are monitored but not available.{RESET}")
+                        if len(sonarr_instances) > 1:
+                            print(f"{BLUE}--- Sonarr Instance: {instance_name} ---{RESET}")
+                        if umtk_root_tv:
+                            print(f"{GREEN}Using custom TV root: {umtk_root_tv}{RESET}")
 
-                    if trending_tv_request_needed:
-                        print(f"\n{GREEN}Found {len(trending_tv_request_needed)} trending shows that need to be requested:{RESET}")
-                        for show in trending_tv_request_needed:
-                            print(f"- {show['title']}" + (f" ({show['year']})" if show.get('year') else ""))
-                    else:
-                        print(f"{ORANGE}No trending shows found that need to be requested.{RESET}")
-
-                    # Single global content-creation pass for all trending shows
-                    all_trending_tv = trending_tv_monitored + trending_tv_request_needed
-                    if all_trending_tv:
-                        print(f"\n{BLUE}Processing content for trending TV shows...{RESET}")
-                        successful = 0
-                        failed = 0
-                        skipped_existing = 0
-                        fallback_used = 0
-
-                        sonarr_root_by_name = {inst['name']: inst.get('umtk_root_tv') for inst in sonarr_instances_data}
-
-                        for show in all_trending_tv:
-                            show['is_trending'] = True
-
-                            print(f"\nProcessing: {show['title']}")
-
-                            # Resolve the root for this trending item:
-                            #   - owned items use the owning Sonarr instance's root
-                            #   - request_needed items fall back to trending_root_tv
-                            owner_name = (show.get('owner') or {}).get('name')
-                            if owner_name and sonarr_root_by_name.get(owner_name):
-                                show_root_tv = sonarr_root_by_name[owner_name]
-                            else:
-                                show_root_tv = trending_root_tv
+                        try:
+                            sonarr_url = process_sonarr_url(instance['url'], instance['api_key'], sonarr_timeout)
+                            sonarr_api_key = instance['api_key']
+
+                            all_series = get_sonarr_series(sonarr_url, sonarr_api_key, sonarr_timeout)
+
+                            exclude_sonarr_tag_names = split_csv_list(instance.get('exclude_tags', []))
+
+                            exclude_sonarr_tag_ids = get_tag_ids_from_names(sonarr_url, sonarr_api_key, exclude_sonarr_tag_names, sonarr_timeout, debug)
+
+                            if exclude_sonarr_tag_names:
+                                print(f"exclude_sonarr_tags: {', '.join(exclude_sonarr_tag_names)}")
 
-                            show_path = show.get('path')
+                            # Register this instance for the global trending pass + cleanup pass.
+                            sonarr_instances_data.append({
+                                'name': instance_name,
+                                'url': sonarr_url,
+                                'api_key': sonarr_api_key,
+                                'timeout': sonarr_timeout,
+                                'all_series': all_series,
+                                'exclude_tag_ids': exclude_sonarr_tag_ids,
+                                'umtk_root_tv': umtk_root_tv,
+                            })
 
-                            if show_path:
-                                if show_root_tv:
-                                    show_name = PureWindowsPath(show_path).name
-                                    season_00_path = Path(show_root_tv) / show_name / "Season 00"
+                            future_shows = []
+                            aired_shows = []
+                            new_shows = []
+                            inst_shows_with_content = []
+
+                            if tv_method > 0:
+                                future_shows, aired_shows = find_upcoming_shows(
+                                    all_series, sonarr_url, sonarr_api_key, future_days_upcoming_shows,
+                                    utc_offset, debug, exclude_sonarr_tag_ids, future_only_tv
+                                )
+
+                                if future_shows:
+                                    print(f"{GREEN}Found {len(future_shows)} future shows with first episodes within {future_days_upcoming_shows} days:{RESET}")
+                                    for show in future_shows:
+                                        print(f"- {show['title']}" + (f" ({show['year']})" if show['year'] else "") + f" - First episode: {show['airDate']}")
                                 else:
-                                    season_00_path = Path(show_path) / "Season 00"
-                            elif show_root_tv:
-                                show_title = show.get('title', 'Unknown')
-                                show_year = show.get('year', '')
-                                if show_year:
-                                    show_folder = sanitize_filename(f"{show_title} ({show_year})")
+                                    print(f"{ORANGE}No future shows found with first episodes within {future_days_upcoming_shows} days.{RESET}")
+
+                                if aired_shows:
+                                    print(f"\n{GREEN}Found {len(aired_shows)} aired shows not yet available:{RESET}")
+                                    for show in aired_shows:
+                                        print(f"- {show['title']}" + (f" ({show['year']})" if show['year'] else "") + f" - First episode aired: {show['airDate']}")
+                                elif not future_only_tv:
+                                    print(f"{ORANGE}No aired shows found that are not yet available.{RESET}")
                                 else:
-                                    show_folder = sanitize_filename(show_title)
-                                season_00_path = Path(show_root_tv) / show_folder / "Season 00"
-                            else:
-                                season_00_path = None
-
-                            if season_00_path:
-                                clean_title = "".join(c for c in show['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                                trailer_pattern = f"{clean_title}.S00E00.Trailer.*"
-                                coming_soon_pattern = f"{clean_title}.S00E00.Coming.Soon.*"
-                                existing_trailers = []
-                                if season_00_path.exists():
-                                    existing_trailers = list(season_00_path.glob(trailer_pattern)) + list(season_00_path.glob(coming_soon_pattern))
-
-                                if existing_trailers:
-                                    existing_file = existing_trailers[0]
-                                    show['used_trailer'] = '.Trailer.' in existing_file.name
-                                    print(f"{GREEN}Content already exists for {show['title']}: {existing_file.name} - skipping{RESET}")
-                                    skipped_existing += 1
-                                    successful += 1
-                                    trending_shows_with_content.append(show)
-                                    continue
-
-                            success = False
-
-                            if trending_tv_method == 1:  # Trailer
-                                trailer_info = search_trailer_on_youtube(
-                                    show['title'],
-                                    show.get('year'),
-                                    show.get('imdbId'),
-                                    debug,
-                                    skip_channels,
-                                    preferred_language=preferred_language,
+                                    print(f"{ORANGE}Aired shows excluded due to future_only_tv=True.{RESET}")
+
+                                # Find new shows
+                                print(f"\n{BLUE}Finding new shows with S01E01 downloaded...{RESET}")
+                                new_shows = find_new_shows(
+                                    all_series, sonarr_url, sonarr_api_key, recent_days_new_show, utc_offset, debug,
+                                    exclude_sonarr_tag_ids
                                 )
 
-                                if trailer_info:
-                                    print(f"Found trailer: {trailer_info['video_title']} ({trailer_info['duration']}) by {trailer_info['uploader']}")
-                                    success = download_trailer_tv(show, trailer_info, debug, show_root_tv)
+                                if new_shows:
+                                    print(f"{GREEN}Found {len(new_shows)} new shows with S01E01 aired within the past {recent_days_new_show} days:{RESET}")
+                                    for show in new_shows:
+                                        print(f"- {show['title']}" + (f" ({show['year']})" if show['year'] else "") + f" - S01E01 aired: {show['airDate']}")
                                 else:
-                                    print(f"{ORANGE}No suitable trailer found for {show['title']}{RESET}")
-
-                                if not success and method_fallback:
-                                    print(f"{ORANGE}Trailer method failed, attempting fallback to placeholder method...{RESET}")
-                                    success = create_placeholder_tv(show, debug, show_root_tv)
-                                    if success:
-                                        fallback_used += 1
-                                        print(f"{GREEN}Fallback to placeholder successful for {show['title']}{RESET}")
-
-                            elif trending_tv_method == 2:  # Placeholder
-                                success = create_placeholder_tv(show, debug, show_root_tv)
-
-                            if success:
-                                successful += 1
-                                new_tv_files_written += 1
-                                trending_shows_with_content.append(show)
-                            else:
-                                failed += 1
-
-                        print(f"\n{GREEN}Trending TV content processing summary:{RESET}")
-                        print(f"Successful: {successful}")
-                        print(f"Skipped (already exist): {skipped_existing}")
-                        if fallback_used > 0:
-                            print(f"Fallback used: {fallback_used}")
-                        print(f"Failed: {failed}")
-
-                    # Distribute trending into per-instance results so split-mode YMLs include them.
-                    # Monitored items go to their owner's instance bucket; request_needed items have
-                    # no instance owner so they go into every instance bucket.
-                    inst_results_by_name = {r['name']: r for r in tv_instance_results}
-                    for show in trending_tv_monitored:
-                        owner_name = show.get('owner', {}).get('name')
-                        if owner_name and owner_name in inst_results_by_name:
-                            inst_results_by_name[owner_name]['trending_tv_monitored'].append(show)
-                    for show in trending_tv_request_needed:
-                        for r in tv_instance_results:
-                            r['trending_tv_request_needed'].append(show)
-                else:
-                    trending_tv_monitored = []
-                    trending_tv_request_needed = []
-
-                # ====================================================================
-                # TV CLEANUP — runs after the global trending pass so it can see the
-                # full global trending lists. Instances that share a umtk_root_tv are
-                # grouped so cleanup considers the union of their libraries; instances
-                # with distinct (or no) custom roots clean up independently.
-                # ====================================================================
-                if cleanup and sonarr_instances_data:
-                    tv_cleanup_groups = {}
-                    tv_cleanup_order = []
-                    for inst in sonarr_instances_data:
-                        # None root → falls back to scanning that instance's series
-                        # paths, which won't collide with other instances. Key it
-                        # uniquely so it stays its own group.
-                        key = inst.get('umtk_root_tv') or f"__solo__:{inst['name']}"
-                        if key not in tv_cleanup_groups:
-                            tv_cleanup_groups[key] = []
-                            tv_cleanup_order.append(key)
-                        tv_cleanup_groups[key].append(inst)
-
-                    for key in tv_cleanup_order:
-                        group = tv_cleanup_groups[key]
-                        if len(sonarr_instances_data) > 1:
-                            header = ", ".join(i['name'] for i in group)
-                            label = "Instance" if len(group) == 1 else "Instances"
-                            print(f"\n{BLUE}--- Cleanup for Sonarr {label}: {header} ---{RESET}")
-                        print(f"\n{BLUE}Checking for TV content to cleanup...{RESET}")
-                        try:
-                            cleanup_tv_content(
-                                group, tv_method, debug,
-                                future_days_upcoming_shows, utc_offset, future_only_tv,
-                                trending_tv_monitored, trending_tv_request_needed
-                            )
+                                    print(f"{ORANGE}No new shows found with S01E01 aired within the past {recent_days_new_show} days.{RESET}")
+
+                                # Process TV content based on method
+                                all_shows = future_shows + aired_shows
+                                if all_shows:
+                                    print(f"\n{BLUE}Processing content for upcoming shows...{RESET}")
+                                    shows_with_content, files_written = _process_tv_batch(
+                                        [(show, umtk_root_tv) for show in all_shows], tv_method,
+                                        method_fallback, debug, skip_channels, preferred_language,
+                                        trailer_concurrency, "TV content processing summary"
+                                    )
+                                    inst_shows_with_content.extend(shows_with_content)
+                                    new_tv_files_written += files_written
+
+                            # NOTE: Trending processing and cleanup moved out of this loop —
+                            # they run once globally after every instance has been visited so
+                            # that trending decisions consider all instances' libraries combined.
+
+                            tv_instance_results.append({
+                                'name': instance_name,
+                                'future_shows': future_shows,
+                                'aired_shows': aired_shows,
+                                'new_shows': new_shows,
+                                # Trending fields are populated after the per-instance loop by the
+                                # global trending pass.
+                                'trending_tv_monitored': [],
+                                'trending_tv_request_needed': [],
+                                'all_shows_with_content': inst_shows_with_content,
+                            })
+
                         except (ConnectionError, requests.exceptions.RequestException) as e:
-                            names = ", ".join(i['name'] for i in group)
-                            print(f"{RED}Cleanup error for Sonarr instance(s) '{names}': {str(e)}{RESET}")
-                            instance_warnings.append(f"Sonarr cleanup '{names}': {str(e)}")
-                        print()
-
-                # Merge instance results for YML generation and Plex updates
-                if tv_instance_results:
-                    # Merge shows_with_content for Plex metadata: per-instance buckets +
-                    # the global trending content bucket.
-                    all_shows_with_content = dedupe_by_key(
-                        [r['all_shows_with_content'] for r in tv_instance_results] + [trending_shows_with_content],
-                        'tvdbId'
-                    )
-
-                    # Generate TV YML files
-                    if tv_method > 0 or trending_tv_method > 0:
-                        if output_mode == 'combined' or len(tv_instance_results) == 1:
-                            merged_future = dedupe_by_key([r['future_shows'] for r in tv_instance_results], 'tvdbId')
-                            merged_aired = dedupe_by_key([r['aired_shows'] for r in tv_instance_results], 'tvdbId')
-                            merged_new = dedupe_by_key([r['new_shows'] for r in tv_instance_results], 'tvdbId')
-
-                            overlay_file = kometa_folder / "UMTK_TV_UPCOMING_SHOWS_OVERLAYS.yml"
-                            collection_file = kometa_folder / "UMTK_TV_UPCOMING_SHOWS_COLLECTION.yml"
-
-                            create_overlay_yaml_tv(
-                                str(overlay_file), merged_future, merged_aired,
-                                trending_tv_monitored if trending_tv_method > 0 else [],
-                                trending_tv_request_needed if trending_tv_method > 0 else [],
-                                {"backdrop": config.get("backdrop_upcoming_shows", {}),
-                                 "text": config.get("text_upcoming_shows", {}),
-                                 "backdrop_aired": config.get("backdrop_upcoming_shows_aired", {}),
-                                 "text_aired": config.get("text_upcoming_shows_aired", {}),
-                                 "backdrop_trending_request_needed": config.get("backdrop_trending_shows_request_needed", {}),
-                                 "text_trending_request_needed": config.get("text_trending_shows_request_needed", {})},
-                                config,
-                                localization
-                            )
+                            print(f"{RED}Error with Sonarr instance '{instance_name}': {str(e)}{RESET}")
+                            instance_warnings.append(f"Sonarr instance '{instance_name}': {str(e)}")
+                            if len(sonarr_instances) > 1:
+                                print(f"{ORANGE}Continuing with next instance...{RESET}")
+                            else:
+                                print(f"{ORANGE}Skipping TV processing and continuing with movies...{RESET}")
+                                tv_processing_failed = True
+
+                    if not tv_instance_results:
+                        tv_processing_failed = True
+
+                    # ====================================================================
+                    # GLOBAL TRENDING PASS — runs once across all Sonarr instances combined
+                    # ====================================================================
+                    trending_shows_with_content = []
+                    if (trending_tv_method > 0 and mdblist_tv_items
+                            and sonarr_instances_data):
+                        print(f"\n{BLUE}{'=' * 50}{RESET}")
+                        print(f"{BLUE}Processing Trending TV Shows (across all Sonarr instances)...{RESET}")
+                        print(f"{BLUE}{'=' * 50}{RESET}")
+
+                        trending_tv_monitored, trending_tv_request_needed = process_trending_tv(
+                            mdblist_tv_items, sonarr_instances_data, debug
+                        )
 
-                            if tv_method > 0:
-                                new_shows_overlay_file = kometa_folder / "UMTK_TV_NEW_SHOWS_OVERLAYS.yml"
-                                new_shows_collection_file = kometa_folder / "UMTK_TV_NEW_SHOWS_COLLECTION.yml"
-                                create_new_shows_overlay_yaml(str(new_shows_overlay_file), merged_new,
-                                                              {"backdrop": config.get("backdrop_new_show", {}),
-                                                               "text": config.get("text_new_show", {})})
-                                create_new_shows_collection_yaml(str(new_shows_collection_file), merged_new, config)
-
-                            create_collection_yaml_tv(str(collection_file), merged_future, merged_aired, config)
-                            print(f"\n{GREEN}TV YAML files created successfully{RESET}")
+                        if trending_tv_monitored:
+                            print(f"\n{GREEN}Found {len(trending_tv_monitored)} trending shows that are monitored but not available:{RESET}")
+                            for show in trending_tv_monitored:
+                                owner_name = show.get('owner', {}).get('name', '?')
+                                print(f"- {show['title']}" + (f" ({show['year']})" if show.get('year') else "") + f"  [owner: {owner_name}]")
+                        else:
+                            print(f"{ORANGE}No trending shows found that are monitored but not available.{RESET}")
+
+                        if trending_tv_request_needed:
+                            print(f"\n{GREEN}Found {len(trending_tv_request_needed)} trending shows that need to be requested:{RESET}")
+                            for show in trending_tv_request_needed:
+                                print(f"- {show['title']}" + (f" ({show['year']})" if show.get('year') else ""))
                         else:
-                            # Split mode: per-instance YML files
-                            for result in tv_instance_results:
-                                suffix = f"_{sanitize_instance_name(result['name'])}"
-
-                                overlay_file = kometa_folder / f"UMTK_TV_UPCOMING_SHOWS_OVERLAYS{suffix}.yml"
-                                collection_file = kometa_folder / f"UMTK_TV_UPCOMING_SHOWS_COLLECTION{suffix}.yml"
-
-                                create_overlay_yaml_tv(
-                                    str(overlay_file), result['future_shows'], result['aired_shows'],
-                                    result['trending_tv_monitored'] if trending_tv_method > 0 else [],
-                                    result['trending_tv_request_needed'] if trending_tv_method > 0 else [],
-                                    {"backdrop": config.get("backdrop_upcoming_shows", {}),
-                                     "text": config.get("text_upcoming_shows", {}),
-                                     "backdrop_aired": config.get("backdrop_upcoming_shows_aired", {}),
-                                     "text_aired": config.get("text_upcoming_shows_aired", {}),
-                                     "backdrop_trending_request_needed": config.get("backdrop_trending_shows_request_needed", {}),
-                                     "text_trending_request_needed": config.get("text_trending_shows_request_needed", {})},
+                            print(f"{ORANGE}No trending shows found that need to be requested.{RESET}")
+
+                        # Single global content-creation pass for all trending shows
+                        all_trending_tv = trending_tv_monitored + trending_tv_request_needed
+                        if all_trending_tv:
+                            print(f"\n{BLUE}Processing content for trending TV shows...{RESET}")
+                            sonarr_root_by_name = {inst['name']: inst.get('umtk_root_tv') for inst in sonarr_instances_data}
+
+                            trending_jobs = []
+                            for show in all_trending_tv:
+                                show['is_trending'] = True
+
+                                # Resolve the root for this trending item:
+                                #   - owned items use the owning Sonarr instance's root
+                                #   - request_needed items fall back to trending_root_tv
+                                owner_name = (show.get('owner') or {}).get('name')
+                                if owner_name and sonarr_root_by_name.get(owner_name):
+                                    show_root_tv = sonarr_root_by_name[owner_name]
+                                else:
+                                    show_root_tv = trending_root_tv
+                                trending_jobs.append((show, show_root_tv))
+
+                            shows_with_content, files_written = _process_tv_batch(
+                                trending_jobs, trending_tv_method,
+                                method_fallback, debug, skip_channels, preferred_language,
+                                trailer_concurrency, "Trending TV content processing summary"
+                            )
+                            trending_shows_with_content.extend(shows_with_content)
+                            new_tv_files_written += files_written
+
+                        # Distribute trending into per-instance results so split-mode YMLs include them.
+                        # Monitored items go to their owner's instance bucket; request_needed items have
+                        # no instance owner so they go into every instance bucket.
+                        inst_results_by_name = {r['name']: r for r in tv_instance_results}
+                        for show in trending_tv_monitored:
+                            owner_name = show.get('owner', {}).get('name')
+                            if owner_name and owner_name in inst_results_by_name:
+                                inst_results_by_name[owner_name]['trending_tv_monitored'].append(show)
+                        for show in trending_tv_request_needed:
+                            for r in tv_instance_results:
+                                r['trending_tv_request_needed'].append(show)
+                    else:
+                        trending_tv_monitored = []
+                        trending_tv_request_needed = []
+
+                    # ====================================================================
+                    # TV CLEANUP — runs after the global trending pass so it can see the
+                    # full global trending lists. Instances that share a umtk_root_tv are
+                    # grouped so cleanup considers the union of their libraries; instances
+                    # with distinct (or no) custom roots clean up independently.
+                    # ====================================================================
+                    if cleanup and sonarr_instances_data:
+                        tv_cleanup_groups = {}
+                        tv_cleanup_order = []
+                        for inst in sonarr_instances_data:
+                            # None root → falls back to scanning that instance's series
+                            # paths, which won't collide with other instances. Key it
+                            # uniquely so it stays its own group.
+                            key = inst.get('umtk_root_tv') or f"__solo__:{inst['name']}"
+                            if key not in tv_cleanup_groups:
+                                tv_cleanup_groups[key] = []
+                                tv_cleanup_order.append(key)
+                            tv_cleanup_groups[key].append(inst)
+
+                        for key in tv_cleanup_order:
+                            group = tv_cleanup_groups[key]
+                            if len(sonarr_instances_data) > 1:
+                                header = ", ".join(i['name'] for i in group)
+                                label = "Instance" if len(group) == 1 else "Instances"
+                                print(f"\n{BLUE}--- Cleanup for Sonarr {label}: {header} ---{RESET}")
+                            print(f"\n{BLUE}Checking for TV content to cleanup...{RESET}")
+                            try:
+                                cleanup_tv_content(
+                                    group, tv_method, debug,
+                                    future_days_upcoming_shows, utc_offset, future_only_tv,
+                                    trending_tv_monitored, trending_tv_request_needed
+                                )
+                            except (ConnectionError, requests.exceptions.RequestException) as e:
+                                names = ", ".join(i['name'] for i in group)
+                                print(f"{RED}Cleanup error for Sonarr instance(s) '{names}': {str(e)}{RESET}")
+                                instance_warnings.append(f"Sonarr cleanup '{names}': {str(e)}")
+                            print()
+
+                    # Merge instance results for YML generation and Plex updates
+                    if tv_instance_results:
+                        # Merge shows_with_content for Plex metadata: per-instance buckets +
+                        # the global trending content bucket.
+                        all_shows_with_content = dedupe_by_key(
+                            [r['all_shows_with_content'] for r in tv_instance_results] + [trending_shows_with_content],
+                            'tvdbId'
+                        )
+
+                        # Generate TV YML files
+                        if tv_method > 0 or trending_tv_method > 0:
+                            # Overlay settings shared by the combined and per-instance TV overlay files
+                            tv_overlay_sections = {
+                                "backdrop": config.get("backdrop_upcoming_shows", {}),
+                                "text": config.get("text_upcoming_shows", {}),
+                                "backdrop_aired": config.get("backdrop_upcoming_shows_aired", {}),
+                                "text_aired": config.get("text_upcoming_shows_aired", {}),
+                                "backdrop_trending_request_needed": config.get("backdrop_trending_shows_request_needed", {}),
+                                "text_trending_request_needed": config.get("text_trending_shows_request_needed", {}),
+                            }
+                            if output_mode == 'combined' or len(tv_instance_results) == 1:
+                                merged_future = dedupe_by_key([r['future_shows'] for r in tv_instance_results], 'tvdbId')
+                                merged_aired = dedupe_by_key([r['aired_shows'] for r in tv_instance_results], 'tvdbId')
+                                merged_new = dedupe_by_key([r['new_shows'] for r in tv_instance_results], 'tvdbId')
+
+                                overlay_file = kometa_folder / "UMTK_TV_UPCOMING_SHOWS_OVERLAYS.yml"
+                                collection_file = kometa_folder / "UMTK_TV_UPCOMING_SHOWS_COLLECTION.yml"
+
+                                yaml_writer.submit(
+                                    create_overlay_yaml_tv,
+                                    str(overlay_file), merged_future, merged_aired,
+                                    trending_tv_monitored if trending_tv_method > 0 else [],
+                                    trending_tv_request_needed if trending_tv_method > 0 else [],
+                                    tv_overlay_sections,
                                     config,
                                     localization
                                 )
 
                                 if tv_method > 0:
-                                    new_shows_overlay_file = kometa_folder / f"UMTK_TV_NEW_SHOWS_OVERLAYS{suffix}.yml"
-                                    new_shows_collection_file = kometa_folder / f"UMTK_TV_NEW_SHOWS_COLLECTION{suffix}.yml"
-                                    create_new_shows_overlay_yaml(str(new_shows_overlay_file), result['new_shows'],
-                                                                  {"backdrop": config.get("backdrop_new_show", {}),
-                                                                   "text": config.get("text_new_show", {})})
-                                    create_new_shows_collection_yaml(str(new_shows_collection_file), result['new_shows'], config)
-
-                                create_collection_yaml_tv(str(collection_file), result['future_shows'], result['aired_shows'], config)
-                                print(f"{GREEN}TV YAML files created for instance '{result['name']}'{RESET}")
-
-                    # Create Trending TV collection/overlay YAML (always combined - trending is global)
-                    if trending_tv_method > 0 and mdblist_tv_items:
-                        trending_collection_file = kometa_folder / "UMTK_TV_TRENDING_COLLECTION.yml"
-                        create_trending_collection_yaml_tv(str(trending_collection_file), mdblist_tv_items, config, trending_tv_request_needed)
-                        print(f"{GREEN}Trending TV collection YAML created successfully{RESET}")
-
-                        top10_tv_overlay_file = kometa_folder / "UMTK_TV_TOP10_OVERLAYS.yml"
-                        create_top10_overlay_yaml_tv(
-                            str(top10_tv_overlay_file),
-                            mdblist_tv_items,
-                            {"backdrop": config.get("backdrop_trending_top_10_tv", {}),
-                             "text": config.get("text_trending_top_10_tv", {})},
-                            limit=mdblist_tv_limit
-                        )
-                        print(f"{GREEN}Top 10 TV overlay YAML created successfully{RESET}")
+                                    new_shows_overlay_file = kometa_folder / "UMTK_TV_NEW_SHOWS_OVERLAYS.yml"
+                                    new_shows_collection_file = kometa_folder / "UMTK_TV_NEW_SHOWS_COLLECTION.yml"
+                                    yaml_writer.submit(create_new_shows_overlay_yaml, str(new_shows_overlay_file), merged_new,
+                                                       {"backdrop": config.get("backdrop_new_show", {}),
+                                                        "text": config.get("text_new_show", {})})
+                                    yaml_writer.submit(create_new_shows_collection_yaml, str(new_shows_collection_file), merged_new, config)
+
+                                yaml_writer.submit(create_collection_yaml_tv, str(collection_file), merged_future, merged_aired, config)
+                                yaml_writer.done(f"\n{GREEN}TV YAML files created successfully{RESET}")
+                            else:
+                                # Split mode: per-instance YML files
+                                for result in tv_instance_results:
+                                    suffix = f"_{sanitize_instance_name(result['name'])}"
+
+                                    overlay_file = kometa_folder / f"UMTK_TV_UPCOMING_SHOWS_OVERLAYS{suffix}.yml"
+                                    collection_file = kometa_folder / f"UMTK_TV_UPCOMING_SHOWS_COLLECTION{suffix}.yml"
+
+                                    yaml_writer.submit(
+                                        create_overlay_yaml_tv,
+                                        str(overlay_file), result['future_shows'], result['aired_shows'],
+                                        result['trending_tv_monitored'] if trending_tv_method > 0 else [],
+                                        result['trending_tv_request_needed'] if trending_tv_method > 0 else [],
+                                        tv_overlay_sections,
+                                        config,
+                                        localization
+                                    )
+
+                                    if tv_method > 0:
+                                        new_shows_overlay_file = kometa_folder / f"UMTK_TV_NEW_SHOWS_OVERLAYS{suffix}.yml"
+                                        new_shows_collection_file = kometa_folder / f"UMTK_TV_NEW_SHOWS_COLLECTION{suffix}.yml"
+                                        yaml_writer.submit(create_new_shows_overlay_yaml, str(new_shows_overlay_file), result['new_shows'],
+                                                           {"backdrop": config.get("backdrop_new_show", {}),
+                                                            "text": config.get("text_new_show", {})})
+                                        yaml_writer.submit(create_new_shows_collection_yaml, str(new_shows_collection_file), result['new_shows'], config)
+
+                                    yaml_writer.submit(create_collection_yaml_tv, str(collection_file), result['future_shows'], result['aired_shows'], config)
+                                    yaml_writer.done(f"{GREEN}TV YAML files created for instance '{result['name']}'{RESET}")
+
+                        # Create Trending TV collection/overlay YAML (always combined - trending is global)
+                        if trending_tv_method > 0 and mdblist_tv_items:
+                            trending_collection_file = kometa_folder / "UMTK_TV_TRENDING_COLLECTION.yml"
+                            yaml_writer.submit(create_trending_collection_yaml_tv, str(trending_collection_file), mdblist_tv_items, config, trending_tv_request_needed)
+                            yaml_writer.done(f"{GREEN}Trending TV collection YAML created successfully{RESET}")
+
+                            top10_tv_overlay_file = kometa_folder / "UMTK_TV_TOP10_OVERLAYS.yml"
+                            yaml_writer.submit(
+                                create_top10_overlay_yaml_tv,
+                                str(top10_tv_overlay_file),
+                                mdblist_tv_items,
+                                {"backdrop": config.get("backdrop_trending_top_10_tv", {}),
+                                 "text": config.get("text_trending_top_10_tv", {})},
+                                limit=mdblist_tv_limit
+                            )
+                            yaml_writer.done(f"{GREEN}Top 10 TV overlay YAML created successfully{RESET}")
         
-        # Determine if we need to process Movies at all (either regular or trending)
-        process_movies = (movie_method > 0 or trending_movies_method > 0)
-
-        # Process Movies
-        if process_movies:
-            print(f"\n{BLUE}{'=' * 50}{RESET}")
-            print(f"{BLUE}Processing Movies...{RESET}")
-            print(f"{BLUE}{'=' * 50}{RESET}\n")
-
-            if not radarr_instances:
-                print(f"{ORANGE}No Radarr instances configured. Skipping movie processing.{RESET}")
-            else:
-                movie_instance_results = []
-                # Snapshot of each successfully-connected Radarr instance's data for the
-                # global trending pass and cleanup that runs after the per-instance loop.
-                radarr_instances_data = []
-
-                future_days_upcoming_movies = config.get('future_days_upcoming_movies', 30)
-                past_days_upcoming_movies = config.get('past_days_upcoming_movies', 0)
-                future_only = str(config.get("future_only", "false")).lower() == "true"
-                include_inCinemas = str(config.get("include_inCinemas", "false")).lower() == "true"
-
-                print(f"future_days_upcoming_movies: {future_days_upcoming_movies}")
-                if past_days_upcoming_movies > 0 and not future_only:
-                    print(f"past_days_upcoming_movies: {past_days_upcoming_movies}")
-                print(f"future_only: {future_only}")
-                print(f"include_inCinemas: {include_inCinemas}")
-                print()
-
-                # Fetch MDBList items once (not per-instance)
-                mdblist_movies_limit = config.get('mdblist_movies_limit', 10)
-                if trending_movies_method > 0:
-                    mdblist_api_key = config.get('mdblist_api_key')
-                    mdblist_movies_url = config.get('mdblist_movies')
-                    if mdblist_api_key and mdblist_movies_url:
-                        print(f"{BLUE}Fetching trending movies from MDBList...{RESET}")
-                        mdblist_movies_items = fetch_mdblist_items(mdblist_movies_url, mdblist_api_key, mdblist_movies_limit, debug)
-                        if mdblist_movies_items:
-                            print(f"{GREEN}Fetched {len(mdblist_movies_items)} trending movies from MDBList{RESET}\n")
+            # Process Movies
+            if process_movies:
+                print(f"\n{BLUE}{'=' * 50}{RESET}")
+                print(f"{BLUE}Processing Movies...{RESET}")
+                print(f"{BLUE}{'=' * 50}{RESET}\n")
+
+                if not radarr_instances:
+                    print(f"{ORANGE}No Radarr instances configured. Skipping movie processing.{RESET}")
+                else:
+                    movie_instance_results = []
+                    # Snapshot of each successfully-connected Radarr instance's data for the
+                    # global trending pass and cleanup that runs after the per-instance loop.
+                    radarr_instances_data = []
+
+                    future_days_upcoming_movies = config.get('future_days_upcoming_movies', 30)
+                    past_days_upcoming_movies = config.get('past_days_upcoming_movies', 0)
+                    future_only = str(config.get("future_only", "false")).lower() == "true"
+                    include_inCinemas = str(config.get("include_inCinemas", "false")).lower() == "true"
+
+                    print(f"future_days_upcoming_movies: {future_days_upcoming_movies}")
+                    if past_days_upcoming_movies > 0 and not future_only:
+                        print(f"past_days_upcoming_movies: {past_days_upcoming_movies}")
+                    print(f"future_only: {future_only}")
+                    print(f"include_inCinemas: {include_inCinemas}")
+                    print()
+
+                    # Fetch MDBList items once (not per-instance)
+                    mdblist_movies_limit = config.get('mdblist_movies_limit', 10)
+                    if trending_movies_method > 0:
+                        mdblist_api_key = config.get('mdblist_api_key')
+                        mdblist_movies_url = config.get('mdblist_movies')
+                        if mdblist_api_key and mdblist_movies_url:
+                            print(f"{BLUE}Fetching trending movies from MDBList...{RESET}")
+                            mdblist_movies_items, fetch_log = mdblist_movies_future.result()
+                            print(fetch_log, end='')
+                            if mdblist_movies_items:
+                                print(f"{GREEN}Fetched {len(mdblist_movies_items)} trending movies from MDBList{RESET}\n")
+                            else:
+                                print(f"{ORANGE}No trending movies fetched from MDBList{RESET}\n")
                         else:
-                            print(f"{ORANGE}No trending movies fetched from MDBList{RESET}\n")
-                    else:
-                        if not mdblist_api_key:
-                            print(f"{RED}Error: mdblist_api_key not configured{RESET}")
-                        if not mdblist_movies_url:
-                            print(f"{RED}Error: mdblist_movies not configured{RESET}")
-
-                for instance in radarr_instances:
-                    instance_name = instance.get('name', 'Radarr')
-                    radarr_timeout = int(instance.get('timeout', 90))
-                    umtk_root_movies = _normalize_root(instance.get('umtk_root'))
-
-                    if len(radarr_instances) > 1:
-                        print(f"{BLUE}--- Radarr Instance: {instance_name} ---{RESET}")
-                    if umtk_root_movies:
-                        print(f"{GREEN}Using custom movie root: {umtk_root_movies}{RESET}")
-
-                    try:
-                        radarr_url = process_radarr_url(instance['url'], instance['api_key'], radarr_timeout)
-                        radarr_api_key = instance['api_key']
-
-                        all_movies = get_radarr_movies(radarr_url, radarr_api_key, radarr_timeout)
-
-                        exclude_radarr_tag_names = instance.get('exclude_tags', [])
-                        if isinstance(exclude_radarr_tag_names, str):
-                            exclude_radarr_tag_names = [tag.strip() for tag in exclude_radarr_tag_names.split(',') if tag.strip()]
-
-                        exclude_radarr_tag_ids = get_tag_ids_from_names(radarr_url, radarr_api_key, exclude_radarr_tag_names, radarr_timeout, debug)
-
-                        if debug and exclude_radarr_tag_names:
-                            print(f"{BLUE}[DEBUG] Exclude Radarr tags: {exclude_radarr_tag_names} -> IDs: {exclude_radarr_tag_ids}{RESET}")
-                        if exclude_radarr_tag_names:
-                            print(f"exclude_radarr_tags: {', '.join(exclude_radarr_tag_names)}")
-
-                        # Register this instance for the global trending pass + cleanup pass.
-                        radarr_instances_data.append({
-                            'name': instance_name,
-                            'url': radarr_url,
-                            'api_key': radarr_api_key,
-                            'timeout': radarr_timeout,
-                            'all_movies': all_movies,
-                            'exclude_tag_ids': exclude_radarr_tag_ids,
-                            'umtk_root_movies': umtk_root_movies,
-                        })
-
-                        future_movies = []
-                        released_movies = []
-                        inst_movies_with_content = []
-
-                        if movie_method > 0:
-                            print(f"{BLUE}Finding upcoming movies...{RESET}")
-                            future_movies, released_movies = find_upcoming_movies(
-                                all_movies, radarr_url, radarr_api_key, future_days_upcoming_movies, utc_offset, future_only, include_inCinemas, debug, exclude_radarr_tag_ids, past_days_upcoming_movies
-                            )
+                            if not mdblist_api_key:
+                                print(f"{RED}Error: mdblist_api_key not configured{RESET}")
+                            if not mdblist_movies_url:
+                                print(f"{RED}Error: mdblist_movies not configured{RESET}")
+
+                    for instance in radarr_instances:
+                        instance_name = instance.get('name', 'Radarr')
+                        radarr_timeout = int(instance.get('timeout', 90))
+                        umtk_root_movies = _normalize_root(instance.get('umtk_root'))
 
-                            if future_movies:
-                                print(f"{GREEN}Found {len(future_movies)} future movies releasing within {future_days_upcoming_movies} days:{RESET}")
-                                for movie in future_movies:
-                                    release_info = f" - {movie['releaseType']} Release: {movie['releaseDate']}"
-                                    print(f"- {movie['title']}" + (f" ({movie['year']})" if movie['year'] else "") + release_info)
-                            else:
-                                print(f"{ORANGE}No future movies found releasing within {future_days_upcoming_movies} days.{RESET}")
-
-                            if released_movies:
-                                print(f"\n{GREEN}Found {len(released_movies)} released movies not yet available:{RESET}")
-                                for movie in released_movies:
-                                    release_info = f" - {movie['releaseType']} Released: {movie['releaseDate']}"
-                                    print(f"- {movie['title']}" + (f" ({movie['year']})" if movie['year'] else "") + release_info)
-                            elif not future_only:
-                                print(f"{ORANGE}No released movies found that are not yet available.{RESET}")
-
-                            # Process movie content based on method
-                            all_movies_to_process = future_movies + released_movies
-                            if all_movies_to_process:
-                                print(f"\n{BLUE}Processing content for movies...{RESET}")
-                                successful = 0
-                                failed = 0
-                                fallback_used = 0
-                                skipped_existing = 0
-
-                                for movie in all_movies_to_process:
-                                    print(f"\nProcessing: {movie['title']}")
-
-                                    movie_path = movie.get('path')
-                                    content_exists = False
-
-                                    if movie_path or umtk_root_movies:
-                                        movie_title = movie.get('title', 'Unknown')
-                                        movie_year = movie.get('year', '')
-
-                                        for check_edition in ["Coming Soon", "Trending"]:
-                                            check_folder = sanitize_filename(f"{movie_title} ({movie_year}) {{edition-{check_edition}}}")
-
-                                            if umtk_root_movies:
-                                                check_path = Path(umtk_root_movies) / check_folder
-                                            elif movie_path:
-                                                base_path = Path(movie_path)
-                                                parent_dir = base_path.parent
-                                                check_path = parent_dir / check_folder
-                                            else:
-                                                check_path = None
-
-                                            if check_path and check_path.exists():
-                                                existing_files = list(check_path.glob(f"*{{edition-{check_edition}}}.*"))
-                                                if existing_files:
-                                                    existing_file = existing_files[0]
-                                                    print(f"{GREEN}Content already exists for {movie['title']}: {existing_file.name} - skipping{RESET}")
-                                                    skipped_existing += 1
-                                                    successful += 1
-                                                    inst_movies_with_content.append(movie)
-                                                    content_exists = True
-                                                    break
-
-                                    if content_exists:
-                                        continue
-
-                                    success = False
-
-                                    if movie_method == 1:  # Trailer
-                                        trailer_info = search_trailer_on_youtube(
-                                            movie['title'],
-                                            movie.get('year'),
-                                            movie.get('imdbId'),
-                                            debug,
-                                            skip_channels,
-                                            preferred_language=preferred_language,
-                                        )
-
-                                        if trailer_info:
-                                            print(f"Found trailer: {trailer_info['video_title']} ({trailer_info['duration']}) by {trailer_info['uploader']}")
-                                            success = download_trailer_movie(movie, trailer_info, debug, umtk_root_movies, is_trending=False)
-                                        else:
-                                            print(f"{ORANGE}No suitable trailer found for {movie['title']}{RESET}")
-
-                                        if not success and method_fallback:
-                                            print(f"{ORANGE}Trailer method failed, attempting fallback to placeholder method...{RESET}")
-                                            success = create_placeholder_movie(movie, debug, umtk_root_movies, is_trending=False)
-                                            if success:
-                                                fallback_used += 1
-                                                print(f"{GREEN}Fallback to placeholder successful for {movie['title']}{RESET}")
-
-                                    elif movie_method == 2:  # Placeholder
-                                        success = create_placeholder_movie(movie, debug, umtk_root_movies, is_trending=False)
-
-                                    if success:
-                                        successful += 1
-                                        new_movie_files_written += 1
-                                        inst_movies_with_content.append(movie)
-                                    else:
-                                        failed += 1
-
-                                print(f"\n{GREEN}Movie content processing summary:{RESET}")
-                                print(f"Successful: {successful}")
-                                print(f"Skipped (already exist): {skipped_existing}")
-                                if fallback_used > 0:
-                                    print(f"Fallback used: {fallback_used}")
-                                print(f"Failed: {failed}")
-
-                        # NOTE: Trending processing and cleanup moved out of this loop —
-                        # they run once globally after every instance has been visited so
-                        # that trending decisions consider all instances' libraries combined.
-
-                        movie_instance_results.append({
-                            'name': instance_name,
-                            'future_movies': future_movies,
-                            'released_movies': released_movies,
-                            # Trending fields are populated after the per-instance loop by the
-                            # global trending pass.
-                            'trending_movies_monitored': [],
-                            'trending_movies_request_needed': [],
-                            'all_movies_with_content': inst_movies_with_content,
-                        })
-
-                    except (ConnectionError, requests.exceptions.RequestException) as e:
-                        print(f"{RED}Error with Radarr instance '{instance_name}': {str(e)}{RESET}")
-                        instance_warnings.append(f"Radarr instance '{instance_name}': {str(e)}")
                         if len(radarr_instances) > 1:
-                            print(f"{ORANGE}Continuing with next instance...{RESET}")
-
-                # ====================================================================
-                # GLOBAL TRENDING PASS — runs once across all Radarr instances combined
-                # ====================================================================
-                trending_movies_with_content = []
-                if (trending_movies_method > 0 and mdblist_movies_items
-                        and radarr_instances_data):
-                    print(f"\n{BLUE}{'=' * 50}{RESET}")
-                    print(f"{BLUE}Processing Trending Movies (across all Radarr instances)...{RESET}")
-                    print(f"{BLUE}{'=' * 50}{RESET}")
-
-                    trending_movies_monitored, trending_movies_request_needed = process_trending_movies(
-                        mdblist_movies_items, radarr_instances_data, debug
-                    )
-
-                    if trending_movies_monitored:
-                        print(f"\n{GREEN}Found {len(trending_movies_monitored)} trending movies that are monitored but not available:{RESET}")
-                        for movie in trending_movies_monitored:
-                            owner_name = movie.get('owner', {}).get('name', '?')
-                            print(f"- {movie['title']}" + (f" ({movie['year']})" if movie.get('year') else "") + f"  [owner: {owner_name}]")
-                    else:
-                        print(f"{ORANGE}No trending movies found that are monitored but not available.{RESET}")
+                            print(f"{BLUE}--- Radarr Instance: {instance_name} ---{RESET}")
+                        if umtk_root_movies:
+                            print(f"{GREEN}Using custom movie root: {umtk_root_movies}{RESET}")
 
-                    if trending_movies_request_needed:
-                        print(f"\n{GREEN}Found {len(trending_movies_request_needed)} trending movies that need to be requested:{RESET}")
-                        for movie in trending_movies_request_needed:
-                            print(f"- {movie['title']}" + (f" ({movie['year']})" if movie.get('year') else ""))
-                    else:
-                        print(f"{ORANGE}No trending movies found that need to be requested.{RESET}")
-
-                    all_trending_movies = trending_movies_monitored + trending_movies_request_needed
-                    if all_trending_movies:
-                        print(f"\n{BLUE}Processing content for trending movies...{RESET}")
-                        successful = 0
-                        failed = 0
-                        skipped_existing = 0
-                        fallback_used = 0
-
-                        request_needed_ids = {id(m) for m in trending_movies_request_needed}
-                        radarr_root_by_name = {inst['name']: inst.get('umtk_root_movies') for inst in radarr_instances_data}
-
-                        for movie in all_trending_movies:
-                            print(f"\nProcessing: {movie['title']}")
-
-                            is_request_needed = id(movie) in request_needed_ids
-
-                            # Resolve the root for this trending movie:
-                            #   - owned movies use the owning Radarr instance's root
-                            #   - request_needed movies fall back to trending_root_movies
-                            owner_name = (movie.get('owner') or {}).get('name')
-                            if owner_name and radarr_root_by_name.get(owner_name):
-                                movie_root = radarr_root_by_name[owner_name]
+                        try:
+                            radarr_url = process_radarr_url(instance['url'], instance['api_key'], radarr_timeout)
+                            radarr_api_key = instance['api_key']
+
+                            all_movies = get_radarr_movies(radarr_url, radarr_api_key, radarr_timeout)
+
+                            exclude_radarr_tag_names = split_csv_list(instance.get('exclude_tags', []))
+
+                            if all_movies:
+                                exclude_radarr_tag_ids = get_tag_ids_from_names(radarr_url, radarr_api_key, exclude_radarr_tag_names, radarr_timeout, debug)
                             else:
-                                movie_root = trending_root_movies
-
-                            movie_path = movie.get('path')
-                            content_exists = False
-
-                            if movie_path or movie_root:
-                                movie_title = movie.get('title', 'Unknown')
-                                movie_year = movie.get('year', '')
-
-                                for check_edition in ["Coming Soon", "Trending"]:
-                                    check_folder = sanitize_filename(f"{movie_title} ({movie_year}) {{edition-{check_edition}}}")
-
-                                    if movie_root:
-                                        check_path = Path(movie_root) / check_folder
-                                    elif movie_path:
-                                        base_path = Path(movie_path)
-                                        parent_dir = base_path.parent
-                                        check_path = parent_dir / check_folder
-                                    else:
-                                        check_path = None
-
-                                    if check_path and check_path.exists():
-                                        existing_files = list(check_path.glob(f"*{{edition-{check_edition}}}.*"))
-                                        if existing_files:
-                                            existing_file = existing_files[0]
-                                            print(f"{GREEN}Content already exists for {movie['title']}: {existing_file.name} - skipping{RESET}")
-                                            skipped_existing += 1
-                                            successful += 1
-                                            trending_movies_with_content.append(movie)
-                                            content_exists = True
-                                            break
-
-                            if content_exists:
-                                continue
-
-                            success = False
-
-                            if trending_movies_method == 1:  # Trailer
-                                trailer_info = search_trailer_on_youtube(
-                                    movie['title'],
-                                    movie.get('year'),
-                                    movie.get('imdbId'),
-                                    debug,
-                                    skip_channels,
-                                    preferred_language=preferred_language,
+                                # Nothing to filter by tag or scan for upcoming releases; the
+                                # instance is still registered so trending and cleanup run
+                                print(f"{ORANGE}Radarr instance '{instance_name}' returned no movies{RESET}")
+                                exclude_radarr_tag_ids = []
+
+                            if debug and exclude_radarr_tag_names:
+                                print(f"{BLUE}[DEBUG] Exclude Radarr tags: {exclude_radarr_tag_names} -> IDs: {exclude_radarr_tag_ids}{RESET}")
+                            if exclude_radarr_tag_names:
+                                print(f"exclude_radarr_tags: {', '.join(exclude_radarr_tag_names)}")
+
+                            # Register this instance for the global trending pass + cleanup pass.
+                            radarr_instances_data.append({
+                                'name': instance_name,
+                                'url': radarr_url,
+                                'api_key': radarr_api_key,
+                                'timeout': radarr_timeout,
+                                'all_movies': all_movies,
+                                'exclude_tag_ids': exclude_radarr_tag_ids,
+                                'umtk_root_movies': umtk_root_movies,
+                            })
+
+                            future_movies = []
+                            released_movies = []
+                            inst_movies_with_content = []
+
+                            if movie_method > 0 and all_movies:
+                                print(f"{BLUE}Finding upcoming movies...{RESET}")
+                                future_movies, released_movies = find_upcoming_movies(
+                                    all_movies, radarr_url, radarr_api_key, future_days_upcoming_movies, utc_offset, future_only, include_inCinemas, debug, exclude_radarr_tag_ids, past_days_upcoming_movies
                                 )
 
-                                if trailer_info:
-                                    print(f"Found trailer: {trailer_info['video_title']} ({trailer_info['duration']}) by {trailer_info['uploader']}")
-                                    success = download_trailer_movie(movie, trailer_info, debug, movie_root, is_trending=is_request_needed)
+                                if future_movies:
+                                    print(f"{GREEN}Found {len(future_movies)} future movies releasing within {future_days_upcoming_movies} days:{RESET}")
+                                    for movie in future_movies:
+                                        release_info = f" - {movie['releaseType']} Release: {movie['releaseDate']}"
+                                        print(f"- {movie['title']}" + (f" ({movie['year']})" if movie['year'] else "") + release_info)
                                 else:
-                                    print(f"{ORANGE}No suitable trailer found for {movie['title']}{RESET}")
-
-                                if not success and method_fallback:
-                                    print(f"{ORANGE}Trailer method failed, attempting fallback to placeholder method...{RESET}")
-                                    success = create_placeholder_movie(movie, debug, movie_root, is_trending=is_request_needed)
-                                    if success:
-                                        fallback_used += 1
-                                        print(f"{GREEN}Fallback to placeholder successful for {movie['title']}{RESET}")
-
-                            elif trending_movies_method == 2:  # Placeholder
-                                success = create_placeholder_movie(movie, debug, movie_root, is_trending=is_request_needed)
-
-                            if success:
-                                successful += 1
-                                new_movie_files_written += 1
-                                trending_movies_with_content.append(movie)
-                            else:
-                                failed += 1
-
-                        print(f"\n{GREEN}Trending movie content processing summary:{RESET}")
-                        print(f"Successful: {successful}")
-                        print(f"Skipped (already exist): {skipped_existing}")
-                        if fallback_used > 0:
-                            print(f"Fallback used: {fallback_used}")
-                        print(f"Failed: {failed}")
-
-                    # Distribute trending into per-instance results so split-mode YMLs include them.
-                    inst_results_by_name = {r['name']: r for r in movie_instance_results}
-                    for movie in trending_movies_monitored:
-                        owner_name = movie.get('owner', {}).get('name')
-                        if owner_name and owner_name in inst_results_by_name:
-                            inst_results_by_name[owner_name]['trending_movies_monitored'].append(movie)
-                    for movie in trending_movies_request_needed:
-                        for r in movie_instance_results:
-                            r['trending_movies_request_needed'].append(movie)
-                else:
-                    trending_movies_monitored = []
-                    trending_movies_request_needed = []
-
-                # ====================================================================
-                # MOVIE CLEANUP — runs after the global trending pass so it can see
-                # the full global trending lists. Instances that share a
-                # umtk_root_movies are grouped so cleanup considers the union of their
-                # libraries; instances with distinct (or no) custom roots clean up
-                # independently.
-                # ====================================================================
-                if cleanup and radarr_instances_data:
-                    future_by_instance = {
-                        r['name']: {
-                            'future': r.get('future_movies', []),
-                            'released': r.get('released_movies', []),
-                        }
-                        for r in movie_instance_results
-                    }
-
-                    movie_cleanup_groups = {}
-                    movie_cleanup_order = []
-                    for inst in radarr_instances_data:
-                        key = inst.get('umtk_root_movies') or f"__solo__:{inst['name']}"
-                        if key not in movie_cleanup_groups:
-                            movie_cleanup_groups[key] = []
-                            movie_cleanup_order.append(key)
-                        movie_cleanup_groups[key].append(inst)
-
-                    for key in movie_cleanup_order:
-                        group = movie_cleanup_groups[key]
-                        if len(radarr_instances_data) > 1:
-                            header = ", ".join(i['name'] for i in group)
-                            label = "Instance" if len(group) == 1 else "Instances"
-                            print(f"\n{BLUE}--- Cleanup for Radarr {label}: {header} ---{RESET}")
-                        print(f"\n{BLUE}Checking for movie content to cleanup...{RESET}")
-                        try:
-                            cleanup_movie_content(
-                                group, future_by_instance,
-                                trending_movies_monitored, trending_movies_request_needed,
-                                movie_method, debug
-                            )
+                                    print(f"{ORANGE}No future movies found releasing within {future_days_upcoming_movies} days.{RESET}")
+
+                                if released_movies:
+                                    print(f"\n{GREEN}Found {len(released_movies)} released movies not yet available:{RESET}")
+                                    for movie in released_movies:
+                                        release_info = f" - {movie['releaseType']} Released: {movie['releaseDate']}"
+                                        print(f"- {movie['title']}" + (f" ({movie['year']})" if movie['year'] else "") + release_info)
+                                elif not future_only:
+                                    print(f"{ORANGE}No released movies found that are not yet available.{RESET}")
+
+                                # Process movie content based on method
+                                all_movies_to_process = future_movies + released_movies
+                                if all_movies_to_process:
+                                    print(f"\n{BLUE}Processing content for movies...{RESET}")
+                                    movies_with_content, files_written = _process_movie_batch(
+                                        [(movie, umtk_root_movies, False) for movie in all_movies_to_process],
+                                        movie_method, method_fallback, debug, skip_channels, preferred_language,
+                                        trailer_concurrency, "Movie content processing summary"
+                                    )
+                                    inst_movies_with_content.extend(movies_with_content)
+                                    new_movie_files_written += files_written
+
+                            # NOTE: Trending processing and cleanup moved out of this loop —
+                            # they run once globally after every instance has been visited so
+                            # that trending decisions consider all instances' libraries combined.
+
+                            movie_instance_results.append({
+                                'name': instance_name,
+                                'future_movies': future_movies,
+                                'released_movies': released_movies,
+                                # Trending fields are populated after the per-instance loop by the
+                                # global trending pass.
+                                'trending_movies_monitored': [],
+                                'trending_movies_request_needed': [],
+                                'all_movies_with_content': inst_movies_with_content,
+                            })
+
                         except (ConnectionError, requests.exceptions.RequestException) as e:
-                            names = ", ".join(i['name'] for i in group)
-                            print(f"{RED}Cleanup error for Radarr instance(s) '{names}': {str(e)}{RESET}")
-                            instance_warnings.append(f"Radarr cleanup '{names}': {str(e)}")
-
-                # Merge instance results for YML generation and Plex updates
-                if movie_instance_results:
-                    all_movies_with_content = dedupe_by_key(
-                        [r['all_movies_with_content'] for r in movie_instance_results] + [trending_movies_with_content],
-                        'tmdbId'
-                    )
-
-                    # Generate Movie YML files
-                    if movie_method > 0 or trending_movies_method > 0:
-                        if output_mode == 'combined' or len(movie_instance_results) == 1:
-                            merged_future = dedupe_by_key([r['future_movies'] for r in movie_instance_results], 'tmdbId')
-                            merged_released = dedupe_by_key([r['released_movies'] for r in movie_instance_results], 'tmdbId')
-
-                            overlay_file = kometa_folder / "UMTK_MOVIES_UPCOMING_OVERLAYS.yml"
-                            collection_file = kometa_folder / "UMTK_MOVIES_UPCOMING_COLLECTION.yml"
-
-                            create_overlay_yaml_movies(
-                                str(overlay_file), merged_future, merged_released,
-                                trending_movies_monitored if trending_movies_method > 0 else [],
-                                trending_movies_request_needed if trending_movies_method > 0 else [],
-                                {"backdrop_future": config.get("backdrop_upcoming_movies_future", {}),
-                                 "text_future": config.get("text_upcoming_movies_future", {}),
-                                 "backdrop_released": config.get("backdrop_upcoming_movies_released", {}),
-                                 "text_released": config.get("text_upcoming_movies_released", {}),
-                                 "backdrop_trending_request_needed": config.get("backdrop_trending_movies_request_needed", {}),
-                                 "text_trending_request_needed": config.get("text_trending_movies_request_needed", {})},
-                                config,
-                                localization
-                            )
+                            print(f"{RED}Error with Radarr instance '{instance_name}': {str(e)}{RESET}")
+                            instance_warnings.append(f"Radarr instance '{instance_name}': {str(e)}")
+                            if len(radarr_instances) > 1:
+                                print(f"{ORANGE}Continuing with next instance...{RESET}")
+
+                    # ====================================================================
+                    # GLOBAL TRENDING PASS — runs once across all Radarr instances combined
+                    # ====================================================================
+                    trending_movies_with_content = []
+                    if (trending_movies_method > 0 and mdblist_movies_items
+                            and radarr_instances_data):
+                        print(f"\n{BLUE}{'=' * 50}{RESET}")
+                        print(f"{BLUE}Processing Trending Movies (across all Radarr instances)...{RESET}")
+                        print(f"{BLUE}{'=' * 50}{RESET}")
+
+                        trending_movies_monitored, trending_movies_request_needed = process_trending_movies(
+                            mdblist_movies_items, radarr_instances_data, debug
+                        )
+
+                        if trending_movies_monitored:
+                            print(f"\n{GREEN}Found {len(trending_movies_monitored)} trending movies that are monitored but not available:{RESET}")
+                            for movie in trending_movies_monitored:
+                                owner_name = movie.get('owner', {}).get('name', '?')
+                                print(f"- {movie['title']}" + (f" ({movie['year']})" if movie.get('year') else "") + f"  [owner: {owner_name}]")
+                        else:
+                            print(f"{ORANGE}No trending movies found that are monitored but not available.{RESET}")
 
-                            create_collection_yaml_movies(str(collection_file), merged_future, merged_released, config)
-                            print(f"\n{GREEN}Movie YAML files created successfully{RESET}")
+                        if trending_movies_request_needed:
+                            print(f"\n{GREEN}Found {len(trending_movies_request_needed)} trending movies that need to be requested:{RESET}")
+                            for movie in trending_movies_request_needed:
+                                print(f"- {movie['title']}" + (f" ({movie['year']})" if movie.get('year') else ""))
                         else:
-                            # Split mode: per-instance YML files
-                            for result in movie_instance_results:
-                                suffix = f"_{sanitize_instance_name(result['name'])}"
-
-                                overlay_file = kometa_folder / f"UMTK_MOVIES_UPCOMING_OVERLAYS{suffix}.yml"
-                                collection_file = kometa_folder / f"UMTK_MOVIES_UPCOMING_COLLECTION{suffix}.yml"
-
-                                create_overlay_yaml_movies(
-                                    str(overlay_file), result['future_movies'], result['released_movies'],
-                                    result['trending_movies_monitored'] if trending_movies_method > 0 else [],
-                                    result['trending_movies_request_needed'] if trending_movies_method > 0 else [],
-                                    {"backdrop_future": config.get("backdrop_upcoming_movies_future", {}),
-                                     "text_future": config.get("text_upcoming_movies_future", {}),
-                                     "backdrop_released": config.get("backdrop_upcoming_movies_released", {}),
-                                     "text_released": config.get("text_upcoming_movies_released", {}),
-                                     "backdrop_trending_request_needed": config.get("backdrop_trending_movies_request_needed", {}),
-                                     "text_trending_request_needed": config.get("text_trending_movies_request_needed", {})},
+                            print(f"{ORANGE}No trending movies found that need to be requested.{RESET}")
+
+                        all_trending_movies = trending_movies_monitored + trending_movies_request_needed
+                        if all_trending_movies:
+                            print(f"\n{BLUE}Processing content for trending movies...{RESET}")
+                            request_needed_ids = {id(m) for m in trending_movies_request_needed}
+                            radarr_root_by_name = {inst['name']: inst.get('umtk_root_movies') for inst in radarr_instances_data}
+
+                            trending_jobs = []
+                            for movie in all_trending_movies:
+                                # Resolve the root for this trending movie:
+                                #   - owned movies use the owning Radarr instance's root
+                                #   - request_needed movies fall back to trending_root_movies
+                                owner_name = (movie.get('owner') or {}).get('name')
+                                if owner_name and radarr_root_by_name.get(owner_name):
+                                    movie_root = radarr_root_by_name[owner_name]
+                                else:
+                                    movie_root = trending_root_movies
+                                trending_jobs.append((movie, movie_root, id(movie) in request_needed_ids))
+
+                            movies_with_content, files_written = _process_movie_batch(
+                                trending_jobs, trending_movies_method,
+                                method_fallback, debug, skip_channels, preferred_language,
+                                trailer_concurrency, "Trending movie content processing summary"
+                            )
+                            trending_movies_with_content.extend(movies_with_content)
+                            new_movie_files_written += files_written
+
+                        # Distribute trending into per-instance results so split-mode YMLs include them.
+                        inst_results_by_name = {r['name']: r for r in movie_instance_results}
+                        for movie in trending_movies_monitored:
+                            owner_name = movie.get('owner', {}).get('name')
+                            if owner_name and owner_name in inst_results_by_name:
+                                inst_results_by_name[owner_name]['trending_movies_monitored'].append(movie)
+                        for movie in trending_movies_request_needed:
+                            for r in movie_instance_results:
+                                r['trending_movies_request_needed'].append(movie)
+                    else:
+                        trending_movies_monitored = []
+                        trending_movies_request_needed = []
+
+                    # ====================================================================
+                    # MOVIE CLEANUP — runs after the global trending pass so it can see
+                    # the full global trending lists. Instances that share a
+                    # umtk_root_movies are grouped so cleanup considers the union of their
+                    # libraries; instances with distinct (or no) custom roots clean up
+                    # independently.
+                    # ====================================================================
+                    if cleanup and radarr_instances_data:
+                        future_by_instance = {
+                            r['name']: {
+                                'future': r.get('future_movies', []),
+                                'released': r.get('released_movies', []),
+                            }
+                            for r in movie_instance_results
+                        }
+
+                        movie_cleanup_groups = {}
+                        movie_cleanup_order = []
+                        for inst in radarr_instances_data:
+                            key = inst.get('umtk_root_movies') or f"__solo__:{inst['name']}"
+                            if key not in movie_cleanup_groups:
+                                movie_cleanup_groups[key] = []
+                                movie_cleanup_order.append(key)
+                            movie_cleanup_groups[key].append(inst)
+
+                        for key in movie_cleanup_order:
+                            group = movie_cleanup_groups[key]
+                            if len(radarr_instances_data) > 1:
+                                header = ", ".join(i['name'] for i in group)
+                                label = "Instance" if len(group) == 1 else "Instances"
+                                print(f"\n{BLUE}--- Cleanup for Radarr {label}: {header} ---{RESET}")
+                            print(f"\n{BLUE}Checking for movie content to cleanup...{RESET}")
+                            try:
+                                cleanup_movie_content(
+                                    group, future_by_instance,
+                                    trending_movies_monitored, trending_movies_request_needed,
+                                    movie_method, debug
+                                )
+                            except (ConnectionError, requests.exceptions.RequestException) as e:
+                                names = ", ".join(i['name'] for i in group)
+                                print(f"{RED}Cleanup error for Radarr instance(s) '{names}': {str(e)}{RESET}")
+                                instance_warnings.append(f"Radarr cleanup '{names}': {str(e)}")
+
+                    # Merge instance results for YML generation and Plex updates
+                    if movie_instance_results:
+                        all_movies_with_content = dedupe_by_key(
+                            [r['all_movies_with_content'] for r in movie_instance_results] + [trending_movies_with_content],
+                            'tmdbId'
+                        )
+
+                        # Generate Movie YML files
+                        if movie_method > 0 or trending_movies_method > 0:
+                            # Overlay settings shared by the combined and per-instance movie overlay files
+                            movie_overlay_sections = {
+                                "backdrop_future": config.get("backdrop_upcoming_movies_future", {}),
+                                "text_future": config.get("text_upcoming_movies_future", {}),
+                                "backdrop_released": config.get("backdrop_upcoming_movies_released", {}),
+                                "text_released": config.get("text_upcoming_movies_released", {}),
+                                "backdrop_trending_request_needed": config.get("backdrop_trending_movies_request_needed", {}),
+                                "text_trending_request_needed": config.get("text_trending_movies_request_needed", {}),
+                            }
+                            if output_mode == 'combined' or len(movie_instance_results) == 1:
+                                merged_future = dedupe_by_key([r['future_movies'] for r in movie_instance_results], 'tmdbId')
+                                merged_released = dedupe_by_key([r['released_movies'] for r in movie_instance_results], 'tmdbId')
+
+                                overlay_file = kometa_folder / "UMTK_MOVIES_UPCOMING_OVERLAYS.yml"
+                                collection_file = kometa_folder / "UMTK_MOVIES_UPCOMING_COLLECTION.yml"
+
+                                yaml_writer.submit(
+                                    create_overlay_yaml_movies,
+                                    str(overlay_file), merged_future, merged_released,
+                                    trending_movies_monitored if trending_movies_method > 0 else [],
+                                    trending_movies_request_needed if trending_movies_method > 0 else [],
+                                    movie_overlay_sections,
                                     config,
                                     localization
                                 )
 
-                                create_collection_yaml_movies(str(collection_file), result['future_movies'], result['released_movies'], config)
-                                print(f"{GREEN}Movie YAML files created for instance '{result['name']}'{RESET}")
-
-                    # Create Trending Movies collection/overlay YAML (always combined - trending is global)
-                    if trending_movies_method > 0 and mdblist_movies_items:
-                        trending_collection_file = kometa_folder / "UMTK_MOVIES_TRENDING_COLLECTION.yml"
-                        create_trending_collection_yaml_movies(str(trending_collection_file), mdblist_movies_items, config, trending_movies_request_needed)
-                        print(f"{GREEN}Trending Movies collection YAML created successfully{RESET}")
-
-                        top10_movies_overlay_file = kometa_folder / "UMTK_MOVIES_TOP10_OVERLAYS.yml"
-                        create_top10_overlay_yaml_movies(
-                            str(top10_movies_overlay_file),
-                            mdblist_movies_items,
-                            {"backdrop": config.get("backdrop_trending_top_10_movies", {}),
-                             "text": config.get("text_trending_top_10_movies", {})},
-                            limit=mdblist_movies_limit
-                        )
-                        print(f"{GREEN}Top 10 Movies overlay YAML created successfully{RESET}")
+                                yaml_writer.submit(create_collection_yaml_movies, str(collection_file), merged_future, merged_released, config)
+                                yaml_writer.done(f"\n{GREEN}Movie YAML files created successfully{RESET}")
+                            else:
+                                # Split mode: per-instance YML files
+                                for result in movie_instance_results:
+                                    suffix = f"_{sanitize_instance_name(result['name'])}"
+
+                                    overlay_file = kometa_folder / f"UMTK_MOVIES_UPCOMING_OVERLAYS{suffix}.yml"
+                                    collection_file = kometa_folder / f"UMTK_MOVIES_UPCOMING_COLLECTION{suffix}.yml"
+
+                                    yaml_writer.submit(
+                                        create_overlay_yaml_movies,
+                                        str(overlay_file), result['future_movies'], result['released_movies'],
+                                        result['trending_movies_monitored'] if trending_movies_method > 0 else [],
+                                        result['trending_movies_request_needed'] if trending_movies_method > 0 else [],
+                                        movie_overlay_sections,
+                                        config,
+                                        localization
+                                    )
+
+                                    yaml_writer.submit(create_collection_yaml_movies, str(collection_file), result['future_movies'], result['released_movies'], config)
+                                    yaml_writer.done(f"{GREEN}Movie YAML files created for instance '{result['name']}'{RESET}")
+
+                        # Create Trending Movies collection/overlay YAML (always combined - trending is global)
+                        if trending_movies_method > 0 and mdblist_movies_items:
+                            trending_collection_file = kometa_folder / "UMTK_MOVIES_TRENDING_COLLECTION.yml"
+                            yaml_writer.submit(create_trending_collection_yaml_movies, str(trending_collection_file), mdblist_movies_items, config, trending_movies_request_needed)
+                            yaml_writer.done(f"{GREEN}Trending Movies collection YAML created successfully{RESET}")
+
+                            top10_movies_overlay_file = kometa_folder / "UMTK_MOVIES_TOP10_OVERLAYS.yml"
+                            yaml_writer.submit(
+                                create_top10_overlay_yaml_movies,
+                                str(top10_movies_overlay_file),
+                                mdblist_movies_items,
+                                {"backdrop": config.get("backdrop_trending_top_10_movies", {}),
+                                 "text": config.get("text_trending_top_10_movies", {})},
+                                limit=mdblist_movies_limit
+                            )
+                            yaml_writer.done(f"{GREEN}Top 10 Movies overlay YAML created successfully{RESET}")
         
-        # ============================================================
-        # PLEX LIBRARY SCANS + METADATA UPDATES
-        # ============================================================
-
-        # Trigger Plex library scans first
-        if config.get('plex_library_scan', False) and plex_url and plex_token:
-            print(f"\n{BLUE}{'=' * 50}{RESET}")
-            print(f"{BLUE}Triggering Plex library scans...{RESET}")
-            print(f"{BLUE}{'=' * 50}{RESET}\n")
-            if new_tv_files_written > 0 and tv_libraries:
-                trigger_plex_library_scan(plex_url, plex_token, tv_libraries, 'show', debug)
-            elif debug and tv_libraries:
-                print(f"{ORANGE}[DEBUG] Skipping TV library scan — no new files written this run{RESET}")
-            if new_movie_files_written > 0 and movie_libraries:
-                trigger_plex_library_scan(plex_url, plex_token, movie_libraries, 'movie', debug)
-            elif debug and movie_libraries:
-                print(f"{ORANGE}[DEBUG] Skipping movie library scan — no new files written this run{RESET}")
-
-        # Update Plex TV metadata directly - only if TV processing succeeded
-        if process_tv and not tv_processing_failed and plex_url and plex_token and tv_libraries:
-            print(f"\n{BLUE}{'=' * 50}{RESET}")
-            print(f"{BLUE}Updating TV metadata in Plex...{RESET}")
-            print(f"{BLUE}{'=' * 50}{RESET}\n")
-            update_plex_tv_metadata(
-                plex_url, plex_token, tv_libraries,
-                all_shows_with_content,
-                mdblist_tv_items if trending_tv_method > 0 else None,
-                config, debug, 0, metadata_retry_limit
-            )
-        elif tv_processing_failed and process_tv:
-            print(f"{ORANGE}Skipping Plex TV metadata updates due to earlier Sonarr connection failure{RESET}")
-        elif debug and process_tv:
-            print(f"{ORANGE}[DEBUG] Plex TV metadata updates skipped - missing plex_url, plex_token, or tv_libraries{RESET}")
-
-        # Update Plex movie metadata directly
-        if process_movies and plex_url and plex_token and movie_libraries:
-            print(f"\n{BLUE}{'=' * 50}{RESET}")
-            print(f"{BLUE}Updating movie metadata in Plex...{RESET}")
-            print(f"{BLUE}{'=' * 50}{RESET}\n")
-            update_plex_movie_metadata(
-                plex_url, plex_token, movie_libraries,
-                all_movies_with_content,
-                mdblist_movies_items if trending_movies_method > 0 else None,
-                config, debug, 0, metadata_retry_limit
-            )
-        elif debug and process_movies:
-            print(f"{ORANGE}[DEBUG] Plex movie metadata updates skipped - missing plex_url, plex_token, or movie_libraries{RESET}")
+            # ============================================================
+            # PLEX LIBRARY SCANS + METADATA UPDATES
+            # ============================================================
+
+            # Trigger Plex library scans first
+            if config.get('plex_library_scan', False) and plex_url and plex_token:
+                print(f"\n{BLUE}{'=' * 50}{RESET}")
+                print(f"{BLUE}Triggering Plex library scans...{RESET}")
+                print(f"{BLUE}{'=' * 50}{RESET}\n")
+                if new_tv_files_written > 0 and tv_libraries:
+                    trigger_plex_library_scan(plex_url, plex_token, tv_libraries, 'show', debug)
+                elif debug and tv_libraries:
+                    print(f"{ORANGE}[DEBUG] Skipping TV library scan — no new files written this run{RESET}")
+                if new_movie_files_written > 0 and movie_libraries:
+                    trigger_plex_library_scan(plex_url, plex_token, movie_libraries, 'movie', debug)
+                elif debug and movie_libraries:
+                    print(f"{ORANGE}[DEBUG] Skipping movie library scan — no new files written this run{RESET}")
+
+            # Update Plex TV metadata directly - only if TV processing succeeded
+            if process_tv and not tv_processing_failed and plex_url and plex_token and tv_libraries:
+                print(f"\n{BLUE}{'=' * 50}{RESET}")
+                print(f"{BLUE}Updating TV metadata in Plex...{RESET}")
+                print(f"{BLUE}{'=' * 50}{RESET}\n")
+                update_plex_tv_metadata(
+                    plex_url, plex_token, tv_libraries,
+                    all_shows_with_content,
+                    mdblist_tv_items if trending_tv_method > 0 else None,
+                    config, debug, 0, metadata_retry_limit
+                )
+            elif tv_processing_failed and process_tv:
+                print(f"{ORANGE}Skipping Plex TV metadata updates due to earlier Sonarr connection failure{RESET}")
+            elif debug and process_tv:
+                print(f"{ORANGE}[DEBUG] Plex TV metadata updates skipped - missing plex_url, plex_token, or tv_libraries{RESET}")
+
+            # Update Plex movie metadata directly
+            if process_movies and plex_url and plex_token and movie_libraries:
+                print(f"\n{BLUE}{'=' * 50}{RESET}")
+                print(f"{BLUE}Updating movie metadata in Plex...{RESET}")
+                print(f"{BLUE}{'=' * 50}{RESET}\n")
+                update_plex_movie_metadata(
+                    plex_url, plex_token, movie_libraries,
+                    all_movies_with_content,
+                    mdblist_movies_items if trending_movies_method > 0 else None,
+                    config, debug, 0, metadata_retry_limit
+                )
+            elif debug and process_movies:
+                print(f"{ORANGE}[DEBUG] Plex movie metadata updates skipped - missing plex_url, plex_token, or movie_libraries{RESET}")
+        finally:
+            # Make sure every queued YAML file is on disk (and the pool is shut
+            # down) before the run is reported done, or before an error leaves main()
+            yaml_writer.wait()
 
         # Calculate and display runtime
         end_time = datetime.now()
@@ -4,7 +4,80 @@ MDBList API integration for UMTK
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding when installed
+    orjson = None
+
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
+from .utils import get_http_session, log
+
+# Keys that may hold a flat item list when the response has no movies/shows
+_ITEMS_KEYS = ('items', 'results', 'data')
+
+
+def _response_json(response):
+    """Decode a JSON response body, using orjson when it is available.
+
+    Bodies orjson rejects (e.g. not UTF-8) go through response.json(), so
+    errors and encodings are handled exactly as before.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+
+def _normalize_item(item, debug=False):
+    """MDBList list entry -> UMTK item dict, or None if it has no usable ID"""
+    if not isinstance(item, dict):
+        if debug:
+            log(f"{ORANGE}[DEBUG] Skipping non-dictionary item: {item} (type: {type(item).__name__}){RESET}")
+        return None
+    
+    get = item.get
+    mediatype = get('mediatype')
+    
+    # Settle on the ID first so items that get dropped never build a dict
+    id_key = item_id = None
+    if mediatype == 'movie':
+        # For movies, use 'id' field as TMDB ID
+        id_key, item_id = 'tmdb_id', get('id')
+    elif mediatype == 'show':
+        # For TV shows, prefer tvdb_id but fallback to tmdb_id (from 'id' field)
+        tvdb_id = get('tvdb_id')
+        tmdb_id = get('id')
+        
+        if tvdb_id:
+            id_key, item_id = 'tvdb_id', tvdb_id
+            if debug:
+                log(f"{BLUE}[DEBUG] TV show '{get('title')}' using TVDB ID: {tvdb_id}{RESET}")
+        elif tmdb_id:
+            # Use TMDB ID as fallback
+            id_key, item_id = 'tmdb_id', tmdb_id
+            if debug:
+                log(f"{ORANGE}[DEBUG] TV show '{get('title')}' has no TVDB ID, using TMDB ID: {tmdb_id}{RESET}")
+        else:
+            if debug:
+                log(f"{ORANGE}[DEBUG] TV show '{get('title')}' has no TVDB or TMDB ID{RESET}")
+    
+    # Only keep items that have at least one required ID
+    if not item_id:
+        if debug:
+            log(f"{ORANGE}[DEBUG] Skipping item without required ID: {get('title')} (mediatype: {mediatype}){RESET}")
+        return None
+    
+    # Normalize the item to match expected format
+    return {
+        'title': get('title', 'Unknown'),
+        'year': get('release_year'),
+        'imdb_id': get('imdb_id'),
+        'mediatype': mediatype,
+        'rank': get('rank'),  # Preserve rank
+        id_key: item_id,
+    }
 
 
 def fetch_mdblist_items(mdblist_url, api_key, limit=None, debug=False):
@@ -27,100 +100,53 @@ def fetch_mdblist_items(mdblist_url, api_key, limit=None, debug=False):
         if debug:
             # Redact the API key so logs are safe to share for support
             safe_params = {**params, "apikey": "***REDACTED***"} if "apikey" in params else params
-            print(f"{BLUE}[DEBUG] Fetching from MDBList API: {api_url}{RESET}")
-            print(f"{BLUE}[DEBUG] Params: {safe_params}{RESET}")
+            log(f"{BLUE}[DEBUG] Fetching from MDBList API: {api_url}{RESET}")
+            log(f"{BLUE}[DEBUG] Params: {safe_params}{RESET}")
         
-        response = requests.get(api_url, params=params, timeout=30)
+        response = get_http_session().get(api_url, params=params, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = _response_json(response)
         
         if debug:
-            print(f"{BLUE}[DEBUG] Raw API response type: {type(data)}{RESET}")
-            print(f"{BLUE}[DEBUG] Raw API response keys: {data.keys() if isinstance(data, dict) else 'N/A'}{RESET}")
+            log(f"{BLUE}[DEBUG] Raw API response type: {type(data)}{RESET}")
+            log(f"{BLUE}[DEBUG] Raw API response keys: {data.keys() if isinstance(data, dict) else 'N/A'}{RESET}")
         
-        items = []
         if isinstance(data, list):
             items = data
         elif isinstance(data, dict):
-            if 'movies' in data and isinstance(data['movies'], list):
-                items.extend(data['movies'])
-            if 'shows' in data and isinstance(data['shows'], list):
-                items.extend(data['shows'])
+            movies = data.get('movies')
+            shows = data.get('shows')
+            items = (movies if isinstance(movies, list) else []) + (shows if isinstance(shows, list) else [])
             
             if not items:
-                if 'items' in data:
-                    items = data['items']
-                elif 'results' in data:
-                    items = data['results']
-                elif 'data' in data:
-                    items = data['data']
-                else:
-                    print(f"{RED}Error: MDBList API returned dict but no recognizable items key{RESET}")
+                items_key = next((key for key in _ITEMS_KEYS if key in data), None)
+                if items_key is None:
+                    log(f"{RED}Error: MDBList API returned dict but no recognizable items key{RESET}")
                     if debug:
-                        print(f"{BLUE}[DEBUG] Available keys: {list(data.keys())}{RESET}")
+                        log(f"{BLUE}[DEBUG] Available keys: {list(data.keys())}{RESET}")
                     return []
+                items = data[items_key]
         else:
-            print(f"{RED}Error: MDBList API returned unexpected format: {type(data).__name__}{RESET}")
+            log(f"{RED}Error: MDBList API returned unexpected format: {type(data).__name__}{RESET}")
             return []
         
         if not isinstance(items, list):
-            print(f"{RED}Error: Items from MDBList API is not a list (got {type(items).__name__}){RESET}")
+            log(f"{RED}Error: Items from MDBList API is not a list (got {type(items).__name__}){RESET}")
             return []
         
         if debug:
-            print(f"{BLUE}[DEBUG] Found {len(items)} items{RESET}")
+            log(f"{BLUE}[DEBUG] Found {len(items)} items{RESET}")
             if items:
-                print(f"{BLUE}[DEBUG] First item type: {type(items[0])}{RESET}")
-                print(f"{BLUE}[DEBUG] First item content: {items[0]}{RESET}")
+                log(f"{BLUE}[DEBUG] First item type: {type(items[0])}{RESET}")
+                log(f"{BLUE}[DEBUG] First item content: {items[0]}{RESET}")
         
         # Validate and normalize items
         validated_items = []
         for item in items:
-            if isinstance(item, dict):
-                mediatype = item.get('mediatype')
-                
-                # Normalize the item to match expected format
-                normalized_item = {
-                    'title': item.get('title', 'Unknown'),
-                    'year': item.get('release_year'),
-                    'imdb_id': item.get('imdb_id'),
-                    'mediatype': mediatype,
-                    'rank': item.get('rank')  # Preserve rank
-                }
-                
-                # Handle IDs differently for movies vs TV shows
-                if mediatype == 'movie':
-                    # For movies, use 'id' field as TMDB ID
-                    normalized_item['tmdb_id'] = item.get('id')
-                elif mediatype == 'show':
-                    # For TV shows, prefer tvdb_id but fallback to tmdb_id (from 'id' field)
-                    tvdb_id = item.get('tvdb_id')
-                    tmdb_id = item.get('id')
-                    
-                    if tvdb_id:
-                        normalized_item['tvdb_id'] = tvdb_id
-                        if debug:
-                            print(f"{BLUE}[DEBUG] TV show '{item.get('title')}' using TVDB ID: {tvdb_id}{RESET}")
-                    elif tmdb_id:
-                        # Use TMDB ID as fallback
-                        normalized_item['tmdb_id'] = tmdb_id
-                        if debug:
-                            print(f"{ORANGE}[DEBUG] TV show '{item.get('title')}' has no TVDB ID, using TMDB ID: {tmdb_id}{RESET}")
-                    else:
-                        if debug:
-                            print(f"{ORANGE}[DEBUG] TV show '{item.get('title')}' has no TVDB or TMDB ID{RESET}")
-                
-                # Only add items that have at least one required ID
-                if mediatype == 'movie' and normalized_item.get('tmdb_id'):
-                    validated_items.append(normalized_item)
-                elif mediatype == 'show' and (normalized_item.get('tvdb_id') or normalized_item.get('tmdb_id')):
-                    validated_items.append(normalized_item)
-                elif debug:
-                    print(f"{ORANGE}[DEBUG] Skipping item without required ID: {item.get('title')} (mediatype: {mediatype}){RESET}")
-            else:
-                if debug:
-                    print(f"{ORANGE}[DEBUG] Skipping non-dictionary item: {item} (type: {type(item).__name__}){RESET}")
+            normalized_item = _normalize_item(item, debug)
+            if normalized_item is not None:
+                validated_items.append(normalized_item)
         
         # Normalize ranks
         def _original_rank(it):
@@ -137,23 +163,23 @@ def fetch_mdblist_items(mdblist_url, api_key, limit=None, debug=False):
 
         for position, item in enumerate(ordered_items, start=1):
             if debug:
-                print(f"{BLUE}[DEBUG] Rank normalize: '{item.get('title')}' "
+                log(f"{BLUE}[DEBUG] Rank normalize: '{item.get('title')}' "
                       f"{item.get('rank')} -> {position}{RESET}")
             item['rank'] = position
 
         if debug:
-            print(f"{BLUE}[DEBUG] Validated {len(ordered_items)} items from MDBList{RESET}")
+            log(f"{BLUE}[DEBUG] Validated {len(ordered_items)} items from MDBList{RESET}")
 
         return ordered_items
 
     except requests.exceptions.RequestException as e:
-        print(f"{RED}Error fetching from MDBList: {str(e)}{RESET}")
+        log(f"{RED}Error fetching from MDBList: {str(e)}{RESET}")
         if debug and 'response' in locals():
-            print(f"{RED}Response text: {response.text}{RESET}")
+            log(f"{RED}Response text: {response.text}{RESET}")
         return []
     except Exception as e:
-        print(f"{RED}Unexpected error fetching from MDBList: {str(e)}{RESET}")
+        log(f"{RED}Unexpected error fetching from MDBList: {str(e)}{RESET}")
         if debug:
             import traceback
-            traceback.print_exc()
+            log(traceback.format_exc(), end='')
         return []
\ No newline at end of file
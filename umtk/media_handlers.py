@@ -10,7 +10,7 @@ from pathlib import Path, PureWindowsPath
 from datetime import datetime, timedelta, timezone
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
-from .utils import sanitize_filename, get_user_info, get_file_owner, convert_utc_to_local
+from .utils import log, sanitize_filename, clean_title_for_filename, get_user_info, get_file_owner, convert_utc_to_local
 from .config_loader import get_cookies_path, get_video_folder
 from .sonarr import get_sonarr_episodes
 
@@ -98,9 +98,12 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
     }
 
     if debug:
-        print(f"{BLUE}[DEBUG] Searching for trailers with these terms: {search_terms}{RESET}")
+        log(f"{BLUE}[DEBUG] Searching for trailers with these terms: {search_terms}{RESET}")
         if skip_channels:
-            print(f"{BLUE}[DEBUG] Skip channels: {skip_channels}{RESET}")
+            log(f"{BLUE}[DEBUG] Skip channels: {skip_channels}{RESET}")
+
+    # Lowercase once; each channel still matches as a substring of the uploader
+    skip_channels_lower = tuple(ch.lower() for ch in skip_channels or ())
 
     best = None
     best_score = -1
@@ -109,7 +112,7 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
     for term in search_terms:
         try:
             if debug:
-                print(f"{BLUE}[DEBUG] Trying search term: '{term}'{RESET}")
+                log(f"{BLUE}[DEBUG] Trying search term: '{term}'{RESET}")
 
             ydl_opts = {
                 'quiet': True,
@@ -127,7 +130,7 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
             entries = results.get('entries', []) if results else []
             if not entries:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] No results for '{term}'{RESET}")
+                    log(f"{ORANGE}[DEBUG] No results for '{term}'{RESET}")
                 continue
 
             for info in entries:
@@ -142,8 +145,10 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
                 if not title or not vid:
                     continue
 
-                if skip_channels and any(ch.lower() in up.lower() for ch in skip_channels):
-                    continue
+                if skip_channels_lower:
+                    up_lower = up.lower()
+                    if any(ch in up_lower for ch in skip_channels_lower):
+                        continue
 
                 tl = title.lower()
                 if any(k in tl for k in avoid_keywords):
@@ -154,7 +159,7 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
 
                 if not _title_matches(title, content_title):
                     if debug:
-                        print(f"{ORANGE}[DEBUG] Skipping '{title}' - does not match '{content_title}'{RESET}")
+                        log(f"{ORANGE}[DEBUG] Skipping '{title}' - does not match '{content_title}'{RESET}")
                     continue
 
                 score = 0
@@ -202,7 +207,7 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
                     # Early exit: official channel + "trailer" in title
                     if best_score >= 22:
                         if debug:
-                            print(f"{BLUE}[DEBUG] High-confidence match (score={best_score}), stopping search{RESET}")
+                            log(f"{BLUE}[DEBUG] High-confidence match (score={best_score}), stopping search{RESET}")
                         break
 
             # Early exit from outer loop too
@@ -211,11 +216,11 @@ def search_trailer_on_youtube(content_title, year=None, imdb_id=None, debug=Fals
 
         except Exception as e:
             if debug:
-                print(f"{ORANGE}[DEBUG] Search error: {e}{RESET}")
+                log(f"{ORANGE}[DEBUG] Search error: {e}{RESET}")
             continue
 
     if debug and best:
-        print(f"{GREEN}[DEBUG] Best match: {best}{RESET}")
+        log(f"{GREEN}[DEBUG] Best match: {best}{RESET}")
 
     return best
 
@@ -240,17 +245,17 @@ def download_trailer_tv(show, trailer_info, debug=False, umtk_root_tv=None):
         season_00_path = parent_dir / "Season 00"
     else:
         if not show_path:
-            print(f"{RED}No path found for show: {show.get('title')} and umtk_root_tv not configured{RESET}")
+            log(f"{RED}No path found for show: {show.get('title')} and umtk_root_tv not configured{RESET}")
             return False
         parent_dir = Path(show_path)
         season_00_path = parent_dir / "Season 00"
     
     if debug:
-        print(f"{BLUE}[DEBUG] Show path from Sonarr: {show_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
-        print(f"{BLUE}[DEBUG] Season 00 path: {season_00_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Show path from Sonarr: {show_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
+        log(f"{BLUE}[DEBUG] Season 00 path: {season_00_path}{RESET}")
         if umtk_root_tv:
-            print(f"{BLUE}[DEBUG] Using custom umtk_root_tv: {umtk_root_tv}{RESET}")
+            log(f"{BLUE}[DEBUG] Using custom umtk_root_tv: {umtk_root_tv}{RESET}")
         
     # Create parent directory if it doesn't exist
     if not parent_dir.exists():
@@ -259,19 +264,19 @@ def download_trailer_tv(show, trailer_info, debug=False, umtk_root_tv=None):
             try:
                 os.chmod(parent_dir, 0o775)
                 if debug:
-                    print(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
-                    print(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
             except Exception as perm_error:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         except Exception as e:
-            print(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
+            log(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
             return False
     
     if not os.access(parent_dir, os.W_OK):
-        print(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
-        print(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
-        print(f"{RED}Current user: {get_user_info()}{RESET}")
+        log(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
+        log(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
+        log(f"{RED}Current user: {get_user_info()}{RESET}")
         return False
     
     try:
@@ -279,20 +284,20 @@ def download_trailer_tv(show, trailer_info, debug=False, umtk_root_tv=None):
         try:
             os.chmod(season_00_path, 0o775)
             if debug:
-                print(f"{BLUE}[DEBUG] Set permissions 775 on {season_00_path}{RESET}")
+                log(f"{BLUE}[DEBUG] Set permissions 775 on {season_00_path}{RESET}")
         except Exception as perm_error:
             if debug:
-                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         
     except PermissionError as e:
-        print(f"{RED}Permission error creating directory {season_00_path}: {e}{RESET}")
-        print(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
+        log(f"{RED}Permission error creating directory {season_00_path}: {e}{RESET}")
+        log(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
         return False
     except Exception as e:
-        print(f"{RED}Error creating directory {season_00_path}: {e}{RESET}")
+        log(f"{RED}Error creating directory {season_00_path}: {e}{RESET}")
         return False
 
-    clean_title = "".join(c for c in show['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    clean_title = clean_title_for_filename(show['title'])
     filename = f"{clean_title}.S00E00.Trailer.%(ext)s"
     output_path = season_00_path / filename
 
@@ -317,21 +322,21 @@ def download_trailer_tv(show, trailer_info, debug=False, umtk_root_tv=None):
             if cookies_path:
                 ydl_opts['cookiefile'] = cookies_path
                 if debug:
-                    print(f"{BLUE}[DEBUG] Using cookies file: {cookies_path}{RESET}")
+                    log(f"{BLUE}[DEBUG] Using cookies file: {cookies_path}{RESET}")
 
             if debug:
-                print(f"{BLUE}[DEBUG] yt-dlp opts (format): {format_string}{RESET}")
-                print(f"{BLUE}[DEBUG] URL: {trailer_info['url']}{RESET}")
+                log(f"{BLUE}[DEBUG] yt-dlp opts (format): {format_string}{RESET}")
+                log(f"{BLUE}[DEBUG] URL: {trailer_info['url']}{RESET}")
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([trailer_info['url']])
 
-        print(f"Downloading trailer for {show['title']} (prefer 1080p MKV/MP4)...")
+        log(f"Downloading trailer for {show['title']} (prefer 1080p MKV/MP4)...")
 
         try:
             _run('bestvideo[height=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height=1080]+bestaudio/best[height=1080]')
         except Exception as e1:
             if debug:
-                print(f"{ORANGE}[DEBUG] 1080p exact failed ({e1}); trying best <=1080p{RESET}")
+                log(f"{ORANGE}[DEBUG] 1080p exact failed ({e1}); trying best <=1080p{RESET}")
             _run('bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]')
 
         downloaded_files = list(season_00_path.glob(f"{clean_title}.S00E00.Trailer.*"))
@@ -341,32 +346,32 @@ def download_trailer_tv(show, trailer_info, debug=False, umtk_root_tv=None):
             try:
                 os.chmod(downloaded_file, 0o664)
                 if debug:
-                    print(f"{BLUE}[DEBUG] Set permissions 664 on {downloaded_file}{RESET}")
+                    log(f"{BLUE}[DEBUG] Set permissions 664 on {downloaded_file}{RESET}")
             except Exception as perm_error:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
             
             size_mb = downloaded_file.stat().st_size / (1024 * 1024)
-            print(f"{GREEN}Successfully downloaded trailer for {show['title']}: {downloaded_file.name} ({size_mb:.1f} MB){RESET}")
+            log(f"{GREEN}Successfully downloaded trailer for {show['title']}: {downloaded_file.name} ({size_mb:.1f} MB){RESET}")
             
             if show.get('is_trending', False):
                 marker_file = season_00_path / ".trending"
                 try:
                     marker_file.touch()
                     if debug:
-                        print(f"{BLUE}[DEBUG] Created trending marker file: {marker_file}{RESET}")
+                        log(f"{BLUE}[DEBUG] Created trending marker file: {marker_file}{RESET}")
                 except Exception as e:
                     if debug:
-                        print(f"{ORANGE}[DEBUG] Could not create trending marker: {e}{RESET}")
+                        log(f"{ORANGE}[DEBUG] Could not create trending marker: {e}{RESET}")
             
             show['used_trailer'] = True
             return True
 
-        print(f"{RED}Trailer file not found after download for {show['title']}{RESET}")
+        log(f"{RED}Trailer file not found after download for {show['title']}{RESET}")
         return False
 
     except Exception as e:
-        print(f"{RED}Download error for {show['title']}: {e}{RESET}")
+        log(f"{RED}Download error for {show['title']}: {e}{RESET}")
         return False
 
 
@@ -385,13 +390,13 @@ def download_trailer_movie(movie, trailer_info, debug=False, umtk_root_movies=No
     
     if not movie_path:
         if not umtk_root_movies:
-            print(f"{RED}No path found for movie: {movie.get('title')} and umtk_root_movies not configured{RESET}")
+            log(f"{RED}No path found for movie: {movie.get('title')} and umtk_root_movies not configured{RESET}")
             return False
         
         parent_dir = Path(umtk_root_movies)
         target_path = parent_dir / folder_name
         if debug:
-            print(f"{BLUE}[DEBUG] Created path for trending movie: {target_path}{RESET}")
+            log(f"{BLUE}[DEBUG] Created path for trending movie: {target_path}{RESET}")
     elif umtk_root_movies:
         parent_dir = Path(umtk_root_movies)
         target_path = parent_dir / folder_name
@@ -401,12 +406,12 @@ def download_trailer_movie(movie, trailer_info, debug=False, umtk_root_movies=No
         target_path = parent_dir / folder_name
     
     if debug:
-        print(f"{BLUE}[DEBUG] Movie path from Radarr: {movie_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
-        print(f"{BLUE}[DEBUG] Target path: {target_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Edition tag: {edition_tag}{RESET}")
+        log(f"{BLUE}[DEBUG] Movie path from Radarr: {movie_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
+        log(f"{BLUE}[DEBUG] Target path: {target_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Edition tag: {edition_tag}{RESET}")
         if umtk_root_movies:
-            print(f"{BLUE}[DEBUG] Using custom umtk_root_movies: {umtk_root_movies}{RESET}")
+            log(f"{BLUE}[DEBUG] Using custom umtk_root_movies: {umtk_root_movies}{RESET}")
 
     if not parent_dir.exists():
         try:
@@ -414,19 +419,19 @@ def download_trailer_movie(movie, trailer_info, debug=False, umtk_root_movies=No
             try:
                 os.chmod(parent_dir, 0o775)
                 if debug:
-                    print(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
-                    print(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
             except Exception as perm_error:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         except Exception as e:
-            print(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
+            log(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
             return False
     
     if not os.access(parent_dir, os.W_OK):
-        print(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
-        print(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
-        print(f"{RED}Current user: {get_user_info()}{RESET}")
+        log(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
+        log(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
+        log(f"{RED}Current user: {get_user_info()}{RESET}")
         return False
     
     try:
@@ -435,17 +440,17 @@ def download_trailer_movie(movie, trailer_info, debug=False, umtk_root_movies=No
         try:
             os.chmod(target_path, 0o775)
             if debug:
-                print(f"{BLUE}[DEBUG] Set permissions 775 on {target_path}{RESET}")
+                log(f"{BLUE}[DEBUG] Set permissions 775 on {target_path}{RESET}")
         except Exception as perm_error:
             if debug:
-                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         
     except PermissionError as e:
-        print(f"{RED}Permission error creating directory {target_path}: {e}{RESET}")
-        print(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
+        log(f"{RED}Permission error creating directory {target_path}: {e}{RESET}")
+        log(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
         return False
     except Exception as e:
-        print(f"{RED}Error creating directory {target_path}: {e}{RESET}")
+        log(f"{RED}Error creating directory {target_path}: {e}{RESET}")
         return False
 
     filename = f"{file_name}.%(ext)s"
@@ -472,21 +477,21 @@ def download_trailer_movie(movie, trailer_info, debug=False, umtk_root_movies=No
             if cookies_path:
                 ydl_opts['cookiefile'] = cookies_path
                 if debug:
-                    print(f"{BLUE}[DEBUG] Using cookies file: {cookies_path}{RESET}")
+                    log(f"{BLUE}[DEBUG] Using cookies file: {cookies_path}{RESET}")
 
             if debug:
-                print(f"{BLUE}[DEBUG] yt-dlp opts (format): {format_string}{RESET}")
-                print(f"{BLUE}[DEBUG] URL: {trailer_info['url']}{RESET}")
+                log(f"{BLUE}[DEBUG] yt-dlp opts (format): {format_string}{RESET}")
+                log(f"{BLUE}[DEBUG] URL: {trailer_info['url']}{RESET}")
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([trailer_info['url']])
 
-        print(f"Downloading trailer for {movie['title']} (prefer 1080p MKV/MP4)...")
+        log(f"Downloading trailer for {movie['title']} (prefer 1080p MKV/MP4)...")
 
         try:
             _run('bestvideo[height=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height=1080]+bestaudio/best[height=1080]')
         except Exception as e1:
             if debug:
-                print(f"{ORANGE}[DEBUG] 1080p exact failed ({e1}); trying best <=1080p{RESET}")
+                log(f"{ORANGE}[DEBUG] 1080p exact failed ({e1}); trying best <=1080p{RESET}")
             _run('bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]')
 
         downloaded_files = list(target_path.glob(f"{file_name}.*"))
@@ -496,34 +501,51 @@ def download_trailer_movie(movie, trailer_info, debug=False, umtk_root_movies=No
             try:
                 os.chmod(downloaded_file, 0o664)
                 if debug:
-                    print(f"{BLUE}[DEBUG] Set permissions 664 on {downloaded_file}{RESET}")
+                    log(f"{BLUE}[DEBUG] Set permissions 664 on {downloaded_file}{RESET}")
             except Exception as perm_error:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
             
             size_mb = downloaded_file.stat().st_size / (1024 * 1024)
-            print(f"{GREEN}Successfully downloaded trailer for {movie['title']}: {downloaded_file.name} ({size_mb:.1f} MB){RESET}")
+            log(f"{GREEN}Successfully downloaded trailer for {movie['title']}: {downloaded_file.name} ({size_mb:.1f} MB){RESET}")
             return True
 
-        print(f"{RED}Trailer file not found after download for {movie['title']}{RESET}")
+        log(f"{RED}Trailer file not found after download for {movie['title']}{RESET}")
         return False
 
     except Exception as e:
-        print(f"{RED}Download error for {movie['title']}: {e}{RESET}")
+        log(f"{RED}Download error for {movie['title']}: {e}{RESET}")
         return False
 
 
+def _placeholder_source(video_folder):
+    """
+    First 'UMTK.*' file in the video folder, or None.
+
+    One early-exit directory scan per placeholder instead of a glob that
+    lists (and matches against) the whole folder.
+    """
+    prefix = os.path.normcase('UMTK.')
+    try:
+        with os.scandir(video_folder) as entries:
+            for entry in entries:
+                if os.path.normcase(entry.name).startswith(prefix):
+                    return Path(entry.path)
+    except OSError:
+        pass
+    return None
+
+
 def create_placeholder_tv(show, debug=False, umtk_root_tv=None):
     """Create placeholder video for TV show"""
     video_folder = get_video_folder()
     
-    source_files = list(video_folder.glob('UMTK.*'))
+    source_file = _placeholder_source(video_folder)
     
-    if not source_files:
-        print(f"{RED}No UMTK video file found in video folder{RESET}")
+    if source_file is None:
+        log(f"{RED}No UMTK video file found in video folder{RESET}")
         return False
     
-    source_file = source_files[0]
     video_extension = source_file.suffix
     
     show_path = show.get('path')
@@ -543,25 +565,25 @@ def create_placeholder_tv(show, debug=False, umtk_root_tv=None):
         season_00_path = parent_dir / "Season 00"
     else:
         if not show_path:
-            print(f"{RED}No path found for show: {show.get('title')} and umtk_root_tv not configured{RESET}")
+            log(f"{RED}No path found for show: {show.get('title')} and umtk_root_tv not configured{RESET}")
             return False
         parent_dir = Path(show_path)
         season_00_path = parent_dir / "Season 00"
         
-    clean_title = "".join(c for c in show['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    clean_title = clean_title_for_filename(show['title'])
     dest_file = season_00_path / f"{clean_title}.S00E00.Coming.Soon{video_extension}"
     
     if debug:
-        print(f"{BLUE}[DEBUG] Show path from Sonarr: {show_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
-        print(f"{BLUE}[DEBUG] Season 00 path: {season_00_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Destination file: {dest_file}{RESET}")
+        log(f"{BLUE}[DEBUG] Show path from Sonarr: {show_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
+        log(f"{BLUE}[DEBUG] Season 00 path: {season_00_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Destination file: {dest_file}{RESET}")
         if umtk_root_tv:
-            print(f"{BLUE}[DEBUG] Using custom umtk_root_tv: {umtk_root_tv}{RESET}")
+            log(f"{BLUE}[DEBUG] Using custom umtk_root_tv: {umtk_root_tv}{RESET}")
     
     if dest_file.exists():
         if debug:
-            print(f"{ORANGE}[DEBUG] Placeholder file already exists for {show['title']}: {dest_file}{RESET}")
+            log(f"{ORANGE}[DEBUG] Placeholder file already exists for {show['title']}: {dest_file}{RESET}")
         show['used_trailer'] = False
         return True
     
@@ -571,19 +593,19 @@ def create_placeholder_tv(show, debug=False, umtk_root_tv=None):
             try:
                 os.chmod(parent_dir, 0o775)
                 if debug:
-                    print(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
-                    print(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
             except Exception as perm_error:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         except Exception as e:
-            print(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
+            log(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
             return False
     
     if not os.access(parent_dir, os.W_OK):
-        print(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
-        print(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
-        print(f"{RED}Current user: {get_user_info()}{RESET}")
+        log(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
+        log(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
+        log(f"{RED}Current user: {get_user_info()}{RESET}")
         return False
         
     try:
@@ -592,17 +614,17 @@ def create_placeholder_tv(show, debug=False, umtk_root_tv=None):
         try:
             os.chmod(season_00_path, 0o775)
             if debug:
-                print(f"{BLUE}[DEBUG] Set permissions 775 on {season_00_path}{RESET}")
+                log(f"{BLUE}[DEBUG] Set permissions 775 on {season_00_path}{RESET}")
         except Exception as perm_error:
             if debug:
-                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         
     except PermissionError as e:
-        print(f"{RED}Permission error creating directory {season_00_path}: {e}{RESET}")
-        print(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
+        log(f"{RED}Permission error creating directory {season_00_path}: {e}{RESET}")
+        log(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
         return False
     except Exception as e:
-        print(f"{RED}Error creating directory {season_00_path}: {e}{RESET}")
+        log(f"{RED}Error creating directory {season_00_path}: {e}{RESET}")
         return False
     
     try:
@@ -611,28 +633,28 @@ def create_placeholder_tv(show, debug=False, umtk_root_tv=None):
         try:
             os.chmod(dest_file, 0o664)
             if debug:
-                print(f"{BLUE}[DEBUG] Set permissions 664 on {dest_file}{RESET}")
+                log(f"{BLUE}[DEBUG] Set permissions 664 on {dest_file}{RESET}")
         except Exception as perm_error:
             if debug:
-                print(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
+                log(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
         
         size_mb = dest_file.stat().st_size / (1024 * 1024)
-        print(f"{GREEN}Created placeholder for {show['title']}: {dest_file.name} ({size_mb:.1f} MB){RESET}")
+        log(f"{GREEN}Created placeholder for {show['title']}: {dest_file.name} ({size_mb:.1f} MB){RESET}")
         
         if show.get('is_trending', False):
             marker_file = season_00_path / ".trending"
             try:
                 marker_file.touch()
                 if debug:
-                    print(f"{BLUE}[DEBUG] Created trending marker file: {marker_file}{RESET}")
+                    log(f"{BLUE}[DEBUG] Created trending marker file: {marker_file}{RESET}")
             except Exception as e:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not create trending marker: {e}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not create trending marker: {e}{RESET}")
         
         show['used_trailer'] = False
         return True
     except Exception as e:
-        print(f"{RED}Error creating placeholder for {show['title']}: {e}{RESET}")
+        log(f"{RED}Error creating placeholder for {show['title']}: {e}{RESET}")
         return False
 
 
@@ -640,13 +662,12 @@ def create_placeholder_movie(movie, debug=False, umtk_root_movies=None, is_trend
     """Create placeholder video for movie"""
     video_folder = get_video_folder()
     
-    source_files = list(video_folder.glob('UMTK.*'))
+    source_file = _placeholder_source(video_folder)
     
-    if not source_files:
-        print(f"{RED}No UMTK video file found in video folder{RESET}")
+    if source_file is None:
+        log(f"{RED}No UMTK video file found in video folder{RESET}")
         return False
     
-    source_file = source_files[0]
     video_extension = source_file.suffix
     
     movie_path = movie.get('path')
@@ -662,13 +683,13 @@ def create_placeholder_movie(movie, debug=False, umtk_root_movies=None, is_trend
     
     if not movie_path:
         if not umtk_root_movies:
-            print(f"{RED}No path found for movie: {movie.get('title')} and umtk_root_movies not configured{RESET}")
+            log(f"{RED}No path found for movie: {movie.get('title')} and umtk_root_movies not configured{RESET}")
             return False
         
         parent_dir = Path(umtk_root_movies)
         target_path = parent_dir / folder_name
         if debug:
-            print(f"{BLUE}[DEBUG] Created path for trending movie: {target_path}{RESET}")
+            log(f"{BLUE}[DEBUG] Created path for trending movie: {target_path}{RESET}")
     elif umtk_root_movies:
         parent_dir = Path(umtk_root_movies)
         target_path = parent_dir / folder_name
@@ -680,13 +701,13 @@ def create_placeholder_movie(movie, debug=False, umtk_root_movies=None, is_trend
     dest_file = target_path / f"{file_name}{video_extension}"
     
     if debug:
-        print(f"{BLUE}[DEBUG] Movie path from Radarr: {movie_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
-        print(f"{BLUE}[DEBUG] Target path: {target_path}{RESET}")
-        print(f"{BLUE}[DEBUG] Destination file: {dest_file}{RESET}")
-        print(f"{BLUE}[DEBUG] Edition tag: {edition_tag}{RESET}")
+        log(f"{BLUE}[DEBUG] Movie path from Radarr: {movie_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Parent directory: {parent_dir}{RESET}")
+        log(f"{BLUE}[DEBUG] Target path: {target_path}{RESET}")
+        log(f"{BLUE}[DEBUG] Destination file: {dest_file}{RESET}")
+        log(f"{BLUE}[DEBUG] Edition tag: {edition_tag}{RESET}")
         if umtk_root_movies:
-            print(f"{BLUE}[DEBUG] Using custom umtk_root_movies: {umtk_root_movies}{RESET}")
+            log(f"{BLUE}[DEBUG] Using custom umtk_root_movies: {umtk_root_movies}{RESET}")
 
     if not parent_dir.exists():
         try:
@@ -694,24 +715,24 @@ def create_placeholder_movie(movie, debug=False, umtk_root_movies=None, is_trend
             try:
                 os.chmod(parent_dir, 0o775)
                 if debug:
-                    print(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
-                    print(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Created parent directory: {parent_dir}{RESET}")
+                    log(f"{BLUE}[DEBUG] Set permissions 775 on {parent_dir}{RESET}")
             except Exception as perm_error:
                 if debug:
-                    print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                    log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         except Exception as e:
-            print(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
+            log(f"{RED}Error creating parent directory {parent_dir}: {e}{RESET}")
             return False
     
     if not os.access(parent_dir, os.W_OK):
-        print(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
-        print(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
-        print(f"{RED}Current user: {get_user_info()}{RESET}")
+        log(f"{RED}Error: No write permission for directory: {parent_dir}{RESET}")
+        log(f"{RED}Directory owner: {get_file_owner(parent_dir)}{RESET}")
+        log(f"{RED}Current user: {get_user_info()}{RESET}")
         return False
 
     if dest_file.exists():
         if debug:
-            print(f"{ORANGE}[DEBUG] Placeholder file already exists for {movie['title']}{RESET}")
+            log(f"{ORANGE}[DEBUG] Placeholder file already exists for {movie['title']}{RESET}")
         return True
     
     try:
@@ -720,17 +741,17 @@ def create_placeholder_movie(movie, debug=False, umtk_root_movies=None, is_trend
         try:
             os.chmod(target_path, 0o775)
             if debug:
-                print(f"{BLUE}[DEBUG] Set permissions 775 on {target_path}{RESET}")
+                log(f"{BLUE}[DEBUG] Set permissions 775 on {target_path}{RESET}")
         except Exception as perm_error:
             if debug:
-                print(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
+                log(f"{ORANGE}[DEBUG] Could not set directory permissions: {perm_error}{RESET}")
         
     except PermissionError as e:
-        print(f"{RED}Permission error creating directory {target_path}: {e}{RESET}")
-        print(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
+        log(f"{RED}Permission error creating directory {target_path}: {e}{RESET}")
+        log(f"{RED}Parent directory permissions: {oct(parent_dir.stat().st_mode)[-3:]}{RESET}")
         return False
     except Exception as e:
-        print(f"{RED}Error creating directory {target_path}: {e}{RESET}")
+        log(f"{RED}Error creating directory {target_path}: {e}{RESET}")
         return False
     
     try:
@@ -739,15 +760,15 @@ def create_placeholder_movie(movie, debug=False, umtk_root_movies=None, is_trend
         try:
             os.chmod(dest_file, 0o664)
             if debug:
-                print(f"{BLUE}[DEBUG] Set permissions 664 on {dest_file}{RESET}")
+                log(f"{BLUE}[DEBUG] Set permissions 664 on {dest_file}{RESET}")
         except Exception as perm_error:
             if debug:
-                print(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
+                log(f"{ORANGE}[DEBUG] Could not set file permissions: {perm_error}{RESET}")
         
         size_mb = dest_file.stat().st_size / (1024 * 1024)
-        print(f"{GREEN}Created placeholder for {movie['title']}: {dest_file.name} ({size_mb:.1f} MB){RESET}")
+        log(f"{GREEN}Created placeholder for {movie['title']}: {dest_file.name} ({size_mb:.1f} MB){RESET}")
         return True
         
     except Exception as e:
-        print(f"{RED}Error creating placeholder for {movie['title']}: {e}{RESET}")
+        log(f"{RED}Error creating placeholder for {movie['title']}: {e}{RESET}")
         return False
\ No newline at end of file
@@ -5,10 +5,14 @@ Plex metadata integration for UMTK
 import re
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
 from .utils import sanitize_sort_title, request_with_retry
 
+# Plex items whose metadata is checked/updated at the same time
+PLEX_UPDATE_WORKERS = 8
+
 
 def trigger_plex_library_scan(plex_url, plex_token, library_names_csv, expected_type, debug=False):
     """Trigger a Plex scan for each named library of the given type.
@@ -317,6 +321,133 @@ def reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debu
         return False
 
 
+def _run_plex_item_updates(all_plex_items, update_item, config, debug=False):
+    """Run update_item over every Plex item and sum the counters it returns.
+
+    The work is one or two small HTTP calls per item, so up to
+    plex_concurrency items (default PLEX_UPDATE_WORKERS) are handled at once.
+    Debug runs stay sequential so each item's debug lines remain together.
+    """
+    max_workers = 1 if debug else max(1, int(config.get('plex_concurrency', PLEX_UPDATE_WORKERS)))
+    totals = [0, 0, 0]
+    with ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(all_plex_items)))) as executor:
+        for counts in executor.map(update_item, all_plex_items):
+            for index, count in enumerate(counts):
+                totals[index] += count
+    return totals
+
+
+def _update_plex_tv_item(plex_item, plex_url, plex_token, valid_rank_tvdb_ids, valid_date_tvdb_ids,
+                         shows_with_content, edit_episode_titles, debug=False):
+    """Bring one Plex show's sort title and S00E00 title in line with UMTK's content.
+
+    Returns (sort titles updated, sort titles reset, episode titles updated).
+    """
+    updated_sort_titles = 0
+    updated_episode_titles = 0
+    reset_sort_titles = 0
+    
+    tvdb_id = plex_item.get('tvdbId')
+    rating_key = plex_item.get('ratingKey')
+    current_sort_title = plex_item.get('titleSort', '')
+    original_title = plex_item.get('title', '')
+    
+    has_modified_sort = False
+    if current_sort_title and current_sort_title.startswith('!'):
+        if len(current_sort_title) > 9 and current_sort_title[1:9].isdigit():
+            has_modified_sort = True
+        elif len(current_sort_title) > 3 and current_sort_title[1:3].isdigit():
+            has_modified_sort = True
+    
+    if not tvdb_id:
+        if has_modified_sort:
+            if current_sort_title.rstrip().endswith('(TSSK)'):
+                if debug:
+                    print(f"{BLUE}[DEBUG] Skipping sort title reset for '{original_title}' - managed by TSSK{RESET}")
+            else:
+                if debug:
+                    print(f"{BLUE}[DEBUG] Item '{original_title}' has modified sort title but no TVDB ID - resetting{RESET}")
+                if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
+                    reset_sort_titles += 1
+                    print(f"{GREEN}Reset sort title for {original_title} (no TVDB ID){RESET}")
+        return updated_sort_titles, reset_sort_titles, updated_episode_titles
+    
+    tvdb_id_str = str(tvdb_id)
+    
+    should_have_rank = tvdb_id_str in valid_rank_tvdb_ids
+    should_have_date = tvdb_id_str in valid_date_tvdb_ids
+    
+    if debug and (should_have_rank or should_have_date or has_modified_sort):
+        print(f"{BLUE}[DEBUG] Processing '{original_title}' (TVDB: {tvdb_id_str}){RESET}")
+        print(f"{BLUE}[DEBUG]   current_sort_title: '{current_sort_title}'{RESET}")
+        print(f"{BLUE}[DEBUG]   has_modified_sort: {has_modified_sort}{RESET}")
+        print(f"{BLUE}[DEBUG]   should_have_rank: {should_have_rank}{RESET}")
+        print(f"{BLUE}[DEBUG]   should_have_date: {should_have_date}{RESET}")
+    
+    if should_have_rank:
+        rank = valid_rank_tvdb_ids[tvdb_id_str]
+        rank_str = f"{int(rank):02d}"
+        sanitized_title = sanitize_sort_title(original_title)
+        new_sort_title = f"!{rank_str} {sanitized_title}"
+        
+        if current_sort_title != new_sort_title:
+            if debug:
+                print(f"{BLUE}[DEBUG] Will update sort title from '{current_sort_title}' to '{new_sort_title}'{RESET}")
+            if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
+                updated_sort_titles += 1
+                print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
+    
+    elif should_have_date:
+        show_data = shows_with_content.get(tvdb_id_str)
+        if show_data and show_data.get('airDate'):
+            date_str = show_data['airDate'].replace('-', '')
+            sanitized_title = sanitize_sort_title(original_title)
+            new_sort_title = f"!{date_str} {sanitized_title}"
+            
+            if current_sort_title != new_sort_title:
+                if debug:
+                    print(f"{BLUE}[DEBUG] Will update sort title from '{current_sort_title}' to '{new_sort_title}'{RESET}")
+                if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
+                    updated_sort_titles += 1
+                    print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
+    
+    elif has_modified_sort:
+        if current_sort_title.rstrip().endswith('(TSSK)'):
+            if debug:
+                print(f"{BLUE}[DEBUG] Skipping sort title reset for '{original_title}' - managed by TSSK{RESET}")
+            return updated_sort_titles, reset_sort_titles, updated_episode_titles
+
+        if debug:
+            print(f"{BLUE}[DEBUG] Will reset sort title for '{original_title}'{RESET}")
+        if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
+            reset_sort_titles += 1
+            print(f"{GREEN}Reset sort title for {original_title}{RESET}")
+    
+    if edit_episode_titles and tvdb_id_str in shows_with_content:
+        show_data = shows_with_content[tvdb_id_str]
+        used_trailer = show_data.get('used_trailer', False)
+        episode_title = "Trailer" if used_trailer else "Coming Soon"
+        
+        if debug:
+            print(f"{BLUE}[DEBUG] Checking S00E00 for '{original_title}' (used_trailer: {used_trailer}){RESET}")
+        
+        episode = get_plex_show_episodes(plex_url, plex_token, rating_key, 0, 0, debug)
+        if episode:
+            current_ep_title = episode.get('title', '')
+            if current_ep_title != episode_title:
+                if debug:
+                    print(f"{BLUE}[DEBUG] Will update episode title from '{current_ep_title}' to '{episode_title}'{RESET}")
+                if update_plex_episode_title(plex_url, plex_token, episode['ratingKey'], episode_title, debug):
+                    updated_episode_titles += 1
+                    print(f"{GREEN}Updated S00E00 title for {original_title}: {episode_title}{RESET}")
+            elif debug:
+                print(f"{BLUE}[DEBUG] Episode title already correct: '{current_ep_title}'{RESET}")
+        elif debug:
+            print(f"{ORANGE}[DEBUG] S00E00 not found for '{original_title}'{RESET}")
+    
+    return updated_sort_titles, reset_sort_titles, updated_episode_titles
+
+
 def update_plex_tv_metadata(plex_url, plex_token, tv_libraries, all_shows_with_content,
                             mdblist_tv_items, config, debug=False, retry_count=0, max_retries=4):
     """Update TV show metadata directly in Plex"""
@@ -429,53 +560,83 @@ def update_plex_tv_metadata(plex_url, plex_token, tv_libraries, all_shows_with_c
         for item in missing_items:
             print(f"  - {item['title']} (TVDB: {item['tvdb_id']})")
     
+    updated_sort_titles, reset_sort_titles, updated_episode_titles = _run_plex_item_updates(
+        all_plex_items,
+        lambda plex_item: _update_plex_tv_item(
+            plex_item, plex_url, plex_token, valid_rank_tvdb_ids, valid_date_tvdb_ids,
+            shows_with_content, edit_episode_titles, debug
+        ),
+        config, debug
+    )
+    
+    print(f"\n{GREEN}TV Plex metadata update summary:{RESET}")
+    print(f"Sort titles updated: {updated_sort_titles}")
+    print(f"Sort titles reset: {reset_sort_titles}")
+    if edit_episode_titles:
+        print(f"Episode titles updated: {updated_episode_titles}")
+
+
+def _update_plex_movie_item(plex_item, plex_url, plex_token, valid_rank_tmdb_ids, valid_date_tmdb_ids,
+                            movies_with_content, debug=False):
+    """Bring one Plex movie's sort title in line with UMTK's content.
+
+    Returns (sort titles updated, sort titles reset, 0) to match the TV helper.
+    """
     updated_sort_titles = 0
-    updated_episode_titles = 0
     reset_sort_titles = 0
     
-    for plex_item in all_plex_items:
-        tvdb_id = plex_item.get('tvdbId')
-        rating_key = plex_item.get('ratingKey')
-        current_sort_title = plex_item.get('titleSort', '')
-        original_title = plex_item.get('title', '')
-        
-        has_modified_sort = False
-        if current_sort_title and current_sort_title.startswith('!'):
-            if len(current_sort_title) > 9 and current_sort_title[1:9].isdigit():
-                has_modified_sort = True
-            elif len(current_sort_title) > 3 and current_sort_title[1:3].isdigit():
-                has_modified_sort = True
-        
-        if not tvdb_id:
-            if has_modified_sort:
-                if current_sort_title.rstrip().endswith('(TSSK)'):
-                    if debug:
-                        print(f"{BLUE}[DEBUG] Skipping sort title reset for '{original_title}' - managed by TSSK{RESET}")
-                else:
-                    if debug:
-                        print(f"{BLUE}[DEBUG] Item '{original_title}' has modified sort title but no TVDB ID - resetting{RESET}")
-                    if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
-                        reset_sort_titles += 1
-                        print(f"{GREEN}Reset sort title for {original_title} (no TVDB ID){RESET}")
-            continue
-        
-        tvdb_id_str = str(tvdb_id)
-        
-        should_have_rank = tvdb_id_str in valid_rank_tvdb_ids
-        should_have_date = tvdb_id_str in valid_date_tvdb_ids
-        
-        if debug and (should_have_rank or should_have_date or has_modified_sort):
-            print(f"{BLUE}[DEBUG] Processing '{original_title}' (TVDB: {tvdb_id_str}){RESET}")
-            print(f"{BLUE}[DEBUG]   current_sort_title: '{current_sort_title}'{RESET}")
-            print(f"{BLUE}[DEBUG]   has_modified_sort: {has_modified_sort}{RESET}")
-            print(f"{BLUE}[DEBUG]   should_have_rank: {should_have_rank}{RESET}")
-            print(f"{BLUE}[DEBUG]   should_have_date: {should_have_date}{RESET}")
+    tmdb_id = plex_item.get('tmdbId')
+    rating_key = plex_item.get('ratingKey')
+    current_sort_title = plex_item.get('titleSort', '')
+    original_title = plex_item.get('title', '')
+    
+    has_modified_sort = False
+    if current_sort_title and current_sort_title.startswith('!'):
+        if len(current_sort_title) > 9 and current_sort_title[1:9].isdigit():
+            has_modified_sort = True
+        elif len(current_sort_title) > 3 and current_sort_title[1:3].isdigit():
+            has_modified_sort = True
+    
+    if not tmdb_id:
+        if has_modified_sort:
+            if debug:
+                print(f"{BLUE}[DEBUG] Item '{original_title}' has modified sort title but no TMDB ID - resetting{RESET}")
+            if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
+                reset_sort_titles += 1
+                print(f"{GREEN}Reset sort title for {original_title} (no TMDB ID){RESET}")
+        return updated_sort_titles, reset_sort_titles, 0
+    
+    tmdb_id_str = str(tmdb_id)
+    
+    should_have_rank = tmdb_id_str in valid_rank_tmdb_ids
+    should_have_date = tmdb_id_str in valid_date_tmdb_ids
+    
+    if debug and (should_have_rank or should_have_date or has_modified_sort):
+        print(f"{BLUE}[DEBUG] Processing '{original_title}' (TMDB: {tmdb_id_str}){RESET}")
+        print(f"{BLUE}[DEBUG]   current_sort_title: '{current_sort_title}'{RESET}")
+        print(f"{BLUE}[DEBUG]   has_modified_sort: {has_modified_sort}{RESET}")
+        print(f"{BLUE}[DEBUG]   should_have_rank: {should_have_rank}{RESET}")
+        print(f"{BLUE}[DEBUG]   should_have_date: {should_have_date}{RESET}")
+    
+    if should_have_rank:
+        rank = valid_rank_tmdb_ids[tmdb_id_str]
+        rank_str = f"{int(rank):02d}"
+        sanitized_title = sanitize_sort_title(original_title)
+        new_sort_title = f"!{rank_str} {sanitized_title}"
         
-        if should_have_rank:
-            rank = valid_rank_tvdb_ids[tvdb_id_str]
-            rank_str = f"{int(rank):02d}"
+        if current_sort_title != new_sort_title:
+            if debug:
+                print(f"{BLUE}[DEBUG] Will update sort title from '{current_sort_title}' to '{new_sort_title}'{RESET}")
+            if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
+                updated_sort_titles += 1
+                print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
+    
+    elif should_have_date:
+        movie_data = movies_with_content.get(tmdb_id_str)
+        if movie_data and movie_data.get('releaseDate'):
+            date_str = movie_data['releaseDate'].replace('-', '')
             sanitized_title = sanitize_sort_title(original_title)
-            new_sort_title = f"!{rank_str} {sanitized_title}"
+            new_sort_title = f"!{date_str} {sanitized_title}"
             
             if current_sort_title != new_sort_title:
                 if debug:
@@ -483,60 +644,15 @@ def update_plex_tv_metadata(plex_url, plex_token, tv_libraries, all_shows_with_c
                 if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
                     updated_sort_titles += 1
                     print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
-        
-        elif should_have_date:
-            show_data = shows_with_content.get(tvdb_id_str)
-            if show_data and show_data.get('airDate'):
-                date_str = show_data['airDate'].replace('-', '')
-                sanitized_title = sanitize_sort_title(original_title)
-                new_sort_title = f"!{date_str} {sanitized_title}"
-                
-                if current_sort_title != new_sort_title:
-                    if debug:
-                        print(f"{BLUE}[DEBUG] Will update sort title from '{current_sort_title}' to '{new_sort_title}'{RESET}")
-                    if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
-                        updated_sort_titles += 1
-                        print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
-        
-        elif has_modified_sort:
-            if current_sort_title.rstrip().endswith('(TSSK)'):
-                if debug:
-                    print(f"{BLUE}[DEBUG] Skipping sort title reset for '{original_title}' - managed by TSSK{RESET}")
-                continue
-
-            if debug:
-                print(f"{BLUE}[DEBUG] Will reset sort title for '{original_title}'{RESET}")
-            if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
-                reset_sort_titles += 1
-                print(f"{GREEN}Reset sort title for {original_title}{RESET}")
-        
-        if edit_episode_titles and tvdb_id_str in shows_with_content:
-            show_data = shows_with_content[tvdb_id_str]
-            used_trailer = show_data.get('used_trailer', False)
-            episode_title = "Trailer" if used_trailer else "Coming Soon"
-            
-            if debug:
-                print(f"{BLUE}[DEBUG] Checking S00E00 for '{original_title}' (used_trailer: {used_trailer}){RESET}")
-            
-            episode = get_plex_show_episodes(plex_url, plex_token, rating_key, 0, 0, debug)
-            if episode:
-                current_ep_title = episode.get('title', '')
-                if current_ep_title != episode_title:
-                    if debug:
-                        print(f"{BLUE}[DEBUG] Will update episode title from '{current_ep_title}' to '{episode_title}'{RESET}")
-                    if update_plex_episode_title(plex_url, plex_token, episode['ratingKey'], episode_title, debug):
-                        updated_episode_titles += 1
-                        print(f"{GREEN}Updated S00E00 title for {original_title}: {episode_title}{RESET}")
-                elif debug:
-                    print(f"{BLUE}[DEBUG] Episode title already correct: '{current_ep_title}'{RESET}")
-            elif debug:
-                print(f"{ORANGE}[DEBUG] S00E00 not found for '{original_title}'{RESET}")
     
-    print(f"\n{GREEN}TV Plex metadata update summary:{RESET}")
-    print(f"Sort titles updated: {updated_sort_titles}")
-    print(f"Sort titles reset: {reset_sort_titles}")
-    if edit_episode_titles:
-        print(f"Episode titles updated: {updated_episode_titles}")
+    elif has_modified_sort:
+        if debug:
+            print(f"{BLUE}[DEBUG] Will reset sort title for '{original_title}'{RESET}")
+        if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
+            reset_sort_titles += 1
+            print(f"{GREEN}Reset sort title for {original_title}{RESET}")
+    
+    return updated_sort_titles, reset_sort_titles, 0
 
 
 def update_plex_movie_metadata(plex_url, plex_token, movie_libraries, all_movies_with_content,
@@ -650,76 +766,14 @@ def update_plex_movie_metadata(plex_url, plex_token, movie_libraries, all_movies
         for item in missing_items:
             print(f"  - {item['title']} (TMDB: {item['tmdb_id']})")
     
-    updated_sort_titles = 0
-    reset_sort_titles = 0
-    
-    for plex_item in all_plex_items:
-        tmdb_id = plex_item.get('tmdbId')
-        rating_key = plex_item.get('ratingKey')
-        current_sort_title = plex_item.get('titleSort', '')
-        original_title = plex_item.get('title', '')
-        
-        has_modified_sort = False
-        if current_sort_title and current_sort_title.startswith('!'):
-            if len(current_sort_title) > 9 and current_sort_title[1:9].isdigit():
-                has_modified_sort = True
-            elif len(current_sort_title) > 3 and current_sort_title[1:3].isdigit():
-                has_modified_sort = True
-        
-        if not tmdb_id:
-            if has_modified_sort:
-                if debug:
-                    print(f"{BLUE}[DEBUG] Item '{original_title}' has modified sort title but no TMDB ID - resetting{RESET}")
-                if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
-                    reset_sort_titles += 1
-                    print(f"{GREEN}Reset sort title for {original_title} (no TMDB ID){RESET}")
-            continue
-        
-        tmdb_id_str = str(tmdb_id)
-        
-        should_have_rank = tmdb_id_str in valid_rank_tmdb_ids
-        should_have_date = tmdb_id_str in valid_date_tmdb_ids
-        
-        if debug and (should_have_rank or should_have_date or has_modified_sort):
-            print(f"{BLUE}[DEBUG] Processing '{original_title}' (TMDB: {tmdb_id_str}){RESET}")
-            print(f"{BLUE}[DEBUG]   current_sort_title: '{current_sort_title}'{RESET}")
-            print(f"{BLUE}[DEBUG]   has_modified_sort: {has_modified_sort}{RESET}")
-            print(f"{BLUE}[DEBUG]   should_have_rank: {should_have_rank}{RESET}")
-            print(f"{BLUE}[DEBUG]   should_have_date: {should_have_date}{RESET}")
-        
-        if should_have_rank:
-            rank = valid_rank_tmdb_ids[tmdb_id_str]
-            rank_str = f"{int(rank):02d}"
-            sanitized_title = sanitize_sort_title(original_title)
-            new_sort_title = f"!{rank_str} {sanitized_title}"
-            
-            if current_sort_title != new_sort_title:
-                if debug:
-                    print(f"{BLUE}[DEBUG] Will update sort title from '{current_sort_title}' to '{new_sort_title}'{RESET}")
-                if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
-                    updated_sort_titles += 1
-                    print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
-        
-        elif should_have_date:
-            movie_data = movies_with_content.get(tmdb_id_str)
-            if movie_data and movie_data.get('releaseDate'):
-                date_str = movie_data['releaseDate'].replace('-', '')
-                sanitized_title = sanitize_sort_title(original_title)
-                new_sort_title = f"!{date_str} {sanitized_title}"
-                
-                if current_sort_title != new_sort_title:
-                    if debug:
-                        print(f"{BLUE}[DEBUG] Will update sort title from '{current_sort_title}' to '{new_sort_title}'{RESET}")
-                    if update_plex_sort_title(plex_url, plex_token, rating_key, new_sort_title, debug):
-                        updated_sort_titles += 1
-                        print(f"{GREEN}Updated sort title for {original_title}: {new_sort_title}{RESET}")
-        
-        elif has_modified_sort:
-            if debug:
-                print(f"{BLUE}[DEBUG] Will reset sort title for '{original_title}'{RESET}")
-            if reset_plex_sort_title(plex_url, plex_token, rating_key, original_title, debug):
-                reset_sort_titles += 1
-                print(f"{GREEN}Reset sort title for {original_title}{RESET}")
+    updated_sort_titles, reset_sort_titles, _ = _run_plex_item_updates(
+        all_plex_items,
+        lambda plex_item: _update_plex_movie_item(
+            plex_item, plex_url, plex_token, valid_rank_tmdb_ids, valid_date_tmdb_ids,
+            movies_with_content, debug
+        ),
+        config, debug
+    )
     
     print(f"\n{GREEN}Movie Plex metadata update summary:{RESET}")
     print(f"Sort titles updated: {updated_sort_titles}")
@@ -2,10 +2,26 @@
 Radarr API integration for UMTK
 """
 
+import time
 import requests
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
-from .utils import request_with_retry
+from .utils import request_with_retry, get_http_session
+
+# /movie responses are reused for this many seconds; the scheduler runs hours
+# apart, so only repeat fetches within one run are served from the cache
+MOVIES_CACHE_TTL = 30
+
+# After a failed /movie request the last response is only used if it is at
+# most this many seconds old; anything older would let cleanup act on a
+# library state from an earlier run
+MOVIES_STALE_MAX_AGE = 300
+
+# (radarr_url, api_key) -> (fetched_at, movies_data)
+_MOVIES_CACHE = {}
+
+# (configured url, api_key) -> API URL that last answered the health probe
+_RESOLVED_URLS = {}
 
 
 def process_radarr_url(base_url, api_key, timeout=90):
@@ -28,16 +44,20 @@ def process_radarr_url(base_url, api_key, timeout=90):
     # /radarr2), then fall back to host-stripped guesses. De-duplicate so a bare
     # host doesn't get probed twice.
     candidates = []
-    for url in (f"{base_url}/api/v3", f"{host}/api/v3", f"{host}/radarr/api/v3"):
-        if url not in candidates:
+    resolved = _RESOLVED_URLS.get((base_url, api_key))
+    # Probe the URL that worked last run first; the health check itself is
+    # kept so an unreachable Radarr is still reported before any other call
+    for url in (resolved, f"{base_url}/api/v3", f"{host}/api/v3", f"{host}/radarr/api/v3"):
+        if url and url not in candidates:
             candidates.append(url)
 
     for test_url in candidates:
         try:
             headers = {"X-Api-Key": api_key}
-            response = requests.get(f"{test_url}/health", headers=headers, timeout=timeout)
+            response = get_http_session().get(f"{test_url}/health", headers=headers, timeout=timeout)
             if response.status_code == 200:
                 print(f"Successfully connected to Radarr at: {test_url}")
+                _RESOLVED_URLS[(base_url, api_key)] = test_url
                 return test_url
         except requests.exceptions.RequestException as e:
             print(f"{ORANGE}Testing URL {test_url} - Failed: {str(e)}{RESET}")
@@ -49,7 +69,16 @@ def process_radarr_url(base_url, api_key, timeout=90):
 
 
 def get_radarr_movies(radarr_url, api_key, timeout=90):
-    """Get all movies from Radarr"""
+    """Get all movies from Radarr, reusing a response younger than MOVIES_CACHE_TTL.
+
+    Returns a new list each call; the movie dicts in it are shared with the
+    cache and must be treated as read-only.
+    """
+    cache_key = (radarr_url, api_key)
+    cached = _MOVIES_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < MOVIES_CACHE_TTL:
+        return list(cached[1])
+
     try:
         print(f"{BLUE}Fetching movies from Radarr...{RESET}", flush=True)
         url = f"{radarr_url}/movie"
@@ -58,9 +87,15 @@ def get_radarr_movies(radarr_url, api_key, timeout=90):
         response.raise_for_status()
         movies_data = response.json()
         print(f"{GREEN}Done ✓ ({len(movies_data)} movies){RESET}")
-        return movies_data
+        _MOVIES_CACHE[cache_key] = (time.monotonic(), movies_data)
+        return list(movies_data)
     except requests.exceptions.RequestException as e:
         print(f" {RED}✗{RESET}")
         print(f"{RED}Error connecting to Radarr: {str(e)}{RESET}")
+        if cached and time.monotonic() - cached[0] <= MOVIES_STALE_MAX_AGE:
+            # Fall back to the last successful /movie response
+            age = int(time.monotonic() - cached[0])
+            print(f"{ORANGE}Using cached movie list from {age}s ago ({len(cached[1])} movies){RESET}")
+            return list(cached[1])
         import sys
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
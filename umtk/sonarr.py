@@ -2,11 +2,31 @@
 Sonarr API integration for UMTK
 """
 
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET
-from .utils import convert_utc_to_local, request_with_retry
+from .utils import convert_utc_to_local, request_with_retry, get_http_session
+
+# Upper bound on concurrent /episode requests to a Sonarr instance
+EPISODE_FETCH_WORKERS = 10
+
+# /series responses are reused for this many seconds; the scheduler runs hours
+# apart, so only repeat fetches within one run are served from the cache
+SERIES_CACHE_TTL = 30
+
+# After a failed /series request the last response is only used if it is at
+# most this many seconds old; anything older would let cleanup act on a
+# library state from an earlier run
+SERIES_STALE_MAX_AGE = 300
+
+# (sonarr_url, api_key) -> (fetched_at, series_data)
+_SERIES_CACHE = {}
+
+# (configured url, api_key) -> API URL that last answered the health probe
+_RESOLVED_URLS = {}
 
 
 def process_sonarr_url(base_url, api_key, timeout=90):
@@ -29,17 +49,21 @@ def process_sonarr_url(base_url, api_key, timeout=90):
     # /sonarr2), then fall back to host-stripped guesses. De-duplicate so a bare
     # host doesn't get probed twice.
     candidates = []
-    for url in (f"{base_url}/api/v3", f"{host}/api/v3", f"{host}/sonarr/api/v3"):
-        if url not in candidates:
+    resolved = _RESOLVED_URLS.get((base_url, api_key))
+    # Probe the URL that worked last run first; the health check itself is
+    # kept so an unreachable Sonarr is still reported before any other call
+    for url in (resolved, f"{base_url}/api/v3", f"{host}/api/v3", f"{host}/sonarr/api/v3"):
+        if url and url not in candidates:
             candidates.append(url)
 
     last_error = None
     for test_url in candidates:
         try:
             headers = {"X-Api-Key": api_key}
-            response = requests.get(f"{test_url}/health", headers=headers, timeout=timeout)
+            response = get_http_session().get(f"{test_url}/health", headers=headers, timeout=timeout)
             if response.status_code == 200:
                 print(f"{GREEN}Successfully connected to Sonarr at: {test_url}{RESET}")
+                _RESOLVED_URLS[(base_url, api_key)] = test_url
                 return test_url
             else:
                 print(f"{ORANGE}Testing URL {test_url} - Failed: HTTP {response.status_code}{RESET}")
@@ -58,7 +82,16 @@ def process_sonarr_url(base_url, api_key, timeout=90):
 
 
 def get_sonarr_series(sonarr_url, api_key, timeout=90):
-    """Get all series from Sonarr"""
+    """Get all series from Sonarr, reusing a response younger than SERIES_CACHE_TTL.
+
+    Returns a new list each call; the series dicts in it are shared with the
+    cache and must be treated as read-only.
+    """
+    cache_key = (sonarr_url, api_key)
+    cached = _SERIES_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < SERIES_CACHE_TTL:
+        return list(cached[1])
+
     try:
         print(f"{BLUE}Fetching series from Sonarr...{RESET}", flush=True)
         url = f"{sonarr_url}/series"
@@ -67,25 +100,46 @@ def get_sonarr_series(sonarr_url, api_key, timeout=90):
         response.raise_for_status()
         series_data = response.json()
         print(f"{GREEN}Done ✓ ({len(series_data)} series){RESET}")
-        return series_data
+        _SERIES_CACHE[cache_key] = (time.monotonic(), series_data)
+        return list(series_data)
     except requests.exceptions.Timeout as e:
         print(f" {RED}✗{RESET}")
         print(f"{RED}Timeout connecting to Sonarr (exceeded {timeout}s): {str(e)}{RESET}")
+        if _is_recent(cached):
+            return _stale_series(cached)
         raise
     except requests.exceptions.ConnectionError as e:
         print(f" {RED}✗{RESET}")
         print(f"{RED}Connection error to Sonarr: {str(e)}{RESET}")
+        if _is_recent(cached):
+            return _stale_series(cached)
         raise
     except requests.exceptions.RequestException as e:
         print(f" {RED}✗{RESET}")
         print(f"{RED}Error connecting to Sonarr: {str(e)}{RESET}")
+        if _is_recent(cached):
+            return _stale_series(cached)
         raise
 
 
-def get_sonarr_episodes(sonarr_url, api_key, series_id, timeout=90):
-    """Get episodes for a specific series"""
+def _is_recent(cached):
+    """True if a cached /series response may stand in for a failed request"""
+    return bool(cached) and time.monotonic() - cached[0] <= SERIES_STALE_MAX_AGE
+
+
+def _stale_series(cached):
+    """Fall back to the last successful /series response"""
+    age = int(time.monotonic() - cached[0])
+    print(f"{ORANGE}Using cached series list from {age}s ago ({len(cached[1])} series){RESET}")
+    return list(cached[1])
+
+
+def get_sonarr_episodes(sonarr_url, api_key, series_id, timeout=90, season_number=None):
+    """Get episodes for a specific series, optionally limited to one season"""
     try:
         url = f"{sonarr_url}/episode?seriesId={series_id}"
+        if season_number is not None:
+            url += f"&seasonNumber={season_number}"
         headers = {"X-Api-Key": api_key}
         response = request_with_retry('GET', url, headers=headers, timeout=timeout)
         response.raise_for_status()
@@ -98,4 +152,42 @@ def get_sonarr_episodes(sonarr_url, api_key, series_id, timeout=90):
         raise
     except requests.exceptions.RequestException as e:
         print(f"{RED}Error fetching episodes from Sonarr: {str(e)}{RESET}")
-        raise
\ No newline at end of file
+        raise
+
+
+def get_sonarr_episodes_bulk(jobs, max_workers=EPISODE_FETCH_WORKERS, season_number=None):
+    """Fetch episodes for many series concurrently.
+
+    jobs: iterable of (sonarr_url, api_key, series_id) tuples.
+    season_number: if set, only that season is requested for every series.
+    Returns a dict mapping each tuple to its episode list. Every request is
+    allowed to finish; the first failure is then re-raised.
+    """
+    jobs = list(dict.fromkeys(jobs))
+    if not jobs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {
+            job: executor.submit(get_sonarr_episodes, *job, season_number=season_number)
+            for job in jobs
+        }
+
+    return {job: future.result() for job, future in futures.items()}
+
+
+def iter_sonarr_episodes(jobs, max_workers=EPISODE_FETCH_WORKERS, season_number=None):
+    """Yield episode lists for (sonarr_url, api_key, series_id) jobs in order.
+
+    Requests run on a bounded thread pool, so the caller can process one
+    series while the following ones are still being fetched. The first
+    failed request is raised when its result is reached.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        yield from executor.map(
+            lambda job: get_sonarr_episodes(*job, season_number=season_number), jobs
+        )
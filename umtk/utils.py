@@ -7,20 +7,65 @@ import re
 import time
 import requests
 import subprocess
+import threading
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
 
 from .constants import GREEN, ORANGE, RED, BLUE, RESET, VERSION
 
+# Connections kept open per host; covers the parallel Sonarr episode fetches
+HTTP_POOL_SIZE = 16
+
+# Shared by all Sonarr/Radarr/MDBList/Plex calls so repeated requests to the
+# same host reuse a keep-alive connection instead of reconnecting every time
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+
+
+# Per-thread buffer that log() appends to inside capture_log()
+_LOG_CAPTURE = threading.local()
+
+
+def log(*args, sep=' ', end='\n'):
+    """print() for code that can run on content worker threads.
+
+    Inside capture_log() the text is collected for the calling thread so the
+    worker can print an item's lines together; otherwise it is printed.
+    """
+    buffer = getattr(_LOG_CAPTURE, 'buffer', None)
+    if buffer is None:
+        print(*args, sep=sep, end=end)
+    else:
+        buffer.append(sep.join(str(arg) for arg in args) + end)
+
+
+@contextmanager
+def capture_log():
+    """Collect the calling thread's log() output; yields the list of chunks"""
+    previous = getattr(_LOG_CAPTURE, 'buffer', None)
+    buffer = _LOG_CAPTURE.buffer = []
+    try:
+        yield buffer
+    finally:
+        _LOG_CAPTURE.buffer = previous
+
+
+def get_http_session():
+    """Return the shared requests.Session used for API calls"""
+    return _SESSION
+
 
 def request_with_retry(method, url, *, retries=2, backoff=2.0, **kwargs):
-    """requests.request() with retry on transient ConnectionError/Timeout.
+    """Shared-session request() with retry on transient ConnectionError/Timeout.
 
     HTTP 4xx/5xx responses are NOT retried — only network-level failures.
     Default: 2 retries (3 total attempts) with linear backoff (2s, 4s).
     """
     for attempt in range(retries + 1):
         try:
-            return requests.request(method, url, **kwargs)
+            return _SESSION.request(method, url, **kwargs)
         except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
             if attempt < retries:
                 wait = backoff * (attempt + 1)
@@ -152,6 +197,16 @@ def sanitize_sort_title(title):
     return sanitized.strip()
 
 
+# Anything other than letters, digits, '_', ' ' and '-' (\w follows str.isalnum,
+# so non-ASCII titles keep their letters)
+_CLEAN_TITLE_RE = re.compile(r'[^\w \-]+')
+
+
+def clean_title_for_filename(title):
+    """Strip a title down to the characters used in S00E00 file names"""
+    return _CLEAN_TITLE_RE.sub('', title).rstrip()
+
+
 def check_yt_dlp_installed():
     """Check if yt-dlp is installed and accessible"""
     try:
@@ -192,6 +247,16 @@ def check_video_file(video_folder):
     return True
 
 
+def split_csv_list(value):
+    """Turn a comma separated config string into a list of stripped, non-empty items.
+
+    Lists (and other non-string values) are returned unchanged.
+    """
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return value
+
+
 def get_tag_ids_from_names(api_url, api_key, tag_names, timeout=90, debug=False):
     """Convert tag names to tag IDs"""
     if not tag_names:
@@ -200,7 +265,7 @@ def get_tag_ids_from_names(api_url, api_key, tag_names, timeout=90, debug=False)
     try:
         url = f"{api_url}/tag"
         headers = {"X-Api-Key": api_key}
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _SESSION.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         
         all_tags = response.json()
@@ -86,6 +86,7 @@ UMTK_OPTIONS = [
     {"key": "movies", "type": "select", "default": 2, "label": "Movie Method", "description": "Choose how to handle upcoming movies", "options": [{"value": 0, "label": "Disabled"}, {"value": 1, "label": "Download trailers"}, {"value": 2, "label": "Placeholder"}], "section": "General"},
     {"key": "tv", "type": "select", "default": 2, "label": "TV Method", "description": "Choose how to handle upcoming TV shows", "options": [{"value": 0, "label": "Disabled"}, {"value": 1, "label": "Download trailers"}, {"value": 2, "label": "Placeholder"}], "section": "General"},
     {"key": "method_fallback", "type": "bool", "default": True, "label": "Method Fallback", "description": "Try placeholder if trailer download fails", "section": "General"},
+    {"key": "trailer_concurrency", "type": "int", "default": 4, "label": "Trailer Concurrency", "description": "Number of shows/movies whose trailers are searched/downloaded at the same time", "section": "General"},
     {"key": "preferred_language", "type": "select", "default": "original", "label": "Preferred Language", "description": "Preferred language for trailer downloads (appends language to YouTube search and boosts matching results)", "section": "General", "options": [
         {"value": "original", "label": "Original"},
         {"value": "english", "label": "English"},
@@ -118,6 +119,7 @@ UMTK_OPTIONS = [
     {"key": "add_rank_to_sort_title", "type": "bool", "default": True, "label": "Add Rank to Sort Title", "description": "Add trending rank to Plex sort titles", "section": "Plex Metadata"},
     {"key": "edit_S00E00_episode_title", "type": "bool", "default": True, "label": "Edit S00E00 Episode Title", "description": "Update special episode titles in Plex", "section": "Plex Metadata"},
     {"key": "metadata_retry_limit", "type": "int", "default": 4, "label": "Metadata Retry Limit", "description": "Number of API retry attempts for Plex metadata", "section": "Plex Metadata"},
+    {"key": "plex_concurrency", "type": "int", "default": 8, "label": "Plex Concurrency", "description": "Number of Plex items whose metadata is checked/updated at the same time", "section": "Plex Metadata"},
     # Trending
     {"key": "trending_movies", "type": "select", "default": 0, "label": "Trending Movies Method", "description": "Choose how to handle trending movies", "options": [{"value": 0, "label": "Disabled"}, {"value": 1, "label": "Download trailers"}, {"value": 2, "label": "Placeholder"}], "section": "Trending"},
     {"key": "trending_tv", "type": "select", "default": 0, "label": "Trending TV Method", "description": "Choose how to handle trending TV shows", "options": [{"value": 0, "label": "Disabled"}, {"value": 1, "label": "Download trailers"}, {"value": 2, "label": "Placeholder"}], "section": "Trending"},